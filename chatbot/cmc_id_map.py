@@ -0,0 +1,135 @@
+"""
+코인마켓캡 심볼/이름 → CMC ID 맵
+
+과거 시세(quotes/historical)는 CMC ID로만 조회할 수 있어, 이전에는 과거 시세를 물을 때마다 quotes/latest를 먼저
+호출해 ID를 얻었습니다 (왕복 두 번, 크레딧 두 배). /cryptocurrency/map의 활성 코인 목록으로 만든 맵을 MongoDB에
+저장해 두고 시작 시 불러와, ID를 네트워크 호출 없이 찾습니다. 맵은 하루에 한 번 새로 받으며, 여러 워커 중 먼저
+새로 받은 워커가 저장한 맵을 다른 워커는 다시 불러와 사용합니다.
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from .configuration import config
+from .mongodb_client import mongodb_client
+from .price_http import price_client
+
+logger = logging.getLogger(__name__)
+
+MAP_PROVIDER = "coinmarketcap"
+MAP_LIMIT = int(os.getenv("CMC_ID_MAP_LIMIT", "5000"))  # 시가총액 순위 상위 코인 (요청 한 번의 최대 개수)
+REFRESH_INTERVAL_SECONDS = float(os.getenv("CMC_ID_MAP_REFRESH_INTERVAL", "86400"))
+CHECK_INTERVAL_SECONDS = float(os.getenv("CMC_ID_MAP_CHECK_INTERVAL", "3600"))
+
+
+class CoinMarketCapIdMap:
+    """심볼/이름/slug로 CMC ID를 찾는 맵 (같은 심볼이 여럿이면 순위가 가장 높은 코인)"""
+
+    def __init__(self):
+        self._by_symbol: Dict[str, Dict] = {}
+        self._by_name: Dict[str, Dict] = {}
+        self.updated_at: Optional[datetime] = None
+        self.refreshes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, entries: List[Dict], updated_at: Optional[datetime] = None):
+        """{id, symbol, name, slug, rank} 목록으로 맵 교체"""
+        by_symbol, by_name = {}, {}
+        for entry in sorted(entries, key=lambda item: item.get("rank") or float("inf")):
+            by_symbol.setdefault(entry["symbol"].upper(), entry)
+            for name in (entry.get("name"), entry.get("slug")):
+                if name:
+                    by_name.setdefault(name.lower(), entry)
+        self._by_symbol, self._by_name = by_symbol, by_name
+        self.updated_at = updated_at or datetime.utcnow()
+
+    def coin_id(self, symbol: str) -> Optional[int]:
+        """심볼의 CMC ID (맵에 없으면 None)"""
+        entry = self._by_symbol.get(symbol.upper())
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["id"]
+
+    def has_symbol(self, symbol: str) -> bool:
+        return symbol.upper() in self._by_symbol
+
+    def by_name(self, name: str) -> Optional[Dict]:
+        """영어 이름 또는 slug(예: "bitcoin", "shiba-inu")의 코인 항목"""
+        return self._by_name.get(name.lower().strip())
+
+    def is_stale(self) -> bool:
+        return self.updated_at is None or datetime.utcnow() - self.updated_at >= timedelta(seconds=REFRESH_INTERVAL_SECONDS)
+
+    async def fetch(self) -> List[Dict]:
+        """/cryptocurrency/map에서 활성 코인 목록 조회 (실패하면 빈 목록)"""
+        from .coinmarketcap import CoinMarketCapService
+        if not CoinMarketCapService.API_KEY:
+            return []
+        headers = {"X-CMC_PRO_API_KEY": CoinMarketCapService.API_KEY, "Accept": "application/json"}
+        params = {"listing_status": "active", "sort": "cmc_rank", "limit": MAP_LIMIT}
+        try:
+            async with price_client() as client:
+                response = await client.get(f"{config.COINMARKETCAP_API_URL}/cryptocurrency/map", headers=headers, params=params,
+                                            timeout=30.0)
+            if response.status_code != 200:
+                logger.warning(f"⚠️ 코인마켓캡 ID 맵 조회 실패: {response.status_code} - {response.text[:200]}")
+                return []
+            data = response.json().get("data") or []
+        except Exception as e:
+            logger.warning(f"⚠️ 코인마켓캡 ID 맵 조회 실패: {e}")
+            return []
+        return [{"id": coin["id"], "symbol": coin["symbol"], "name": coin.get("name"),
+                 "slug": coin.get("slug"), "rank": coin.get("rank")}
+                for coin in data if coin.get("id") and coin.get("symbol")]
+
+    async def load_stored(self) -> bool:
+        """MongoDB에 저장된 맵 불러오기"""
+        stored = await mongodb_client.get_coin_id_map(MAP_PROVIDER)
+        if not stored or not stored.get("entries"):
+            return False
+        self.load(stored["entries"], stored.get("updated_at"))
+        logger.info(f"코인마켓캡 ID 맵 불러옴: {len(self._by_symbol)}개 심볼 ({self.updated_at})")
+        return True
+
+    async def refresh(self) -> bool:
+        """API에서 새로 받아 맵을 교체하고 MongoDB에 저장"""
+        entries = await self.fetch()
+        if not entries:
+            return False
+        self.load(entries)
+        self.refreshes += 1
+        saved = await mongodb_client.save_coin_id_map(MAP_PROVIDER, entries)
+        logger.info(f"코인마켓캡 ID 맵 갱신: {len(self._by_symbol)}개 심볼{'' if saved else ' (저장 안 됨)'}")
+        return True
+
+    async def run_refresh_loop(self, interval: float = CHECK_INTERVAL_SECONDS):
+        """시작 시 저장된 맵을 불러오고, 이후 맵이 오래되면 새로 받는 백그라운드 작업"""
+        while True:
+            try:
+                # 다른 워커가 이미 새로 받아 저장했으면 그 맵을 사용
+                if self.is_stale():
+                    await self.load_stored()
+                if self.is_stale():
+                    await self.refresh()
+            except Exception as e:
+                logger.warning(f"코인마켓캡 ID 맵 갱신 실패: {e}")
+            await asyncio.sleep(interval)
+
+    def snapshot(self) -> dict:
+        """관리자 API용 상태"""
+        return {
+            "symbols": len(self._by_symbol),
+            "names": len(self._by_name),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "refreshes": self.refreshes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+cmc_id_map = CoinMarketCapIdMap()
@@ -4,10 +4,12 @@
 """
 import os
 import logging
-import httpx
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import datetime, timezone, timedelta
 from .configuration import config
+from .single_flight import SingleFlight
+from .price_cache import PriceCache
+from .price_http import price_client
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +21,11 @@ class CoinGeckoService:
     # API 키는 선택사항 (무료 플랜도 사용 가능)
     API_KEY: Optional[str] = os.getenv("COINGECKO_API_KEY")
     
-    # 캐시 (5분 동안 유효)
-    _cache: Dict[str, tuple] = {}
-    CACHE_DURATION: int = 300  # 5분 (초)
+    # 캐시 (현재 시세는 오래되면 반환하면서 백그라운드 재조회, 과거 시세는 만료 없음)
+    _cache: PriceCache = PriceCache(name="coingecko-price")  # {코인ID_통화_날짜: 결과}
+    
+    # 진행 중인 요청 공유 (동시 요청 중복 방지)
+    _in_flight: SingleFlight = SingleFlight("coingecko-price")
     
     # 코인 ID 매핑 (한국어 → CoinGecko ID)
     COIN_ID_MAPPING: Dict[str, str] = {
@@ -91,6 +95,23 @@ class CoinGeckoService:
         
         return None
     
+    @staticmethod
+    def _simple_price_result(coin_data: Dict, coin_name: str, convert_lower: str) -> Dict:
+        """/simple/price 응답의 코인 항목을 결과 형식으로 변환"""
+        price_krw = coin_data.get(convert_lower, 0)
+        price_usd = coin_data.get("usd", 0)
+        
+        return {
+            "symbol": coin_name.upper() if len(coin_name) <= 5 else "",
+            "name": coin_name,
+            "price_usd": price_usd,
+            "price_krw": price_krw if convert_lower == "krw" else None,
+            "price_change_24h": coin_data.get(f"{convert_lower}_24h_change", 0),
+            "market_cap": coin_data.get(f"{convert_lower}_market_cap", 0) if convert_lower == "krw" else coin_data.get("usd_market_cap", 0),
+            "volume_24h": coin_data.get(f"{convert_lower}_24h_vol", 0) if convert_lower == "krw" else coin_data.get("usd_24h_vol", 0),
+            "last_updated": datetime.now(timezone.utc).isoformat()
+        }
+    
     @classmethod
     async def get_price(cls, coin_name: str, convert: str = "krw", target_date: Optional[datetime] = None) -> Optional[Dict]:
         """
@@ -137,16 +158,25 @@ class CoinGeckoService:
                 )
                 return None
         
-        # 캐시 확인 (과거 날짜는 캐시 사용 안 함)
+        # 캐시 확인
         cache_key = f"{coin_id}_{convert_lower}_{target_date.strftime('%Y-%m-%d') if target_date else 'latest'}"
-        if cache_key in cls._cache:
-            data, timestamp = cls._cache[cache_key]
-            if (datetime.now().timestamp() - timestamp) < cls.CACHE_DURATION:
-                logger.info(f"✅ 코인게코 캐시 사용: {coin_id}")
-                return data
+        data, is_stale = cls._cache.lookup(cache_key)
+        if data is not None:
+            logger.info(f"✅ 코인게코 캐시 사용: {coin_id}{' (백그라운드 재조회)' if is_stale else ''}")
+            if is_stale:
+                cls._cache.revalidate(cache_key, lambda: cls._in_flight.do(
+                    cache_key, cls._fetch_price_internal, coin_name, coin_id, convert, target_date, cache_key))
+            return data
         
+        # 같은 키로 진행 중인 요청이 있으면 그 결과를 함께 사용
+        return await cls._in_flight.do(cache_key, cls._fetch_price_internal, coin_name, coin_id, convert, target_date, cache_key)
+    
+    @classmethod
+    async def _fetch_price_internal(cls, coin_name: str, coin_id: str, convert: str, target_date: Optional[datetime], cache_key: str) -> Optional[Dict]:
+        """내부 API 호출 함수 (중복 방지용)"""
+        convert_lower = convert.lower()
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with price_client() as client:
                 headers = {
                     "Accept": "application/json"
                 }
@@ -209,29 +239,15 @@ class CoinGeckoService:
                             logger.warning(f"⚠️ 코인게코 API 응답에 '{coin_id}' 데이터가 없습니다.")
                             return None
                         
-                        coin_data = data[coin_id]
-                        
-                        price_krw = coin_data.get(convert_lower, 0)
-                        price_usd = coin_data.get("usd", 0)
-                        
-                        result = {
-                            "symbol": coin_name.upper() if len(coin_name) <= 5 else "",
-                            "name": coin_name,
-                            "price_usd": price_usd,
-                            "price_krw": price_krw if convert_lower == "krw" else None,
-                            "price_change_24h": coin_data.get(f"{convert_lower}_24h_change", 0),
-                            "market_cap": coin_data.get(f"{convert_lower}_market_cap", 0) if convert_lower == "krw" else coin_data.get("usd_market_cap", 0),
-                            "volume_24h": coin_data.get(f"{convert_lower}_24h_vol", 0) if convert_lower == "krw" else coin_data.get("usd_24h_vol", 0),
-                            "last_updated": datetime.now(timezone.utc).isoformat()
-                        }
+                        result = cls._simple_price_result(data[coin_id], coin_name, convert_lower)
                     
                     # 가격이 0이면 실패로 간주
                     if result["price_usd"] == 0 and result["price_krw"] == 0:
                         logger.warning(f"⚠️ 코인게코 API 조회 실패: 가격 정보가 없습니다.")
                         return None
                     
-                    # 캐시 저장
-                    cls._cache[cache_key] = (result, datetime.now().timestamp())
+                    # 캐시 저장 (과거 날짜 시세는 바뀌지 않으므로 만료 없음)
+                    cls._cache.set(cache_key, result, permanent=target_date is not None)
                     
                     price_display = result['price_krw'] if result['price_krw'] else result['price_usd']
                     currency_display = convert.upper() if result['price_krw'] else "USD"
@@ -265,6 +281,90 @@ class CoinGeckoService:
                 logger.info("과거 날짜 조회 실패 - 웹 검색으로 폴백 필요")
             return None
     
+    @classmethod
+    async def get_prices(cls, coin_names: List[str], convert: str = "krw") -> Dict[str, Optional[Dict]]:
+        """
+        여러 코인의 현재 시세를 한 번의 /simple/price 요청(ids=bitcoin,ethereum,...)으로 조회
+        
+        캐시에 있는 코인은 요청하지 않고(오래된 값은 반환하면서 백그라운드에서 일괄 재조회),
+        응답의 코인별 결과는 get_price와 같은 캐시 항목에 저장합니다.
+        
+        Returns:
+            {코인명: get_price와 같은 형식의 결과 또는 None}
+        """
+        convert_lower = convert.lower()
+        results: Dict[str, Optional[Dict]] = {coin_name: None for coin_name in coin_names}
+        coin_ids: Dict[str, str] = {}  # 코인명 -> CoinGecko ID (요청할 코인만)
+        stale_ids: Dict[str, str] = {}  # 코인명 -> CoinGecko ID (오래된 값을 반환한 코인)
+        for coin_name in coin_names:
+            coin_id = cls._get_coin_id(coin_name)
+            if not coin_id:
+                logger.warning(f"⚠️ 코인게코 ID를 찾을 수 없습니다: {coin_name}")
+                continue
+            cached, is_stale = cls._cache.lookup(f"{coin_id}_{convert_lower}_latest")
+            if cached:
+                logger.info(f"✅ 코인게코 캐시 사용: {coin_id}")
+                results[coin_name] = cached
+                if is_stale:
+                    stale_ids[coin_name] = coin_id
+            else:
+                coin_ids[coin_name] = coin_id
+        
+        if stale_ids:
+            stale_key = ("batch", tuple(sorted(stale_ids.items())), convert_lower)
+            cls._cache.revalidate(stale_key, lambda: cls._in_flight.do(
+                stale_key, cls._fetch_prices_internal, stale_ids, convert_lower))
+        if coin_ids:
+            batch_key = ("batch", tuple(sorted(coin_ids.items())), convert_lower)
+            fetched = await cls._in_flight.do(batch_key, cls._fetch_prices_internal, dict(coin_ids), convert_lower)
+            for coin_name in coin_ids:
+                results[coin_name] = fetched.get(coin_name)
+        return results
+    
+    @classmethod
+    def current_price_expires_within(cls, coin_name: str, seconds: float, convert: str = "krw") -> bool:
+        """코인의 현재 시세 캐시 항목이 없거나 seconds 안에 만료되는지 여부"""
+        coin_id = cls._get_coin_id(coin_name)
+        return not coin_id or cls._cache.expires_within(f"{coin_id}_{convert.lower()}_latest", seconds)
+    
+    @classmethod
+    async def _fetch_prices_internal(cls, coin_ids: Dict[str, str], convert_lower: str) -> Dict[str, Dict]:
+        """/simple/price 일괄 요청 (코인명 -> 결과). 실패한 코인은 빠짐"""
+        headers = {"Accept": "application/json"}
+        if cls.API_KEY:
+            headers["x-cg-demo-api-key"] = cls.API_KEY
+        params = {
+            "ids": ",".join(sorted(set(coin_ids.values()))),
+            "vs_currencies": f"{convert_lower},usd",
+            "include_24hr_change": "true",
+            "include_market_cap": "true",
+            "include_24hr_vol": "true"
+        }
+        try:
+            async with price_client() as client:
+                response = await client.get(f"{cls.BASE_URL}/simple/price", headers=headers, params=params)
+            if response.status_code != 200:
+                logger.warning(f"⚠️ 코인게코 API 오류: {response.status_code} - {response.text[:500]}")
+                return {}
+            data = response.json()
+        except Exception as e:
+            logger.error(f"❌ 코인게코 일괄 조회 실패 ({params['ids']}): {e}", exc_info=True)
+            return {}
+        
+        fetched = {}
+        for coin_name, coin_id in coin_ids.items():
+            if coin_id not in data:
+                logger.warning(f"⚠️ 코인게코 API 응답에 '{coin_id}' 데이터가 없습니다.")
+                continue
+            result = cls._simple_price_result(data[coin_id], coin_name, convert_lower)
+            if result["price_usd"] == 0 and result["price_krw"] == 0:
+                logger.warning(f"⚠️ 코인게코 API 조회 실패: {coin_id} 가격 정보가 없습니다.")
+                continue
+            fetched[coin_name] = result
+            cls._cache.set(f"{coin_id}_{convert_lower}_latest", result)
+        logger.info(f"✅ 코인게코 일괄 조회: {len(fetched)}/{len(coin_ids)}개 ({params['ids']})")
+        return fetched
+    
     @classmethod
     def clear_cache(cls):
         """캐시 초기화"""
@@ -5,10 +5,13 @@
 import os
 import logging
 import httpx
-import asyncio
 from typing import Optional, Dict, List
 from datetime import datetime, timezone, timedelta
 from .configuration import config
+from .single_flight import SingleFlight
+from .price_cache import PriceCache
+from .price_http import price_client
+from .cmc_id_map import cmc_id_map
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +23,11 @@ class CoinMarketCapService:
     API_KEY: Optional[str] = os.getenv("COINMARKETCAP_API_KEY")
     BASE_URL: str = config.COINMARKETCAP_API_URL
     
-    # 캐시 (5분 동안 유효)
-    _cache: Dict[str, tuple] = {}  # {symbol: (data, timestamp)}
-    CACHE_DURATION: int = 300  # 5분 (초)
+    # 캐시 (현재 시세는 오래되면 반환하면서 백그라운드 재조회, 과거 시세는 만료 없음)
+    _cache: PriceCache = PriceCache(name="cmc-price")  # {심볼_통화_날짜: 결과}
     
-    # 진행 중인 요청 추적 (동시 요청 중복 방지)
-    _pending_requests: Dict[str, asyncio.Task] = {}
+    # 진행 중인 요청 공유 (동시 요청 중복 방지)
+    _in_flight: SingleFlight = SingleFlight("cmc-price")
     
     # 코인 심볼 매핑 (한국어 → 영어 심볼)
     SYMBOL_MAPPING: Dict[str, str] = {
@@ -65,12 +67,88 @@ class CoinMarketCapService:
             if korean in coin_lower:
                 return symbol
         
+        # 영어 이름/slug인 경우 (예: "bitcoin" → "BTC", 심볼과 겹치면 심볼 우선)
+        if not cmc_id_map.has_symbol(coin_lower):
+            entry = cmc_id_map.by_name(coin_lower)
+            if entry:
+                return entry["symbol"]
+        
         # 이미 영어 심볼인 경우 (대문자 변환)
         if coin_lower.isalpha() and len(coin_lower) <= 10:
             return coin_lower.upper()
         
         return None
     
+    @staticmethod
+    def _latest_entry(coin_data_list, symbol: str) -> Optional[Dict]:
+        """quotes/latest 응답의 심볼 항목에서 코인 데이터 추출 (v1은 dict, v2는 같은 심볼 코인 목록)"""
+        # 응답 구조 확인: 배열인지 딕셔너리인지 확인
+        try:
+            if isinstance(coin_data_list, dict):
+                # 딕셔너리인 경우 (단일 코인)
+                if not coin_data_list:
+                    logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{symbol}' 데이터가 비어있습니다.")
+                    return None
+                logger.debug(f"코인 데이터 타입: dict, 키: {list(coin_data_list.keys())[:5]}")
+                return coin_data_list
+            elif isinstance(coin_data_list, list):
+                # 배열인 경우 (여러 코인 중 첫 번째)
+                if len(coin_data_list) == 0:
+                    logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{symbol}' 데이터가 비어있습니다.")
+                    return None
+                logger.debug(f"코인 데이터 타입: list, 첫 번째 요소 타입: {type(coin_data_list[0])}")
+                return coin_data_list[0]
+            else:
+                logger.warning(f"⚠️ 코인마켓캡 API 응답 구조가 예상과 다릅니다. 타입: {type(coin_data_list)}, 값: {str(coin_data_list)[:200]}")
+                return None
+        except Exception as e:
+            logger.error(f"❌ 코인 데이터 추출 중 오류: {e}, coin_data_list 타입: {type(coin_data_list)}")
+            return None
+    
+    @staticmethod
+    def _quote_result(coin_data: Dict, symbol: str, coin_name: str, convert: str) -> Optional[Dict]:
+        """코인 데이터의 quote를 결과 형식으로 변환 (가격 정보가 없으면 None)"""
+        quote = coin_data.get("quote", {})
+        
+        if convert not in quote:
+            logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{convert}' 통화 정보가 없습니다. 사용 가능한 통화: {list(quote.keys())}")
+            return None
+        
+        quote_data = quote[convert]
+        
+        # USD 가격도 함께 가져오기
+        price_usd = 0
+        if "USD" in quote:
+            price_usd = quote["USD"].get("price", 0)
+        elif convert == "USD":
+            price_usd = quote_data.get("price", 0)
+        
+        price_krw = quote_data.get("price", 0) if convert == "KRW" else None
+        
+        if price_krw == 0 and convert == "KRW":
+            logger.warning(f"⚠️ 코인마켓캡 API 응답에서 KRW 가격이 0입니다. quote_data: {quote_data}")
+            # USD 가격이 있으면 사용
+            if price_usd > 0:
+                logger.info(f"USD 가격 사용: {price_usd}")
+                price_krw = None  # USD만 사용
+        
+        result = {
+            "symbol": coin_data.get("symbol", symbol),
+            "name": coin_data.get("name", coin_name),
+            "price_usd": price_usd,
+            "price_krw": price_krw,
+            "price_change_24h": quote_data.get("percent_change_24h", 0),
+            "market_cap": quote_data.get("market_cap", 0),
+            "volume_24h": quote_data.get("volume_24h", 0),
+            "last_updated": coin_data.get("last_updated", "")
+        }
+        
+        # 가격이 0이면 실패로 간주
+        if result["price_usd"] == 0 and result["price_krw"] == 0:
+            logger.error(f"❌ 코인마켓캡 API 조회 실패: {symbol} 가격 정보가 없습니다. quote: {quote}")
+            return None
+        return result
+    
     @classmethod
     async def get_price(cls, coin_name: str, convert: str = "KRW", target_date: Optional[datetime] = None) -> Optional[Dict]:
         """
@@ -107,33 +185,36 @@ class CoinMarketCapService:
         cache_key = f"{symbol}_{convert}_{date_str}"
         
         # 캐시 확인
-        if cache_key in cls._cache:
-            data, timestamp = cls._cache[cache_key]
-            # 과거 날짜는 영구 캐시, 현재 시세는 5분 캐시
-            is_expired = not target_date and (datetime.now().timestamp() - timestamp) >= cls.CACHE_DURATION
-            if not is_expired:
-                logger.info(f"✅ 코인마켓캡 캐시 사용: {symbol} ({date_str})")
-                return data
+        data, is_stale = cls._cache.lookup(cache_key)
+        if data is not None:
+            logger.info(f"✅ 코인마켓캡 캐시 사용: {symbol} ({date_str}{', 백그라운드 재조회' if is_stale else ''})")
+            if is_stale:
+                cls._cache.revalidate(cache_key, lambda: cls._in_flight.do(
+                    cache_key, cls._fetch_price_internal, coin_name, symbol, convert, target_date, cache_key))
+            return data
         
-        # 진행 중인 요청 확인 (동시 요청 중복 방지)
-        if cache_key in cls._pending_requests:
-            logger.info(f"⏳ 진행 중인 요청 대기: {symbol} ({date_str})")
-            try:
-                return await cls._pending_requests[cache_key]
-            except Exception as e:
-                logger.warning(f"⚠️ 대기 중인 요청 실패: {e}")
-                # 실패 시 새로 요청
-                pass
+        # 같은 키로 진행 중인 요청이 있으면 그 결과를 함께 사용 (동시 요청 중복 방지)
+        return await cls._in_flight.do(cache_key, cls._fetch_price_internal, coin_name, symbol, convert, target_date, cache_key)
+    
+    @classmethod
+    async def _lookup_coin_id(cls, client: httpx.AsyncClient, headers: Dict, symbol: str, convert: str) -> Optional[int]:
+        """ID 맵에 없는 심볼의 CMC ID를 quotes/latest로 조회"""
+        latest_response = await client.get(f"{cls.BASE_URL}/cryptocurrency/quotes/latest", headers=headers,
+                                           params={"symbol": symbol, "convert": convert})
+        if latest_response.status_code != 200:
+            logger.warning(f"⚠️ 코인마켓캡 ID 조회 실패: {latest_response.status_code}")
+            return None
         
-        # 새 요청 시작
-        task = asyncio.create_task(cls._fetch_price_internal(coin_name, symbol, convert, target_date, cache_key))
-        cls._pending_requests[cache_key] = task
+        latest_data = latest_response.json()
+        if "data" not in latest_data or symbol not in latest_data["data"]:
+            logger.warning(f"⚠️ 코인마켓캡 ID 조회 실패: 심볼 {symbol}을 찾을 수 없음")
+            return None
         
-        try:
-            result = await task
-            return result
-        finally:
-            cls._pending_requests.pop(cache_key, None)
+        coin_data = cls._latest_entry(latest_data["data"][symbol], symbol)
+        if not coin_data or not coin_data.get("id"):
+            logger.warning(f"⚠️ 코인마켓캡 ID를 찾을 수 없음")
+            return None
+        return coin_data["id"]
     
     @classmethod
     async def _fetch_price_internal(cls, coin_name: str, symbol: str, convert: str, target_date: Optional[datetime], cache_key: str) -> Optional[Dict]:
@@ -144,42 +225,15 @@ class CoinMarketCapService:
                 "Accept": "application/json"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with price_client() as client:
                 # 과거 날짜인 경우 historical 엔드포인트 사용
                 if target_date:
-                    # 코인마켓캡 Historical API는 ID가 필요하므로 먼저 ID를 가져와야 함
-                    # 1단계: latest API로 ID 가져오기
-                    latest_url = f"{cls.BASE_URL}/cryptocurrency/quotes/latest"
-                    latest_params = {
-                        "symbol": symbol,
-                        "convert": convert
-                    }
-                    
-                    latest_response = await client.get(latest_url, headers=headers, params=latest_params)
-                    if latest_response.status_code != 200:
-                        logger.warning(f"⚠️ 코인마켓캡 ID 조회 실패: {latest_response.status_code}")
-                        return None
-                    
-                    latest_data = latest_response.json()
-                    if "data" not in latest_data or symbol not in latest_data["data"]:
-                        logger.warning(f"⚠️ 코인마켓캡 ID 조회 실패: 심볼 {symbol}을 찾을 수 없음")
-                        return None
-                    
-                    # ID 추출
-                    coin_info = latest_data["data"][symbol]
-                    if isinstance(coin_info, list):
-                        coin_id = coin_info[0].get("id")
-                    elif isinstance(coin_info, dict):
-                        coin_id = coin_info.get("id")
-                    else:
-                        logger.warning(f"⚠️ 코인마켓캡 ID 추출 실패")
-                        return None
-                    
+                    # 코인마켓캡 Historical API는 ID가 필요함 (ID 맵에 없으면 latest API로 조회)
+                    coin_id = cmc_id_map.coin_id(symbol) or await cls._lookup_coin_id(client, headers, symbol, convert)
                     if not coin_id:
-                        logger.warning(f"⚠️ 코인마켓캡 ID를 찾을 수 없음")
                         return None
                     
-                    # 2단계: Historical API로 과거 시세 조회
+                    # Historical API로 과거 시세 조회
                     url = f"{cls.BASE_URL}/cryptocurrency/quotes/historical"
                     date_str = target_date.strftime("%Y-%m-%d")
                     # time_start와 time_end를 ISO 8601 형식으로 변환 (타임스탬프)
@@ -255,76 +309,19 @@ class CoinMarketCapService:
                             logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{symbol}' 심볼이 없습니다. 사용 가능한 심볼: {list(data['data'].keys())}")
                             return None
                         
-                        coin_data_list = data["data"][symbol]
-                        
-                        # 응답 구조 확인: 배열인지 딕셔너리인지 확인
-                        try:
-                            if isinstance(coin_data_list, dict):
-                                # 딕셔너리인 경우 (단일 코인)
-                                if not coin_data_list:
-                                    logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{symbol}' 데이터가 비어있습니다.")
-                                    return None
-                                coin_data = coin_data_list
-                                logger.debug(f"코인 데이터 타입: dict, 키: {list(coin_data.keys())[:5]}")
-                            elif isinstance(coin_data_list, list):
-                                # 배열인 경우 (여러 코인 중 첫 번째)
-                                if len(coin_data_list) == 0:
-                                    logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{symbol}' 데이터가 비어있습니다.")
-                                    return None
-                                coin_data = coin_data_list[0]
-                                logger.debug(f"코인 데이터 타입: list, 첫 번째 요소 타입: {type(coin_data)}")
-                            else:
-                                logger.warning(f"⚠️ 코인마켓캡 API 응답 구조가 예상과 다릅니다. 타입: {type(coin_data_list)}, 값: {str(coin_data_list)[:200]}")
-                                return None
-                        except Exception as e:
-                            logger.error(f"❌ 코인 데이터 추출 중 오류: {e}, coin_data_list 타입: {type(coin_data_list)}")
+                        coin_data = cls._latest_entry(data["data"][symbol], symbol)
+                        if coin_data is None:
                             return None
                     
                     if coin_data is None:
                         logger.error(f"❌ 코인 데이터를 추출할 수 없습니다.")
                         return None
-                    quote = coin_data.get("quote", {})
-                    
-                    if convert not in quote:
-                        logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{convert}' 통화 정보가 없습니다. 사용 가능한 통화: {list(quote.keys())}")
-                        return None
-                    
-                    quote_data = quote[convert]
-                    
-                    # USD 가격도 함께 가져오기
-                    price_usd = 0
-                    if "USD" in quote:
-                        price_usd = quote["USD"].get("price", 0)
-                    elif convert == "USD":
-                        price_usd = quote_data.get("price", 0)
-                    
-                    price_krw = quote_data.get("price", 0) if convert == "KRW" else None
-                    
-                    if price_krw == 0 and convert == "KRW":
-                        logger.warning(f"⚠️ 코인마켓캡 API 응답에서 KRW 가격이 0입니다. quote_data: {quote_data}")
-                        # USD 가격이 있으면 사용
-                        if price_usd > 0:
-                            logger.info(f"USD 가격 사용: {price_usd}")
-                            price_krw = None  # USD만 사용
-                    
-                    result = {
-                        "symbol": coin_data.get("symbol", symbol),
-                        "name": coin_data.get("name", coin_name),
-                        "price_usd": price_usd,
-                        "price_krw": price_krw,
-                        "price_change_24h": quote_data.get("percent_change_24h", 0),
-                        "market_cap": quote_data.get("market_cap", 0),
-                        "volume_24h": quote_data.get("volume_24h", 0),
-                        "last_updated": coin_data.get("last_updated", "")
-                    }
-                    
-                    # 가격이 0이면 실패로 간주
-                    if result["price_usd"] == 0 and result["price_krw"] == 0:
-                        logger.error(f"❌ 코인마켓캡 API 조회 실패: 가격 정보가 없습니다. 응답: {data}")
+                    result = cls._quote_result(coin_data, symbol, coin_name, convert)
+                    if result is None:
                         return None
                     
-                    # 캐시 저장
-                    cls._cache[cache_key] = (result, datetime.now().timestamp())
+                    # 캐시 저장 (과거 날짜 시세는 바뀌지 않으므로 만료 없음)
+                    cls._cache.set(cache_key, result, permanent=target_date is not None)
                     
                     price_display = result['price_krw'] if result['price_krw'] else result['price_usd']
                     currency_display = convert if result['price_krw'] else "USD"
@@ -340,6 +337,96 @@ class CoinMarketCapService:
             logger.error(f"❌ 코인마켓캡 API 조회 실패: {e}", exc_info=True)
             return None
     
+    @classmethod
+    async def get_prices(cls, coin_names: List[str], convert: str = "KRW") -> Dict[str, Optional[Dict]]:
+        """
+        여러 코인의 현재 시세를 한 번의 quotes/latest 요청(symbol=BTC,ETH,...)으로 조회
+        
+        캐시에 있는 코인은 요청하지 않고(오래된 값은 반환하면서 백그라운드에서 일괄 재조회),
+        응답의 코인별 결과는 get_price와 같은 캐시 항목에 저장합니다.
+        
+        Returns:
+            {코인명: get_price와 같은 형식의 결과 또는 None}
+        """
+        results: Dict[str, Optional[Dict]] = {coin_name: None for coin_name in coin_names}
+        if not cls.API_KEY:
+            logger.warning("⚠️ COINMARKETCAP_API_KEY가 설정되지 않았습니다.")
+            return results
+        
+        symbols: Dict[str, List[str]] = {}  # 심볼 -> 코인명 목록 (같은 코인을 다른 이름으로 물어본 경우)
+        stale_symbols = set()
+        for coin_name in coin_names:
+            symbol = cls._get_symbol(coin_name)
+            if not symbol:
+                logger.warning(f"⚠️ 코인 심볼을 찾을 수 없습니다: {coin_name}")
+                continue
+            cached, is_stale = cls._cache.lookup(f"{symbol}_{convert}_current")
+            if cached:
+                logger.info(f"✅ 코인마켓캡 캐시 사용: {symbol} (current)")
+                results[coin_name] = cached
+                if is_stale:
+                    stale_symbols.add(symbol)
+            else:
+                symbols.setdefault(symbol, []).append(coin_name)
+        
+        if stale_symbols:
+            stale = tuple(sorted(stale_symbols))
+            cls._cache.revalidate(("batch", stale, convert), lambda: cls._in_flight.do(
+                ("batch", stale, convert), cls._fetch_prices_internal, stale, convert))
+        if symbols:
+            batch_key = ("batch", tuple(sorted(symbols)), convert)
+            fetched = await cls._in_flight.do(batch_key, cls._fetch_prices_internal, tuple(sorted(symbols)), convert)
+            for symbol, names in symbols.items():
+                for coin_name in names:
+                    results[coin_name] = fetched.get(symbol)
+        return results
+    
+    @classmethod
+    def current_price_expires_within(cls, coin_name: str, seconds: float, convert: str = "KRW") -> bool:
+        """코인의 현재 시세 캐시 항목이 없거나 seconds 안에 만료되는지 여부"""
+        symbol = cls._get_symbol(coin_name)
+        return not symbol or cls._cache.expires_within(f"{symbol}_{convert}_current", seconds)
+    
+    @classmethod
+    async def _fetch_prices_internal(cls, symbols: tuple, convert: str) -> Dict[str, Dict]:
+        """quotes/latest 일괄 요청 (심볼 -> 결과). 실패한 심볼은 빠짐"""
+        headers = {
+            "X-CMC_PRO_API_KEY": cls.API_KEY,
+            "Accept": "application/json"
+        }
+        params = {
+            "symbol": ",".join(symbols),
+            "convert": convert,
+            "skip_invalid": "true"  # 잘못된 심볼이 하나 있어도 나머지는 응답
+        }
+        try:
+            async with price_client() as client:
+                response = await client.get(f"{cls.BASE_URL}/cryptocurrency/quotes/latest", headers=headers, params=params)
+            if response.status_code != 200:
+                logger.warning(f"⚠️ 코인마켓캡 API 오류: {response.status_code} - {response.text[:500]}")
+                return {}
+            data = response.json()
+        except Exception as e:
+            logger.error(f"❌ 코인마켓캡 일괄 조회 실패 ({','.join(symbols)}): {e}", exc_info=True)
+            return {}
+        
+        if data.get("status", {}).get("error_code", 0) != 0:
+            logger.error(f"❌ 코인마켓캡 API 오류: {data['status'].get('error_message', 'Unknown error')}")
+            return {}
+        
+        fetched = {}
+        for symbol in symbols:
+            if symbol not in data.get("data", {}):
+                logger.warning(f"⚠️ 코인마켓캡 API 응답에 '{symbol}' 심볼이 없습니다.")
+                continue
+            coin_data = cls._latest_entry(data["data"][symbol], symbol)
+            result = cls._quote_result(coin_data, symbol, symbol, convert) if coin_data else None
+            if result:
+                fetched[symbol] = result
+                cls._cache.set(f"{symbol}_{convert}_current", result)
+        logger.info(f"✅ 코인마켓캡 일괄 조회: {len(fetched)}/{len(symbols)}개 ({','.join(symbols)})")
+        return fetched
+    
     @classmethod
     async def search_coins(cls, query: str) -> List[Dict]:
         """
@@ -355,7 +442,7 @@ class CoinMarketCapService:
             return []
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with price_client() as client:
                 url = f"{cls.BASE_URL}/cryptocurrency/search"
                 headers = {
                     "X-CMC_PRO_API_KEY": cls.API_KEY,
@@ -381,7 +468,6 @@ class CoinMarketCapService:
     def clear_cache(cls):
         """캐시 초기화"""
         cls._cache.clear()
-        cls._pending_requests.clear()
 
 
 # 전역 인스턴스
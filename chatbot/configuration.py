@@ -102,6 +102,9 @@ class ChatbotConfiguration:
     PRICE_KEYWORDS: list = ['시세', '가격', '현재가', 'price', '시장가', '거래가', '현재 시세', 
                             '현재 가격', '얼마', '실시간', 'realtime', 'current price', 'market price']
     
+    # 코인명이 추출되는 시세 질문은 planner/grader/writer 없이 Price Specialist가 시세 API로 바로 답변
+    ENABLE_PRICE_FAST_PATH: bool = os.getenv("ENABLE_PRICE_FAST_PATH", "true").lower() == "true"
+    
     # 단순 대화 키워드
     SIMPLE_CHAT_KEYWORDS: list = ['안녕', '하이', '헬로', '고마워', '감사', '고맙', '반가워', '좋아', '네', '응', '그래']
     SIMPLE_CHAT_MAX_LENGTH: int = 20  # 단순 대화로 분류할 최대 길이
@@ -20,6 +20,7 @@ from .nodes import (
     simple_chat_specialist,
     faq_specialist,
     transaction_specialist,
+    price_specialist,
     check_db,
     planner,
     researcher,
@@ -37,6 +38,7 @@ def route_to_specialist(state: ChatState) -> Literal[
     "simple_chat", 
     "faq", 
     "transaction", 
+    "price",
     "web_search", 
     "hybrid",
     "general",
@@ -56,6 +58,8 @@ def route_to_specialist(state: ChatState) -> Literal[
             return "simple_chat"
         elif specialist_used == "transaction":
             return "transaction"
+        elif specialist_used == "price":
+            return "price"
         elif specialist_used == "faq":
             return "faq"
         elif specialist_used == "web_search":
@@ -93,6 +97,13 @@ def route_from_faq(state: ChatState) -> Literal["planner", "save_response"]:
         return "save_response"
 
 
+def route_from_price(state: ChatState) -> Literal["planner", "save_response"]:
+    """Price Specialist에서 시세 API 조회에 실패했으면 웹 검색(Deep Research)으로"""
+    if state.get("needs_web_search", False):
+        return "planner"
+    return "save_response"
+
+
 def route_from_planner(state: ChatState) -> Literal["save_response", "researcher"]:
     """Planner에서 Writer가 이미 실행되었는지 확인 (Fallback 케이스만)"""
     # PlannerAgent가 Fallback 케이스에서 Writer를 실행한 경우 (쿼리 없음, 상태 손상 등)
@@ -218,6 +229,7 @@ def create_chatbot_graph():
     workflow.add_node("simple_chat_specialist", simple_chat_specialist)
     workflow.add_node("faq_specialist", faq_specialist)
     workflow.add_node("transaction_specialist", transaction_specialist)
+    workflow.add_node("price_specialist", price_specialist)
     workflow.add_node("check_db", check_db)
     workflow.add_node("planner", planner)
     workflow.add_node("researcher", researcher)
@@ -239,6 +251,7 @@ def create_chatbot_graph():
             "simple_chat": "simple_chat_specialist",
             "faq": "faq_specialist",
             "transaction": "transaction_specialist",
+            "price": "price_specialist",
             "web_search": "planner",
             "hybrid": "planner",  # hybrid는 Deep Research로 직접 연결
             "general": "faq_specialist"
@@ -264,6 +277,16 @@ def create_chatbot_graph():
     # Transaction → Save
     workflow.add_edge("transaction_specialist", "save_response")
     
+    # Price → Save 또는 Deep Research (시세 API 조회 실패 시)
+    workflow.add_conditional_edges(
+        "price_specialist",
+        route_from_price,
+        {
+            "planner": "planner",
+            "save_response": "save_response"
+        }
+    )
+    
     # Deep Research 순환형 구조
     # Planner → Save (writer_executed 플래그가 있으면) 또는 Researcher (없으면)
     workflow.add_conditional_edges(
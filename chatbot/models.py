@@ -156,6 +156,9 @@ class ChatState(TypedDict, total=False):
     is_sufficient: Optional[bool]  # 검색 결과 충분 여부 (Grader 결과)
     google_rate_limit_hit: bool  # Google API 할당량 초과 여부 (다음 검색에서 Google 건너뛰기)
     
+    # 시세 질문 빠른 경로 (Optional)
+    price_coins: list  # Router가 추출한 코인명 목록 (Price Specialist가 조회)
+    
     # 요약/압축 (선택적 사용)
     summarized_results: list  # 요약된 검색 결과 (선택적)
     compressed_results: list  # 압축된 검색 결과 (선택적)
@@ -219,6 +222,9 @@ def get_default_chat_state(
         "grader_feedback": None,
         "is_sufficient": None,
         
+        # 시세 질문 빠른 경로 기본값
+        "price_coins": [],
+        
         # 요약/압축 기본값
         "summarized_results": [],
         "compressed_results": [],
@@ -22,6 +22,9 @@ class MongoDBClient:
         self.db = None
         self.chat_collection = None
         self.inquiry_collection = None
+        self.chain_stats_collection = None
+        self.tx_archive_collection = None
+        self.coin_id_map_collection = None
         
     async def connect(self):
         """MongoDB Atlas에 연결"""
@@ -57,6 +60,9 @@ class MongoDBClient:
             self.chat_collection = self.db["conversations"]
             self.inquiry_collection = self.db["inquiries"]
             self.admin_collection = self.db["admin_settings"]
+            self.chain_stats_collection = self.db["chain_stats"]
+            self.tx_archive_collection = self.db["tx_archive"]
+            self.coin_id_map_collection = self.db["coin_id_maps"]
             
             # 인덱스 생성 (성능 최적화)
             await self.chat_collection.create_index("session_id")
@@ -65,6 +71,10 @@ class MongoDBClient:
             await self.inquiry_collection.create_index("created_at")
             await self.inquiry_collection.create_index("status")
             await self.admin_collection.create_index("key", unique=True)
+            await self.chain_stats_collection.create_index("chain", unique=True)
+            await self.tx_archive_collection.create_index([("chain", 1), ("txid", 1)], unique=True)
+            await self.tx_archive_collection.create_index("txid")
+            await self.coin_id_map_collection.create_index("provider", unique=True)
             
             logger.info(f"MongoDB Atlas 연결 성공: {database_name}")
             return True
@@ -156,6 +166,20 @@ class MongoDBClient:
             logger.error(f"[MongoDB] 대화 기록 조회 실패: {e}", exc_info=True)
             return []
     
+    async def get_recent_user_messages(self, since: datetime, limit: int = 5000) -> list:
+        """since 이후의 사용자 메시지 본문 (최신순, 자주 묻는 코인 집계용)"""
+        if self.chat_collection is None:
+            return []
+        
+        try:
+            cursor = self.chat_collection.find(
+                {"role": "user", "created_at": {"$gte": since}}, {"content": 1}
+            ).sort("created_at", -1).limit(limit)
+            return [message.get("content", "") for message in await cursor.to_list(length=limit)]
+        except Exception as e:
+            logger.error(f"[MongoDB] 최근 사용자 메시지 조회 실패: {e}")
+            return []
+    
     async def clear_conversation(self, session_id: str):
         """대화 기록 삭제"""
         if self.chat_collection is None:
@@ -698,6 +722,163 @@ class MongoDBClient:
             logger.error(f"관리자 비밀번호 초기화 실패: {e}")
             return False
 
+    async def get_chain_stats(self) -> dict:
+        """체인별 트랜잭션 조회 통계 조회 (체인 키 -> 누적 카운터)"""
+        if self.chain_stats_collection is None:
+            logger.warning("MongoDB가 연결되지 않았습니다.")
+            return {}
+        
+        try:
+            docs = await self.chain_stats_collection.find({}, {"_id": 0}).to_list(length=None)
+            return {doc["chain"]: doc for doc in docs if doc.get("chain")}
+        except Exception as e:
+            logger.error(f"체인 통계 조회 실패: {e}")
+            return {}
+    
+    async def increment_chain_stats(self, deltas: dict) -> bool:
+        """체인별 조회 통계 누적 (워커별 증분을 $inc로 합산하므로 여러 워커가 동시에 기록해도 안전)"""
+        if self.chain_stats_collection is None:
+            logger.warning("MongoDB가 연결되지 않았습니다.")
+            return False
+        if not deltas:
+            return True
+        
+        try:
+            from pymongo import UpdateOne
+            operations = [
+                UpdateOne(
+                    {"chain": chain},
+                    {"$inc": counters, "$set": {"updated_at": datetime.utcnow()}},
+                    upsert=True
+                )
+                for chain, counters in deltas.items()
+            ]
+            result = await self.chain_stats_collection.bulk_write(operations, ordered=False)
+            return result.acknowledged
+        except Exception as e:
+            logger.error(f"체인 통계 저장 실패: {e}")
+            return False
+
+    async def get_coin_id_map(self, provider: str) -> Optional[dict]:
+        """저장된 코인 ID 맵 조회 ({"entries": [...], "updated_at": datetime} 또는 None)"""
+        if self.coin_id_map_collection is None:
+            return None
+        
+        try:
+            return await self.coin_id_map_collection.find_one({"provider": provider}, {"_id": 0})
+        except Exception as e:
+            logger.error(f"코인 ID 맵 조회 실패: {e}")
+            return None
+    
+    async def save_coin_id_map(self, provider: str, entries: list) -> bool:
+        """코인 ID 맵 저장 (제공자별 문서 하나를 통째로 교체)"""
+        if self.coin_id_map_collection is None:
+            return False
+        
+        try:
+            result = await self.coin_id_map_collection.replace_one(
+                {"provider": provider},
+                {"provider": provider, "entries": entries, "updated_at": datetime.utcnow()},
+                upsert=True
+            )
+            return result.acknowledged
+        except Exception as e:
+            logger.error(f"코인 ID 맵 저장 실패: {e}")
+            return False
+
+    async def ensure_tx_archive_ttl(self, max_age_seconds: int) -> bool:
+        """트랜잭션 아카이브 보존 기간 설정 (마지막 조회 후 max_age_seconds가 지나면 MongoDB TTL 인덱스가 삭제)"""
+        if self.tx_archive_collection is None:
+            return False
+        
+        try:
+            from pymongo.errors import OperationFailure
+            try:
+                await self.tx_archive_collection.create_index(
+                    "last_accessed_at", name="last_accessed_at_ttl", expireAfterSeconds=max_age_seconds
+                )
+            except OperationFailure:
+                # 보존 기간이 바뀐 경우 인덱스를 다시 만들지 않고 만료 시간만 변경
+                await self.db.command(
+                    "collMod", "tx_archive",
+                    index={"name": "last_accessed_at_ttl", "expireAfterSeconds": max_age_seconds}
+                )
+            return True
+        except Exception as e:
+            logger.error(f"트랜잭션 아카이브 TTL 인덱스 설정 실패: {e}")
+            return False
+    
+    async def get_archived_transactions(self, txids: list) -> dict:
+        """아카이브된 트랜잭션 조회 (txid -> [{"chain", "result"}, ...])"""
+        if self.tx_archive_collection is None or not txids:
+            return {}
+        
+        try:
+            docs = await self.tx_archive_collection.find(
+                {"txid": {"$in": list(txids)}}, {"_id": 0, "txid": 1, "chain": 1, "result": 1}
+            ).to_list(length=None)
+        except Exception as e:
+            logger.error(f"트랜잭션 아카이브 조회 실패: {e}")
+            return {}
+        archived = {}
+        for doc in docs:
+            archived.setdefault(doc["txid"], []).append(doc)
+        return archived
+    
+    async def archive_transactions(self, documents: list) -> bool:
+        """확정된 트랜잭션 저장 ((chain, txid) 기준 upsert)"""
+        if self.tx_archive_collection is None:
+            return False
+        if not documents:
+            return True
+        
+        try:
+            from pymongo import UpdateOne
+            now = datetime.utcnow()
+            operations = [
+                UpdateOne(
+                    {"chain": doc["chain"], "txid": doc["txid"]},
+                    {"$set": {"result": doc["result"], "last_accessed_at": now}, "$setOnInsert": {"archived_at": now}},
+                    upsert=True
+                )
+                for doc in documents
+            ]
+            result = await self.tx_archive_collection.bulk_write(operations, ordered=False)
+            return result.acknowledged
+        except Exception as e:
+            logger.error(f"트랜잭션 아카이브 저장 실패: {e}")
+            return False
+    
+    async def touch_archived_transactions(self, txids: list) -> bool:
+        """아카이브에서 조회된 트랜잭션의 마지막 조회 시각 갱신 (자주 조회되는 트랜잭션은 보존 기간이 연장됨)"""
+        if self.tx_archive_collection is None or not txids:
+            return False
+        
+        try:
+            result = await self.tx_archive_collection.update_many(
+                {"txid": {"$in": list(txids)}}, {"$set": {"last_accessed_at": datetime.utcnow()}}
+            )
+            return result.acknowledged
+        except Exception as e:
+            logger.error(f"트랜잭션 아카이브 조회 시각 갱신 실패: {e}")
+            return False
+    
+    async def prune_tx_archive(self, max_documents: int) -> int:
+        """아카이브 문서 수가 max_documents를 넘으면 오래 조회되지 않은 문서부터 삭제하고 삭제 수를 반환"""
+        if self.tx_archive_collection is None:
+            return 0
+        
+        try:
+            excess = await self.tx_archive_collection.estimated_document_count() - max_documents
+            if excess <= 0:
+                return 0
+            oldest = await self.tx_archive_collection.find({}, {"_id": 1}).sort("last_accessed_at", 1).limit(excess).to_list(length=excess)
+            result = await self.tx_archive_collection.delete_many({"_id": {"$in": [doc["_id"] for doc in oldest]}})
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"트랜잭션 아카이브 정리 실패: {e}")
+            return 0
+
 # 전역 MongoDB 클라이언트 인스턴스
 mongodb_client = MongoDBClient()
 
@@ -19,6 +19,7 @@ from ..agents.specialist_agents import (
 
 # 기존 노드 함수들 (Agent로 래핑되지 않은 노드들)
 from .intent_clarifier import intent_clarifier
+from .specialists.price import price_specialist
 from .writer import writer
 from .save_response import save_response
 
@@ -65,6 +66,7 @@ __all__ = [
     "simple_chat_specialist",
     "faq_specialist",
     "transaction_specialist",
+    "price_specialist",
     # Deep Research (기존 구조 유지)
     "check_db",
     "planner",
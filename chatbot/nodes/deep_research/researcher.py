@@ -1,7 +1,6 @@
 """
 Researcher 노드 - 웹 검색 수행
 """
-import re
 import sys
 import logging
 import asyncio
@@ -14,6 +13,9 @@ from langsmith import traceable
 from ...models import ChatState
 from ...configuration import config
 from ...utils import ensure_logger_setup
+from ...price_lookup import (
+    extract_coin_names, get_prices, resolve_requested_date, date_limit_notice, format_price_result
+)
 
 # 선택적 의존성 (DuckDuckGo)
 try:
@@ -254,151 +256,6 @@ async def _search_with_tavily(search_queries: list) -> list:
     return all_results
 
 
-async def _get_price_from_api(coin_name: str, is_past_date: bool, requested_date):
-    """시세 API에서 가격 정보 가져오기 (단일 코인)"""
-    try:
-        if is_past_date and requested_date:
-            # 과거 날짜: CoinGecko 우선
-            try:
-                from ...coingecko import coingecko_service
-                price_data = await coingecko_service.get_price(coin_name, convert="krw", target_date=requested_date)
-                if price_data:
-                    return price_data, "coingecko_api"
-            except ImportError:
-                pass
-            except Exception as e:
-                logger.warning(f"CoinGecko API 오류: {e}")
-            
-            # CoinMarketCap 시도
-            try:
-                from ...coinmarketcap import coinmarketcap_service
-                price_data = await coinmarketcap_service.get_price(coin_name, convert="KRW", target_date=requested_date)
-                if price_data:
-                    return price_data, "coinmarketcap_api"
-            except ImportError:
-                pass
-        else:
-            # 현재 시세: CoinMarketCap
-            try:
-                from ...coinmarketcap import coinmarketcap_service
-                price_data = await coinmarketcap_service.get_price(coin_name, convert="KRW", target_date=None)
-                if price_data:
-                    return price_data, "coinmarketcap_api"
-            except ImportError:
-                pass
-    except Exception as e:
-        logger.error(f"시세 API 오류: {e}")
-    
-    return None, None
-
-
-async def _get_prices_from_api(coin_names: list, is_past_date: bool, requested_date):
-    """시세 API에서 여러 코인의 가격 정보 가져오기 (병렬 처리)"""
-    import asyncio
-    
-    if not coin_names:
-        return []
-    
-    # 모든 코인을 병렬로 조회
-    tasks = [_get_price_from_api(coin_name, is_past_date, requested_date) for coin_name in coin_names]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    price_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.warning(f"코인 '{coin_names[i]}' 조회 실패: {result}")
-            continue
-        
-        price_data, api_source = result
-        if price_data:
-            price_results.append((price_data, api_source, coin_names[i]))
-    
-    return price_results
-
-
-def _extract_coin_names(user_message: str) -> list:
-    """사용자 메시지에서 여러 코인명 추출 (리스트 반환)
-    
-    띄어쓰기 처리: "비트 코인" → "비트코인"으로 정규화
-    """
-    coin_names = []
-    try:
-        from ...coinmarketcap import coinmarketcap_service
-        
-        # 띄어쓰기 제거 버전도 체크 (예: "비트 코인" → "비트코인")
-        normalized_message = user_message.replace(" ", "")
-        
-        # 한국어 코인명 추출 (모든 매칭)
-        # 원본 메시지와 정규화된 메시지 모두 체크
-        for coin_korean, coin_symbol in coinmarketcap_service.SYMBOL_MAPPING.items():
-            # 원본 메시지에서 체크
-            if coin_korean in user_message:
-                if coin_korean not in coin_names:
-                    coin_names.append(coin_korean)
-            # 정규화된 메시지에서 체크 (띄어쓰기 제거)
-            elif coin_korean in normalized_message:
-                if coin_korean not in coin_names:
-                    coin_names.append(coin_korean)
-            # 역방향 체크: "비트 코인"에서 "비트코인" 찾기
-            elif coin_korean.replace(" ", "") in normalized_message:
-                if coin_korean not in coin_names:
-                    coin_names.append(coin_korean)
-        
-        # 영어 심볼 추출 (모든 매칭)
-        symbol_matches = re.findall(r'\b([A-Z]{2,5})\b', user_message.upper())
-        for symbol in symbol_matches:
-            # 알려진 심볼인지 확인
-            if symbol in coinmarketcap_service.SYMBOL_MAPPING.values():
-                # 심볼을 한국어명으로 변환
-                for korean, eng_symbol in coinmarketcap_service.SYMBOL_MAPPING.items():
-                    if eng_symbol == symbol and korean not in coin_names:
-                        coin_names.append(korean)
-                        break
-        
-        # 추가: 일반적인 코인명 패턴 체크 (예: "비트 코인", "이더 리움")
-        common_patterns = {
-            "비트 코인": "비트코인",
-            "이더 리움": "이더리움",
-            "리 플": "리플",
-            "도지 코인": "도지코인",
-            "솔 라나": "솔라나",
-            "폴카 닷": "폴카닷",
-            "체인 링크": "체인링크",
-            "유니 스왑": "유니스왑",
-            "아발란 체": "아발란체",
-            "폴리 곤": "폴리곤",
-        }
-        for spaced_name, correct_name in common_patterns.items():
-            if spaced_name in user_message and correct_name not in coin_names:
-                coin_names.append(correct_name)
-        
-    except ImportError:
-        pass
-    
-    return coin_names if coin_names else []
-
-
-def _extract_date_from_message(message: str):
-    """메시지에서 날짜 추출"""
-    date_patterns = [
-        r'(\d{4})-(\d{1,2})-(\d{1,2})',
-        r'(\d{4})\.(\d{1,2})\.(\d{1,2})',
-        r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, message)
-        if match:
-            year, month, day = map(int, match.groups())
-            try:
-                kst = timezone(timedelta(hours=9))
-                return datetime(year, month, day, tzinfo=kst)
-            except ValueError:
-                continue
-    
-    return None
-
-
 @traceable(name="researcher", run_type="chain")
 async def researcher(state: ChatState):
     """Researcher: 웹 검색 수행"""
@@ -438,26 +295,15 @@ async def researcher(state: ChatState):
                     logger.info("✅ 맥락 기반 시세 질문 감지")
                     break
     
-    # 날짜 추출
-    requested_date = _extract_date_from_message(last_user_message)
-    kst = timezone(timedelta(hours=9))
-    today = datetime.now(kst).date()
-    is_past_date = requested_date and requested_date.date() < today
-    
-    # 365일 제한 확인 (CoinGecko 무료 플랜 제한)
-    date_limit_exceeded = False
-    if is_past_date and requested_date:
-        days_diff = (today - requested_date.date()).days
-        if days_diff > 365:
-            date_limit_exceeded = True
-            logger.info(f"⚠️ 365일 제한 초과: 요청 날짜가 {days_diff}일 전입니다.")
+    # 날짜 추출 (365일 제한: CoinGecko 무료 플랜)
+    requested_date, is_past_date, date_limit_exceeded = resolve_requested_date(last_user_message)
     
     # 시세 질문이면 API 우선 사용
     if is_price_query:
         logger.info("✅ 시세 질문 감지")
         print("[Researcher] ✅ 시세 질문 감지", file=sys.stdout, flush=True)
         
-        coin_names = _extract_coin_names(last_user_message)
+        coin_names = extract_coin_names(last_user_message)
         
         if coin_names:
             logger.info(f"추출된 코인: {coin_names}")
@@ -465,12 +311,9 @@ async def researcher(state: ChatState):
             
             # 365일 제한 초과 시 안내 메시지 반환
             if date_limit_exceeded:
-                date_str = requested_date.strftime("%Y년 %m월 %d일") if requested_date else "해당 날짜"
                 limit_message = {
                     "title": "과거 시세 조회 제한 안내",
-                    "snippet": f"죄송합니다. 현재는 최근 365일 이내의 과거 시세만 조회할 수 있습니다.\n\n"
-                              f"요청하신 날짜({date_str})는 현재로부터 365일을 초과하여 조회가 제한됩니다.\n\n"
-                              f"더 오래된 과거 시세 조회 기능은 추후 지원 예정입니다. 양해 부탁드립니다.",
+                    "snippet": date_limit_notice(requested_date),
                     "url": "",
                     "source": "system_notice",
                     "score": 0.0,
@@ -483,45 +326,15 @@ async def researcher(state: ChatState):
                 }
             
             # 여러 코인 병렬 조회
-            price_results = await _get_prices_from_api(coin_names, is_past_date, requested_date)
+            price_results = await get_prices(coin_names, is_past_date, requested_date)
             
             if price_results:
                 api_results = []
                 date_info = f" ({requested_date.date()})" if is_past_date else ""
                 
                 for price_data, api_source, coin_name in price_results:
-                    api_name = "CoinGecko" if "coingecko" in api_source else "CoinMarketCap"
-                    
-                    # 가격 표시 생성
-                    if price_data.get('price_krw') and price_data.get('price_usd', 0) > 0:
-                        price_display_str = f"💰 현재 가격: {price_data['price_krw']:,.0f}원 (${price_data['price_usd']:,.2f})"
-                    elif price_data.get('price_krw'):
-                        price_display_str = f"💰 현재 가격: {price_data['price_krw']:,.0f}원"
-                    elif price_data.get('price_usd', 0) > 0:
-                        price_display_str = f"💰 현재 가격: ${price_data['price_usd']:,.2f}"
-                    else:
-                        price_display_str = "💰 가격 정보 없음"
-                    
-                    snippet = f"{price_data['name']} ({price_data['symbol']}) 시세{date_info}:\n\n{price_display_str}"
-                    
-                    if price_data.get('price_change_24h') is not None:
-                        snippet += f"\n📊 24시간 변동률: {price_data['price_change_24h']:+.2f}%"
-                    if price_data.get('market_cap'):
-                        snippet += f"\n💼 시가총액: ${price_data['market_cap']:,.0f}"
-                    
-                    snippet += f"\n🕐 업데이트: {price_data['last_updated']}"
-                    snippet += f"\n\n출처: {api_name}"
-                    
-                    api_result = {
-                        "title": f"{price_data['name']} 시세{date_info} - {api_name}",
-                        "snippet": snippet.strip(),
-                        "url": f"https://coinmarketcap.com/currencies/{price_data['name'].lower().replace(' ', '-')}/",
-                        "source": api_source,
-                        "score": 0.95,
-                    }
-                    
-                    api_results.append(api_result)
-                    logger.info(f"✅ {api_name} API 결과: {price_data['symbol']}")
+                    api_results.append(format_price_result(price_data, api_source, date_info))
+                    logger.info(f"✅ {api_source} 결과: {price_data['symbol']}")
                 
                 print(f"[Researcher] ✅ {len(api_results)}개 코인 시세 조회 완료", file=sys.stdout, flush=True)
                 
@@ -11,6 +11,7 @@ from langsmith import traceable
 
 from ..models import ChatState, QuestionType, RoutingDecision
 from ..configuration import config
+from ..price_lookup import extract_coin_names
 from ..utils import (
     ensure_logger_setup,
     extract_user_message,
@@ -117,6 +118,30 @@ class RuleBasedClassifier:
         if not has_price_query:
             return None
         
+        # 현재 메시지에서 코인명이 추출되면 Price Specialist가 시세 API로 바로 답변 (LLM 호출 없음)
+        coin_names = extract_coin_names(user_message) if config.ENABLE_PRICE_FAST_PATH else []
+        if coin_names:
+            logger.info(f"시세/가격 질문 감지: price로 분류 (코인: {coin_names})")
+            routing_decision = RoutingDecision(
+                question_type=QuestionType.WEB_SEARCH,
+                confidence=0.95,
+                reasoning=f"시세/가격 관련 질문으로 감지되었습니다. 코인({', '.join(coin_names)}) 시세를 API로 직접 조회합니다.",
+                needs_faq_search=False,
+                needs_web_search=False,
+                needs_transaction_lookup=False,
+                suggested_specialist="price"
+            )
+            print(f"[Router] ✅ 시세/가격 질문으로 분류 (신뢰도: 0.95) - price", file=sys.stdout, flush=True)
+            logger.info(f"✅ 시세/가격 질문으로 분류 - price")
+            
+            return {
+                "routing_decision": routing_decision,
+                "question_type": QuestionType.WEB_SEARCH,
+                "needs_web_search": False,
+                "price_coins": coin_names,
+                "specialist_used": "price"
+            }
+        
         logger.info("시세/가격 질문 감지: web_search로 분류")
         routing_decision = RoutingDecision(
             question_type=QuestionType.WEB_SEARCH,
@@ -5,10 +5,12 @@ Specialist 노드 모듈
 from .simple_chat import simple_chat_specialist
 from .faq import faq_specialist
 from .transaction import transaction_specialist
+from .price import price_specialist
 
 __all__ = [
     "simple_chat_specialist",
     "faq_specialist",
     "transaction_specialist",
+    "price_specialist",
 ]
 
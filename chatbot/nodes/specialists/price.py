@@ -0,0 +1,87 @@
+"""
+Price Specialist 노드 - 시세 질문 빠른 경로
+Router가 코인명을 추출한 시세 질문은 planner/researcher/grader/writer를 거치지 않고 시세 API 결과로 바로 답변
+"""
+import sys
+import logging
+from langchain_core.messages import AIMessage
+from langsmith import traceable
+
+from ...models import ChatState
+from ...utils import ensure_logger_setup, extract_user_message
+from ...price_lookup import (
+    extract_coin_names,
+    get_prices,
+    resolve_requested_date,
+    date_limit_notice,
+    format_price_result,
+)
+
+logger = logging.getLogger(__name__)
+
+PRICE_ANSWER_FOOTER = "※ 시세는 조회 시점과 거래소에 따라 다를 수 있습니다. 빗썸 실시간 시세는 빗썸 앱/웹에서 확인해주세요."
+
+
+def render_price_answer(api_results: list, missing_coins: list, date_info: str) -> str:
+    """시세 API 결과(format_price_result 형식)로 답변 생성 (LLM 호출 없이 템플릿으로)"""
+    sections = [result["snippet"] for result in api_results]
+    answer = f"요청하신 코인 시세{date_info}입니다.\n\n" + "\n\n━━━━━━━━━━\n\n".join(sections)
+    if missing_coins:
+        answer += f"\n\n⚠️ {', '.join(missing_coins)} 시세는 가져오지 못했습니다. 잠시 후 다시 시도해주세요."
+    return answer + f"\n\n{PRICE_ANSWER_FOOTER}"
+
+
+@traceable(name="price_specialist", run_type="chain")
+async def price_specialist(state: ChatState):
+    """Price Specialist: 시세 API 조회 후 템플릿 답변 (조회에 실패하면 웹 검색 경로로 넘김)"""
+
+    print("="*60, file=sys.stdout, flush=True)
+    print("Price Specialist 시작", file=sys.stdout, flush=True)
+    print("="*60, file=sys.stdout, flush=True)
+
+    ensure_logger_setup()
+    logger.info("Price Specialist 시작")
+
+    session_id = state.get("session_id", "default")
+    user_message = extract_user_message(state)
+    coin_names = state.get("price_coins") or extract_coin_names(user_message)
+
+    if not coin_names:
+        logger.warning("⚠️ 코인명 추출 실패 - 웹 검색으로 폴백")
+        return {"needs_web_search": True, "session_id": session_id}
+
+    requested_date, is_past_date, date_limit_exceeded = resolve_requested_date(user_message)
+    if date_limit_exceeded:
+        logger.info("⚠️ 365일 제한 초과 - 사용자 안내 메시지 반환")
+        return {
+            "messages": [AIMessage(content=date_limit_notice(requested_date))],
+            "needs_web_search": False,
+            "session_id": session_id  # 세션 ID 명시적으로 포함
+        }
+
+    try:
+        price_results = await get_prices(coin_names, is_past_date, requested_date)
+    except Exception as e:
+        logger.error(f"시세 조회 실패: {e}", exc_info=True)
+        price_results = []
+
+    if not price_results:
+        logger.warning("⚠️ 시세 API 조회 실패 - 웹 검색으로 폴백")
+        print("[Price Specialist] ⚠️ 시세 API 조회 실패 - 웹 검색으로 폴백", file=sys.stdout, flush=True)
+        return {"needs_web_search": True, "session_id": session_id}
+
+    date_info = f" ({requested_date.date()})" if is_past_date else ""
+    found_coins = {coin_name for _, _, coin_name in price_results}
+    missing_coins = [coin_name for coin_name in coin_names if coin_name not in found_coins]
+    api_results = [format_price_result(price_data, api_source, date_info) for price_data, api_source, _ in price_results]
+    answer = render_price_answer(api_results, missing_coins, date_info)
+
+    logger.info(f"Price Specialist 완료: {len(price_results)}/{len(coin_names)}개 코인")
+    print(f"[Price Specialist] ✅ {len(price_results)}개 코인 시세 답변", file=sys.stdout, flush=True)
+
+    return {
+        "messages": [AIMessage(content=answer)],
+        "web_search_results": api_results,
+        "needs_web_search": False,
+        "session_id": session_id  # 세션 ID 명시적으로 포함
+    }
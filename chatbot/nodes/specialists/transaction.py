@@ -4,7 +4,6 @@ Transaction Specialist 노드 - 트랜잭션 조회
 import os
 import sys
 import logging
-from pathlib import Path
 import httpx
 from langchain_core.messages import AIMessage
 from langsmith import traceable
@@ -18,6 +17,27 @@ from ...utils import (
 
 logger = logging.getLogger(__name__)
 
+# 트랜잭션 조회 방식
+# - local(기본): 같은 프로세스의 transaction_service를 직접 호출 (/api/tx와 캐시, 동시 요청 병합, HTTP 클라이언트 공유)
+# - remote: 별도로 배포된 트랜잭션 서비스의 /api/tx/{hash}를 HTTP로 호출 (TRANSACTION_API_URL)
+TRANSACTION_LOOKUP_MODE = os.getenv("TRANSACTION_LOOKUP_MODE", "local").lower()
+TRANSACTION_API_URL = os.getenv("TRANSACTION_API_URL", "http://localhost:8000")
+
+
+async def lookup_transaction_response(tx_hash: str) -> dict:
+    """/api/tx/{hash}와 같은 형식의 조회 결과"""
+    if TRANSACTION_LOOKUP_MODE == "remote":
+        api_url = f"{TRANSACTION_API_URL}/api/tx/{tx_hash}"
+        logger.info(f"트랜잭션 API 호출: {api_url}")
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(api_url)
+            response.raise_for_status()
+            return response.json()
+
+    # src 패키지가 chatbot을 import하므로 순환 import를 피하기 위해 호출 시점에 import
+    from src.services.transaction_service import transaction_response
+    return await transaction_response(tx_hash)
+
 
 @traceable(name="transaction_specialist", run_type="chain")
 async def transaction_specialist(state: ChatState):
@@ -49,46 +69,15 @@ async def transaction_specialist(state: ChatState):
         }
     
     try:
-        # 트랜잭션 조회 방법 결정
-        # 기본값을 "true"로 변경하여 웹 UI와 동일한 API 사용
-        use_api = os.getenv("USE_TRANSACTION_API", "true").lower() == "true"
-        api_base_url = os.getenv("TRANSACTION_API_URL", "http://localhost:8000")
-        
-        logger.info(f"트랜잭션 조회 시작: {tx_hash[:20]}...")
-        logger.info(f"USE_TRANSACTION_API={use_api}, API_BASE_URL={api_base_url}")
-        
-        if use_api:
-            # API를 통한 트랜잭션 조회
-            api_url = f"{api_base_url}/api/tx/{tx_hash}"
-            logger.info(f"트랜잭션 API 호출: {api_url}")
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(api_url)
-                response.raise_for_status()
-                api_result = response.json()
-                
-                logger.info(f"API 응답: found={api_result.get('found')}, results 개수={len(api_result.get('results', []))}")
-                
-                if api_result.get("found"):
-                    tx_result = api_result.get("results", [])
-                    logger.info(f"API에서 {len(tx_result)}개 결과 반환")
-                else:
-                    tx_result = []
-                    logger.warning(f"API에서 트랜잭션을 찾지 못함: {api_result.get('message', 'Unknown error')}")
+        logger.info(f"트랜잭션 조회 시작: {tx_hash[:20]}... (mode={TRANSACTION_LOOKUP_MODE})")
+        api_result = await lookup_transaction_response(tx_hash)
+        logger.info(f"조회 결과: found={api_result.get('found')}, results 개수={len(api_result.get('results', []))}")
+
+        if api_result.get("found"):
+            tx_result = api_result.get("results", [])
         else:
-            # 직접 함수 호출
-            sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-            from src.services.transaction_service import detect_transaction
-            tx_result = await detect_transaction(tx_hash)
-            logger.info(f"detect_transaction 반환값 타입: {type(tx_result)}, 값: {tx_result}")
-            if isinstance(tx_result, list):
-                logger.info(f"detect_transaction 반환 리스트 길이: {len(tx_result)}")
-                if len(tx_result) > 0:
-                    logger.info(f"첫 번째 결과: {tx_result[0]}")
-                else:
-                    logger.warning(f"detect_transaction이 빈 리스트를 반환했습니다.")
-            else:
-                logger.info(f"detect_transaction 반환값 (리스트 아님): {tx_result}")
+            tx_result = []
+            logger.warning(f"트랜잭션을 찾지 못함: {api_result.get('message', 'Unknown error')}")
         
         # 결과 확인: 리스트인 경우 길이 체크, 아닌 경우 truthy 체크
         has_results = False
@@ -204,8 +193,15 @@ async def transaction_specialist(state: ChatState):
             }
         else:
             logger.warning(f"트랜잭션 조회 결과 없음. tx_result 타입: {type(tx_result)}, 값: {tx_result}")
+            skipped_chains = api_result.get("unavailableChains", []) + api_result.get("rateLimitedChains", [])
+            if skipped_chains:
+                # 일시적으로 조회하지 못한 체인이 있으면 "없음"으로 단정하지 않음
+                skipped_names = ", ".join(chain["name"] for chain in skipped_chains)
+                not_found_text = f"일부 체인({skipped_names})은 일시적으로 조회하지 못했습니다. 잠시 후 다시 시도해주세요."
+            else:
+                not_found_text = "지원되는 모든 체인에서 조회했지만 결과를 찾지 못했습니다."
             return {
-                "messages": [AIMessage(content=f"트랜잭션 해시 '{tx_hash}'에 대한 조회 결과를 찾을 수 없습니다.\n\n지원되는 모든 체인에서 조회했지만 결과를 찾지 못했습니다.\n\n트랜잭션 해시 형식을 확인해주세요. (예: 64자 hex 문자열 또는 Base64 형식)")],
+                "messages": [AIMessage(content=f"트랜잭션 해시 '{tx_hash}'에 대한 조회 결과를 찾을 수 없습니다.\n\n{not_found_text}\n\n트랜잭션 해시 형식을 확인해주세요. (예: 64자 hex 문자열 또는 Base64 형식)")],
                 "session_id": session_id  # 세션 ID 명시적으로 포함
             }
     except Exception as e:
@@ -0,0 +1,118 @@
+"""
+시세 캐시 (크기 제한 + stale-while-revalidate)
+
+현재 시세는 PRICE_CACHE_FRESH_SECONDS 동안 그대로 쓰고, 그 뒤 PRICE_CACHE_MAX_AGE_SECONDS까지는 조금 오래된
+값을 바로 돌려주면서 백그라운드에서 새로 받아옵니다. 캐시가 만료된 뒤 처음 묻는 사용자가 외부 API 지연을 그대로
+치르지 않도록 하기 위함입니다. 재조회에 실패하면 최대 보관 시간까지 이전 값을 계속 사용합니다.
+과거 날짜 시세는 바뀌지 않으므로 만료 없이 보관하고, 전체 항목 수는 LRU로 제한합니다.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PRICE_CACHE_MAX_SIZE = int(os.getenv("PRICE_CACHE_MAX_SIZE", "2000"))
+PRICE_CACHE_FRESH_SECONDS = float(os.getenv("PRICE_CACHE_FRESH_SECONDS", "120"))
+PRICE_CACHE_MAX_AGE_SECONDS = float(os.getenv("PRICE_CACHE_MAX_AGE_SECONDS", "300"))  # 이전 5분 캐시와 같은 최대 나이
+
+
+class PriceCache:
+    """크기 제한이 있는 LRU 시세 캐시 (오래된 항목은 반환하면서 백그라운드 재조회)"""
+
+    def __init__(self, max_size: int = PRICE_CACHE_MAX_SIZE, fresh_seconds: float = PRICE_CACHE_FRESH_SECONDS,
+                 max_age_seconds: float = PRICE_CACHE_MAX_AGE_SECONDS, name: str = "price"):
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, bool]]" = OrderedDict()  # key -> (value, stored_at, permanent)
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.max_size = max_size
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max(max_age_seconds, fresh_seconds)
+        self.name = name
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """(값, 오래된 값 여부). 없거나 최대 나이를 넘었으면 (None, False)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+        value, stored_at, permanent = entry
+        age = time.monotonic() - stored_at
+        if not permanent and age >= self.max_age_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None, False
+        self._entries.move_to_end(key)
+        if permanent or age < self.fresh_seconds:
+            self.hits += 1
+            return value, False
+        self.stale_hits += 1
+        logger.debug(f"[{self.name}] 오래된 시세 반환 ({age:.0f}초): {key}")
+        return value, True
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """신선도와 관계없이 최대 나이 이내의 값"""
+        return self.lookup(key)[0]
+
+    def expires_within(self, key: Hashable, seconds: float) -> bool:
+        """key 항목이 없거나 seconds 안에 최대 나이에 이르면 True (통계에는 반영하지 않음)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return True
+        _, stored_at, permanent = entry
+        return not permanent and time.monotonic() - stored_at + seconds >= self.max_age_seconds
+
+    def set(self, key: Hashable, value: Any, permanent: bool = False):
+        self._entries[key] = (value, time.monotonic(), permanent)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def revalidate(self, key: Hashable, refresh: Callable[[], Awaitable[Any]]) -> bool:
+        """key의 백그라운드 재조회 시작 (이미 진행 중이면 무시). refresh는 캐시를 직접 채워야 함"""
+        if key in self._refreshing:
+            return False
+        task = asyncio.ensure_future(refresh())
+        self._refreshing[key] = task
+        self.refreshes += 1
+        task.add_done_callback(lambda done, key=key: self._refreshed(key, done))
+        return True
+
+    def _refreshed(self, key: Hashable, task: asyncio.Task):
+        self._refreshing.pop(key, None)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None or not task.result():
+            self.refresh_failures += 1
+            logger.warning(f"[{self.name}] 시세 백그라운드 재조회 실패: {key} ({error or '결과 없음'})")
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "refreshing": len(self._refreshing),
+        }
@@ -0,0 +1,36 @@
+"""
+시세 API(코인마켓캡, 코인게코)용 HTTP 클라이언트
+
+시세 질문의 일괄 조회, 백그라운드 재조회, 미리 받기(price_prefetch.py)는 같은 몇 개 호스트로 반복해서 요청하므로,
+워커(이벤트 루프)마다 하나의 keep-alive 클라이언트를 함께 사용해 TCP 연결과 TLS 핸드셰이크를 재사용합니다
+(shared_http_client.py 참고).
+"""
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import httpx
+
+from .shared_http_client import SharedClient, TransportFactory
+
+TIMEOUT_SECONDS = 10.0
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("PRICE_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("PRICE_KEEPALIVE_EXPIRY", "120"))
+
+
+def _create_client(transport_factory: Optional[TransportFactory]) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS, keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS)
+    transport = transport_factory() if transport_factory is not None else None
+    return httpx.AsyncClient(timeout=TIMEOUT_SECONDS, limits=limits, transport=transport)
+
+
+_clients = SharedClient(_create_client)
+set_transport_factory = _clients.set_transport_factory
+shared_client = _clients.get
+aclose = _clients.aclose
+
+
+@asynccontextmanager
+async def price_client():
+    """시세 API 호출용 클라이언트 (async with로 사용). 공유 클라이언트라 닫지 않음"""
+    yield shared_client()
@@ -0,0 +1,239 @@
+"""
+코인 시세 조회 공통 로직
+Researcher(웹 검색 경로)와 Price Specialist(시세 질문 빠른 경로)가 함께 사용하는 코인명/날짜 추출, 시세 API 조회,
+결과 포맷팅
+"""
+import re
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+
+logger = logging.getLogger(__name__)
+
+# CoinGecko 무료 플랜은 최근 365일까지만 과거 시세를 제공
+HISTORY_LIMIT_DAYS = 365
+
+
+async def _get_historical_price(coin_name: str, requested_date):
+    """과거 시세 조회 (단일 코인, CoinGecko 우선)"""
+    try:
+        try:
+            from .coingecko import coingecko_service
+            price_data = await coingecko_service.get_price(coin_name, convert="krw", target_date=requested_date)
+            if price_data:
+                return price_data, "coingecko_api"
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"CoinGecko API 오류: {e}")
+        
+        # CoinMarketCap 시도
+        try:
+            from .coinmarketcap import coinmarketcap_service
+            price_data = await coinmarketcap_service.get_price(coin_name, convert="KRW", target_date=requested_date)
+            if price_data:
+                return price_data, "coinmarketcap_api"
+        except ImportError:
+            pass
+    except Exception as e:
+        logger.error(f"시세 API 오류: {e}")
+    
+    return None, None
+
+
+async def get_current_prices(coin_names: list) -> dict:
+    """
+    현재 시세 일괄 조회 (코인명 -> (가격 정보, API 출처)).
+    CoinMarketCap 한 번의 요청으로 조회하고, 찾지 못한 코인만 CoinGecko 한 번의 요청으로 다시 조회
+    """
+    from .coinmarketcap import coinmarketcap_service
+    from .coingecko import coingecko_service
+    
+    found = {}
+    try:
+        for coin_name, price_data in (await coinmarketcap_service.get_prices(coin_names, convert="KRW")).items():
+            if price_data:
+                found[coin_name] = (price_data, "coinmarketcap_api")
+    except Exception as e:
+        logger.warning(f"CoinMarketCap 일괄 조회 오류: {e}")
+    
+    missing = [coin_name for coin_name in coin_names if coin_name not in found]
+    if missing:
+        try:
+            for coin_name, price_data in (await coingecko_service.get_prices(missing, convert="krw")).items():
+                if price_data:
+                    found[coin_name] = (price_data, "coingecko_api")
+        except Exception as e:
+            logger.warning(f"CoinGecko 일괄 조회 오류: {e}")
+    return found
+
+
+async def get_prices(coin_names: list, is_past_date: bool, requested_date):
+    """시세 API에서 여러 코인의 가격 정보 가져오기. [(가격 정보, API 출처, 코인명)]"""
+    if not coin_names:
+        return []
+    
+    from .price_prefetch import price_prefetcher
+    price_prefetcher.record(coin_names)
+    
+    # 현재 시세는 여러 코인을 한 번의 요청으로 조회
+    if not (is_past_date and requested_date):
+        found = await get_current_prices(coin_names)
+        return [(*found[coin_name], coin_name) for coin_name in coin_names if coin_name in found]
+    
+    # 과거 시세는 일괄 조회 API가 없으므로 코인별로 병렬 조회
+    tasks = [_get_historical_price(coin_name, requested_date) for coin_name in coin_names]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    price_results = []
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.warning(f"코인 '{coin_names[i]}' 조회 실패: {result}")
+            continue
+        
+        price_data, api_source = result
+        if price_data:
+            price_results.append((price_data, api_source, coin_names[i]))
+    
+    return price_results
+
+
+def extract_coin_names(user_message: str) -> list:
+    """사용자 메시지에서 여러 코인명 추출 (리스트 반환)
+    
+    띄어쓰기 처리: "비트 코인" → "비트코인"으로 정규화
+    """
+    coin_names = []
+    try:
+        from .coinmarketcap import coinmarketcap_service
+        
+        # 띄어쓰기 제거 버전도 체크 (예: "비트 코인" → "비트코인")
+        normalized_message = user_message.replace(" ", "")
+        
+        # 한국어 코인명 추출 (모든 매칭)
+        # 원본 메시지와 정규화된 메시지 모두 체크
+        for coin_korean, coin_symbol in coinmarketcap_service.SYMBOL_MAPPING.items():
+            # 원본 메시지에서 체크
+            if coin_korean in user_message:
+                if coin_korean not in coin_names:
+                    coin_names.append(coin_korean)
+            # 정규화된 메시지에서 체크 (띄어쓰기 제거)
+            elif coin_korean in normalized_message:
+                if coin_korean not in coin_names:
+                    coin_names.append(coin_korean)
+            # 역방향 체크: "비트 코인"에서 "비트코인" 찾기
+            elif coin_korean.replace(" ", "") in normalized_message:
+                if coin_korean not in coin_names:
+                    coin_names.append(coin_korean)
+        
+        # 영어 심볼 추출 (모든 매칭)
+        symbol_matches = re.findall(r'\b([A-Z]{2,5})\b', user_message.upper())
+        for symbol in symbol_matches:
+            # 알려진 심볼인지 확인
+            if symbol in coinmarketcap_service.SYMBOL_MAPPING.values():
+                # 심볼을 한국어명으로 변환
+                for korean, eng_symbol in coinmarketcap_service.SYMBOL_MAPPING.items():
+                    if eng_symbol == symbol and korean not in coin_names:
+                        coin_names.append(korean)
+                        break
+        
+        # 추가: 일반적인 코인명 패턴 체크 (예: "비트 코인", "이더 리움")
+        common_patterns = {
+            "비트 코인": "비트코인",
+            "이더 리움": "이더리움",
+            "리 플": "리플",
+            "도지 코인": "도지코인",
+            "솔 라나": "솔라나",
+            "폴카 닷": "폴카닷",
+            "체인 링크": "체인링크",
+            "유니 스왑": "유니스왑",
+            "아발란 체": "아발란체",
+            "폴리 곤": "폴리곤",
+        }
+        for spaced_name, correct_name in common_patterns.items():
+            if spaced_name in user_message and correct_name not in coin_names:
+                coin_names.append(correct_name)
+        
+    except ImportError:
+        pass
+    
+    return coin_names if coin_names else []
+
+
+def extract_date_from_message(message: str):
+    """메시지에서 날짜 추출"""
+    date_patterns = [
+        r'(\d{4})-(\d{1,2})-(\d{1,2})',
+        r'(\d{4})\.(\d{1,2})\.(\d{1,2})',
+        r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
+    ]
+    
+    for pattern in date_patterns:
+        match = re.search(pattern, message)
+        if match:
+            year, month, day = map(int, match.groups())
+            try:
+                kst = timezone(timedelta(hours=9))
+                return datetime(year, month, day, tzinfo=kst)
+            except ValueError:
+                continue
+    
+    return None
+
+
+def resolve_requested_date(message: str):
+    """메시지의 조회 날짜 (요청 날짜 또는 None, 과거 날짜 여부, 365일 제한 초과 여부)"""
+    requested_date = extract_date_from_message(message)
+    kst = timezone(timedelta(hours=9))
+    today = datetime.now(kst).date()
+    is_past_date = bool(requested_date and requested_date.date() < today)
+    
+    date_limit_exceeded = False
+    if is_past_date:
+        days_diff = (today - requested_date.date()).days
+        if days_diff > HISTORY_LIMIT_DAYS:
+            date_limit_exceeded = True
+            logger.info(f"⚠️ 365일 제한 초과: 요청 날짜가 {days_diff}일 전입니다.")
+    
+    return requested_date, is_past_date, date_limit_exceeded
+
+
+def date_limit_notice(requested_date) -> str:
+    """365일 제한 초과 안내 문구"""
+    date_str = requested_date.strftime("%Y년 %m월 %d일") if requested_date else "해당 날짜"
+    return (f"죄송합니다. 현재는 최근 365일 이내의 과거 시세만 조회할 수 있습니다.\n\n"
+            f"요청하신 날짜({date_str})는 현재로부터 365일을 초과하여 조회가 제한됩니다.\n\n"
+            f"더 오래된 과거 시세 조회 기능은 추후 지원 예정입니다. 양해 부탁드립니다.")
+
+
+def format_price_result(price_data: dict, api_source: str, date_info: str = "") -> dict:
+    """시세 API 결과를 검색 결과 형식(title, snippet, url, source, score)으로 변환"""
+    api_name = "CoinGecko" if "coingecko" in api_source else "CoinMarketCap"
+    
+    # 가격 표시 생성
+    if price_data.get('price_krw') and price_data.get('price_usd', 0) > 0:
+        price_display_str = f"💰 현재 가격: {price_data['price_krw']:,.0f}원 (${price_data['price_usd']:,.2f})"
+    elif price_data.get('price_krw'):
+        price_display_str = f"💰 현재 가격: {price_data['price_krw']:,.0f}원"
+    elif price_data.get('price_usd', 0) > 0:
+        price_display_str = f"💰 현재 가격: ${price_data['price_usd']:,.2f}"
+    else:
+        price_display_str = "💰 가격 정보 없음"
+    
+    snippet = f"{price_data['name']} ({price_data['symbol']}) 시세{date_info}:\n\n{price_display_str}"
+    
+    if price_data.get('price_change_24h') is not None:
+        snippet += f"\n📊 24시간 변동률: {price_data['price_change_24h']:+.2f}%"
+    if price_data.get('market_cap'):
+        snippet += f"\n💼 시가총액: ${price_data['market_cap']:,.0f}"
+    
+    snippet += f"\n🕐 업데이트: {price_data['last_updated']}"
+    snippet += f"\n\n출처: {api_name}"
+    
+    return {
+        "title": f"{price_data['name']} 시세{date_info} - {api_name}",
+        "snippet": snippet.strip(),
+        "url": f"https://coinmarketcap.com/currencies/{price_data['name'].lower().replace(' ', '-')}/",
+        "source": api_source,
+        "score": 0.95,
+    }
@@ -0,0 +1,134 @@
+"""
+자주 묻는 코인 시세 미리 받기 (prefetch)
+
+최근 대화 기록(MongoDB의 사용자 메시지)과 그 뒤 들어온 시세 질문에서 코인별 질문 수를 세어, 상위 코인 중
+다음 실행 전에 캐시 항목이 만료될 코인의 현재 시세만 한 번의 일괄 요청으로 받아 둡니다. 자주 묻는 코인의 시세
+질문은 외부 API를 기다리지 않고 캐시에서 바로 답할 수 있습니다. 지난 실행 뒤 시세 질문이 없었으면 요청하지 않습니다.
+
+캐시는 워커별이고 워커마다 외부 API 한도를 함께 쓰므로 기본값은 꺼짐입니다. PRICE_PREFETCH_ENABLED=true로
+켜면 각 워커에서 실행됩니다.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from . import price_lookup
+from .mongodb_client import mongodb_client
+from .price_cache import PRICE_CACHE_FRESH_SECONDS, PRICE_CACHE_MAX_AGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_ENABLED = os.getenv("PRICE_PREFETCH_ENABLED", "false").lower() == "true"
+PREFETCH_TOP_COINS = int(os.getenv("PRICE_PREFETCH_TOP_COINS", "10"))
+# 신선 기간이 끝난 뒤 최대 나이까지의 구간마다 실행하면 상위 코인의 항목은 만료되지 않고, 실행마다 다시 받는
+# 코인은 그 사이 오래된 값을 반환하던 코인뿐임
+PREFETCH_INTERVAL_SECONDS = float(os.getenv(
+    "PRICE_PREFETCH_INTERVAL", str(max(30.0, PRICE_CACHE_MAX_AGE_SECONDS - PRICE_CACHE_FRESH_SECONDS))
+))
+LOG_LOOKBACK_DAYS = int(os.getenv("PRICE_PREFETCH_LOOKBACK_DAYS", "7"))
+LOG_RELOAD_SECONDS = float(os.getenv("PRICE_PREFETCH_LOG_RELOAD", "3600"))
+LOG_MESSAGE_LIMIT = 5000
+
+# 대화 기록이 없을 때 미리 받을 코인
+DEFAULT_HOT_COINS = ("비트코인", "이더리움", "리플", "솔라나", "도지코인")
+
+
+class PricePrefetcher:
+    """코인별 질문 수를 세고 상위 코인의 현재 시세를 미리 받음"""
+
+    def __init__(self):
+        self._logged = Counter()  # 마지막으로 불러온 대화 기록의 코인별 질문 수
+        self._live = Counter()    # 그 뒤 이 워커에 들어온 질문 수
+        self._logs_loaded_at = None
+        self._asked_since_prefetch = 0
+        self.prefetches = 0
+        self.idle_skips = 0
+        self.last_prefetched = []
+
+    def record(self, coin_names):
+        """시세 질문의 코인명 기록"""
+        self._live.update(coin_names)
+        self._asked_since_prefetch += 1
+
+    def top(self, limit: int = PREFETCH_TOP_COINS) -> list:
+        """질문 수 상위 코인 (부족하면 기본 코인으로 채움)"""
+        ranked = [coin_name for coin_name, _ in (self._logged + self._live).most_common(limit)]
+        for coin_name in DEFAULT_HOT_COINS:
+            if len(ranked) >= limit:
+                break
+            if coin_name not in ranked:
+                ranked.append(coin_name)
+        return ranked
+
+    async def load_logs(self, days: int = LOG_LOOKBACK_DAYS) -> int:
+        """최근 대화 기록의 사용자 메시지에서 코인별 질문 수를 다시 집계 (집계한 메시지 수)"""
+        messages = await mongodb_client.get_recent_user_messages(datetime.utcnow() - timedelta(days=days), LOG_MESSAGE_LIMIT)
+        self._logs_loaded_at = time.monotonic()
+        if not messages:
+            return 0
+        logged = Counter()
+        for message in messages:
+            logged.update(price_lookup.extract_coin_names(message))
+        # 지금까지의 실시간 질문은 방금 불러온 기록에 포함되어 있음
+        self._logged, self._live = logged, Counter()
+        logger.info(f"시세 미리 받기 대상 집계: 메시지 {len(messages)}개, 상위 코인 {self.top()}")
+        return len(messages)
+
+    def logs_due(self) -> bool:
+        return self._logs_loaded_at is None or time.monotonic() - self._logs_loaded_at >= LOG_RELOAD_SECONDS
+
+    def due(self, within: float = PREFETCH_INTERVAL_SECONDS) -> list:
+        """상위 코인 중 within초 안에 캐시 항목이 만료되는 코인"""
+        from .coingecko import coingecko_service
+        from .coinmarketcap import coinmarketcap_service
+        return [coin_name for coin_name in self.top()
+                if all(service.current_price_expires_within(coin_name, within)
+                       for service in (coinmarketcap_service, coingecko_service))]
+
+    async def prefetch_once(self, within: float = PREFETCH_INTERVAL_SECONDS) -> int:
+        """지난 실행 뒤 시세 질문이 있었으면 만료가 가까운 상위 코인의 현재 시세를 일괄 조회 (시세를 받은 코인 수)"""
+        if not self._asked_since_prefetch:
+            self.idle_skips += 1
+            return 0
+        self._asked_since_prefetch = 0
+        coin_names = self.due(within)
+        if not coin_names:
+            return 0
+        found = await price_lookup.get_current_prices(coin_names)
+        self.prefetches += 1
+        self.last_prefetched = coin_names
+        logger.debug(f"시세 미리 받기: {len(found)}/{len(coin_names)}개 코인")
+        return len(found)
+
+    async def run_loop(self, interval: float = PREFETCH_INTERVAL_SECONDS):
+        """주기적으로 대화 기록을 다시 집계하고 상위 코인 시세를 미리 받는 백그라운드 작업"""
+        if not PREFETCH_ENABLED:
+            return
+        while True:
+            try:
+                if self.logs_due():
+                    await self.load_logs()
+                await self.prefetch_once(interval)
+            except Exception as e:
+                logger.warning(f"시세 미리 받기 실패: {e}")
+            await asyncio.sleep(interval)
+
+    def snapshot(self) -> dict:
+        """관리자 API용 상태"""
+        from .coingecko import CoinGeckoService
+        from .coinmarketcap import CoinMarketCapService
+        return {
+            "top_coins": self.top(),
+            "enabled": PREFETCH_ENABLED,
+            "interval_seconds": PREFETCH_INTERVAL_SECONDS,
+            "prefetches": self.prefetches,
+            "idle_skips": self.idle_skips,
+            "last_prefetched": self.last_prefetched,
+            "caches": {cache.name: cache.stats() for cache in (CoinMarketCapService._cache, CoinGeckoService._cache)},
+        }
+
+
+price_prefetcher = PricePrefetcher()
@@ -0,0 +1,52 @@
+"""
+이벤트 루프별 공유 HTTP 클라이언트
+
+탐색기 API(src/services/http_client.py)와 시세 API(price_http.py)는 요청마다 클라이언트를 새로 만들지 않고 워커
+(이벤트 루프)마다 하나의 keep-alive 클라이언트를 함께 사용합니다. httpx 클라이언트의 연결은 만든 이벤트 루프에
+묶이므로, 다른 루프에서 쓰거나 닫힌 뒤에는 새로 만듭니다. 벤치마크와 테스트는 set_transport_factory()로 실제
+네트워크 대신 로컬 스텁 서버나 MockTransport를 연결할 수 있습니다.
+"""
+import asyncio
+from typing import Callable, Optional
+
+import httpx
+
+TransportFactory = Callable[[], httpx.AsyncBaseTransport]
+
+
+class SharedClient:
+    """client_factory(transport_factory)로 만든 클라이언트를 현재 이벤트 루프에서 함께 사용"""
+
+    def __init__(self, client_factory: Callable[[Optional[TransportFactory]], httpx.AsyncClient]):
+        self._client_factory = client_factory
+        self._transport_factory: Optional[TransportFactory] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop = None
+
+    @property
+    def current(self) -> Optional[httpx.AsyncClient]:
+        """지금 공유 중인 클라이언트 (아직 만들지 않았으면 None)"""
+        return self._client
+
+    def set_transport_factory(self, factory: Optional[TransportFactory]):
+        """클라이언트가 사용할 transport를 만드는 함수 지정 (None이면 기본 네트워크 transport). 공유 클라이언트는 새로 만듦"""
+        self._transport_factory = factory
+        self._client = None
+
+    def create(self) -> httpx.AsyncClient:
+        """공유하지 않는 새 클라이언트 (호출한 쪽에서 닫아야 함)"""
+        return self._client_factory(self._transport_factory)
+
+    def get(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 공유 클라이언트 (없거나 닫혔으면 새로 만듦)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self.create()
+            self._loop = loop
+        return self._client
+
+    async def aclose(self):
+        """종료 시 공유 클라이언트의 연결을 닫음"""
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
@@ -0,0 +1,64 @@
+"""
+동시 요청 병합 (single-flight)
+
+같은 키로 동시에 들어온 호출은 진행 중인 하나의 작업을 함께 기다립니다. 캐시는 작업이 끝난 뒤에야 채워지므로,
+그 사이에 들어온 중복 호출(더블 클릭, 웹 UI와 챗봇의 동시 조회 등)이 외부 API를 다시 호출하지 않도록 막습니다.
+기다리던 호출자가 모두 취소되면 작업도 취소됩니다.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """키별로 진행 중인 작업을 공유"""
+
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """key로 진행 중인 작업이 있으면 그 결과를 기다리고, 없으면 fn(*args, **kwargs)를 실행"""
+        self.calls += 1
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            logger.debug(f"[{self.name}] 진행 중인 요청에 합류: {key}")
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # 한 호출자의 취소가 다른 호출자의 결과까지 취소하지 않도록 shield
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._tasks.get(key) is task and self._waiters[key] == 1 and not task.done():
+                # 마지막 호출자가 취소되면 작업도 취소하고, 이후 호출은 새 작업을 시작하도록 즉시 제거
+                del self._tasks[key]
+                del self._waiters[key]
+                task.cancel()
+            raise
+        finally:
+            if self._tasks.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            self._waiters.pop(key, None)
+        # 기다리는 호출자가 없을 때 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def stats(self) -> dict:
+        return {"in_flight": len(self._tasks), "calls": self.calls, "coalesced": self.coalesced}
@@ -17,8 +17,10 @@ from dotenv import load_dotenv
 # 상대 경로 import를 위해 현재 디렉토리 확인
 try:
     from .configuration import config
+    from .single_flight import SingleFlight
 except ImportError:
     from chatbot.configuration import config
+    from chatbot.single_flight import SingleFlight
 
 load_dotenv()
 
@@ -36,6 +38,8 @@ class VectorStore:
         self.collection = None
         self.openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.embedding_model = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+        # 같은 질의의 동시 검색(FAQ 하이브리드 검색과 DB 확인 노드 등)은 임베딩 요청 하나를 공유
+        self._embedding_requests = SingleFlight("embedding")
         
     async def connect(self):
         """MongoDB 연결"""
@@ -153,7 +157,10 @@ class VectorStore:
         return chunks
     
     async def create_embedding(self, text: str) -> List[float]:
-        """텍스트 임베딩 생성"""
+        """텍스트 임베딩 생성 (같은 텍스트의 동시 요청은 하나로 합침)"""
+        return await self._embedding_requests.do(text, self._create_embedding, text)
+    
+    async def _create_embedding(self, text: str) -> List[float]:
         try:
             response = await self.openai_client.embeddings.create(
                 model=self.embedding_model,
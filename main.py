@@ -31,8 +31,12 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from langchain_core.messages import HumanMessage, AIMessage
 from langsmith import traceable
 
-from src.services.transaction_service import detect_transaction
-from src.services.chain_configs import get_chain_configs
+from src.services.chain_registry import chain_registry
+from src.services.chain_stats import chain_stats
+from src.services.tx_archive import tx_archive
+from src.services.tx_watcher import tx_watcher
+from src.services import http_client
+from src.services.connection_prewarm import run_prewarm_loop
 from src.services.admin_service import verify_admin_password, is_admin_authenticated, require_admin_auth
 from src.routers.blog import register_blog_routes
 from src.routers.admin import register_admin_routes
@@ -43,6 +47,9 @@ from src.routers.utility import register_utility_routes
 
 from chatbot import mongodb_client, get_chatbot_graph, vector_store, config
 from chatbot.models import get_default_chat_state
+from chatbot.price_prefetch import price_prefetcher
+from chatbot.cmc_id_map import cmc_id_map
+from chatbot import price_http
 
 load_dotenv()
 
@@ -196,7 +203,6 @@ else:
         except Exception as e:
             logger.error(f"❌ 대체 경로 마운트도 실패: {e}")
 
-CHAIN_CONFIGS = get_chain_configs()
 
 # --- Startup Event ---
 @app.on_event("startup")
@@ -238,6 +244,8 @@ async def startup_event():
                     default_password = os.getenv("ADMIN_PASSWORD", "admin123")
                     await mongodb_client.initialize_admin_password(default_password)
                     logger.info("✅ MongoDB 연결 성공!")
+                    await chain_stats.load()
+                    await tx_archive.ensure_indexes()
                 else:
                     logger.warning("MongoDB 연결 실패")
             except Exception as e:
@@ -256,20 +264,30 @@ async def startup_event():
         except Exception as e:
             logger.error(f"데이터베이스 연결 중 오류: {e}", exc_info=True)
 
+        # 누적 적중률 통계를 불러온 뒤 상위 체인의 탐색기 호스트로 연결을 미리 맺음
+        asyncio.create_task(run_prewarm_loop())
+        # 대화 기록에서 자주 묻는 코인을 집계해 시세를 미리 받아 둠
+        asyncio.create_task(price_prefetcher.run_loop())
+        # 과거 시세 조회용 코인마켓캡 ID 맵 (저장된 맵을 불러오고 하루마다 갱신)
+        asyncio.create_task(cmc_id_map.run_refresh_loop())
+
     asyncio.create_task(connect_databases())
+    asyncio.create_task(chain_stats.run_persistence_loop())
+    asyncio.create_task(tx_archive.run_retention_loop())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 MongoDB 연결 해제"""
     logger.info("애플리케이션 종료 중...")
+    await tx_watcher.stop()
+    await chain_stats.flush()
+    await tx_archive.drain()
+    await http_client.aclose()
+    await price_http.aclose()
     await mongodb_client.disconnect()
     await vector_store.disconnect()
     logger.info("MongoDB 연결 해제 완료")
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "timestamp": time.time()}
-
 # --- 라우터 등록 ---
 register_blog_routes(app, templates)
 register_admin_routes(app, templates)
@@ -281,37 +299,12 @@ register_utility_routes(app)
 # --- 페이지 라우트 ---
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    excluded_chains = ["litecoin", "dogecoin"]
-    supported_chains = [{ "name": config["name"], "symbol": config["symbol"] } for key, config in CHAIN_CONFIGS.items() if "name" in config and key not in excluded_chains]
-    return templates.TemplateResponse("pages/explorer_ui.html", {"request": request, "supported_chains": supported_chains})
+    return templates.TemplateResponse("pages/explorer_ui.html", {"request": request, "supported_chains": chain_registry.home_chains})
 
 @app.get("/stk", response_class=HTMLResponse)
 async def staking_calculator(request: Request):
     return templates.TemplateResponse("features/staking_calculator.html", {"request": request})
 
-@app.get("/api/tx/{txid}")
-async def get_transaction(txid: str):
-    results = await detect_transaction(txid)
-    if results:
-        return JSONResponse(content={"found": True, "results": results})
-    else:
-        return JSONResponse(content={"found": False, "message": "Transaction not found on supported chains."})
-
-@app.get("/api/chains")
-async def get_chains():
-    configs = get_chain_configs()
-    supported_chains = []
-    for key, config in configs.items():
-        if key == "avalanche_henesys_subnet":
-            continue
-        else:
-            supported_chains.append({
-                "name": config["name"], 
-                "symbol": config["symbol"],
-                "explorer": config["explorer"].replace("/tx/", "/")
-            })
-    return JSONResponse(content={"supportedChains": supported_chains})
-
 # --- 기타 페이지 ---
 # /bithumb-test 라우트는 src/routers/pages.py에서 처리됨 (X-Robots-Tag 헤더 포함)
 
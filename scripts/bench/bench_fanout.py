@@ -0,0 +1,192 @@
+"""
+트랜잭션 조회(fan-out) 벤치마크
+
+explorer_stub.py 스텁 서버를 대상으로 lookup_transaction을 동시성 단계별로 실행하고
+처리량(lookups/sec), p50/p95/p99 지연 시간, 사용한 소켓 수를 보고합니다. 네트워크가 필요 없으므로
+조회 순서, 캐시, 연결 풀 변경의 성능 회귀를 CI에서 확인할 수 있습니다.
+
+사용법:
+    python scripts/bench/bench_fanout.py --spawn-stub --concurrency 1,8,32 --lookups 200
+    python scripts/bench/bench_fanout.py --stub-url http://127.0.0.1:8765 --json
+    python scripts/bench/bench_fanout.py --spawn-stub --max-p95-ms 2500 --min-throughput 20  (기준 미달 시 종료 코드 1)
+    python scripts/bench/bench_fanout.py --spawn-stub --no-keepalive  (조회마다 새 연결: sockets_opened 비교)
+
+--spawn-stub 이후의 스텁 옵션은 --stub-arg로 전달합니다. 예: --stub-arg=--rate-429 --stub-arg=0.02
+"""
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# 프로젝트 루트 경로 추가
+ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.services import http_client
+from src.services.cache import cache, negative_cache, chain_miss_cache
+from src.services.rate_limiter import rate_limiter
+from src.services.transaction_service import lookup_transaction
+
+from explorer_stub import StubRoutingTransport
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def random_txid(kind: str) -> str:
+    if kind == "evm":
+        return "0x" + secrets.token_hex(32)
+    if kind == "hex":
+        return secrets.token_hex(32)
+    if kind == "solana":
+        return "".join(secrets.choice(BASE58_ALPHABET) for _ in range(87))
+    raise ValueError(f"unknown txid kind: {kind}")
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def stub_request(stub_url: str, path: str) -> dict:
+    async with httpx.AsyncClient(base_url=stub_url) as client:
+        response = await client.get(path)
+        response.raise_for_status()
+        return response.json()
+
+
+async def run_level(stub_url: str, concurrency: int, lookups: int, kinds, repeat_ratio: float) -> dict:
+    """동시성 한 단계 실행. 단계마다 캐시와 스텁 통계를 초기화"""
+    for c in (cache, negative_cache, chain_miss_cache):
+        c.clear()
+    await stub_request(stub_url, "/__reset")
+
+    txids = [random_txid(kinds[index % len(kinds)]) for index in range(lookups)]
+    # repeat_ratio만큼은 이미 조회한 txid를 다시 조회 (캐시 효과 측정)
+    for index in range(1, lookups):
+        if secrets.randbelow(1000) < repeat_ratio * 1000:
+            txids[index] = txids[secrets.randbelow(index)]
+
+    latencies = []
+    found = 0
+    position = 0
+
+    async def worker():
+        nonlocal found, position
+        while position < len(txids):
+            txid = txids[position]
+            position += 1
+            started = time.perf_counter()
+            lookup = await lookup_transaction(txid)
+            latencies.append(time.perf_counter() - started)
+            found += 1 if lookup["results"] else 0
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stats = await stub_request(stub_url, "/__stats")
+    return {
+        "concurrency": concurrency,
+        "lookups": lookups,
+        "found": found,
+        "elapsed_s": round(elapsed, 3),
+        "lookups_per_s": round(lookups / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "upstream_requests": stats["requests"],
+        "sockets_opened": stats["connections"],
+        "peak_sockets": stats["peak_connections"],
+        "stub_outcomes": stats["by_outcome"],
+    }
+
+
+async def wait_for_stub(stub_url: str, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await stub_request(stub_url, "/__stats")
+            return
+        except httpx.HTTPError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+def print_table(rows):
+    columns = ["concurrency", "lookups", "found", "lookups_per_s", "p50_ms", "p95_ms", "p99_ms",
+               "upstream_requests", "sockets_opened", "peak_sockets"]
+    print("  ".join(f"{column:>17}" for column in columns))
+    for row in rows:
+        print("  ".join(f"{row[column]:>17}" for column in columns))
+
+
+async def main_async(args) -> int:
+    stub_process = None
+    if args.spawn_stub:
+        stub_process = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve().parent / "explorer_stub.py"), "serve", "--port", str(args.stub_port), *args.stub_arg],
+            stdout=subprocess.DEVNULL,
+        )
+        args.stub_url = f"http://127.0.0.1:{args.stub_port}"
+    try:
+        await wait_for_stub(args.stub_url)
+        http_client.set_transport_factory(lambda: StubRoutingTransport(args.stub_url))
+        http_client.KEEPALIVE_ENABLED = not args.no_keepalive
+        rate_limiter.enabled = args.with_rate_limits
+
+        rows = []
+        for concurrency in [int(value) for value in args.concurrency.split(",")]:
+            rows.append(await run_level(args.stub_url, concurrency, args.lookups, args.kinds.split(","), args.repeat_ratio))
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            print_table(rows)
+
+        failures = []
+        for row in rows:
+            if args.max_p95_ms and row["p95_ms"] > args.max_p95_ms:
+                failures.append(f"concurrency {row['concurrency']}: p95 {row['p95_ms']}ms > {args.max_p95_ms}ms")
+            if args.min_throughput and row["lookups_per_s"] < args.min_throughput:
+                failures.append(f"concurrency {row['concurrency']}: {row['lookups_per_s']} lookups/s < {args.min_throughput}")
+        for failure in failures:
+            print(f"FAIL {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    finally:
+        http_client.set_transport_factory(None)
+        if stub_process:
+            stub_process.terminate()
+            stub_process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트랜잭션 조회 fan-out 벤치마크")
+    parser.add_argument("--stub-url", default="http://127.0.0.1:8765")
+    parser.add_argument("--spawn-stub", action="store_true", help="스텁 서버를 하위 프로세스로 실행")
+    parser.add_argument("--stub-port", type=int, default=8765)
+    parser.add_argument("--stub-arg", action="append", default=[], help="스텁 서버에 전달할 인자 (반복 가능)")
+    parser.add_argument("--concurrency", default="1,8,32", help="동시성 단계 (쉼표 구분)")
+    parser.add_argument("--lookups", type=int, default=100, help="단계별 조회 수")
+    parser.add_argument("--kinds", default="evm,hex", help="txid 형식 (evm, hex, solana)")
+    parser.add_argument("--repeat-ratio", type=float, default=0.0, help="이미 조회한 txid를 다시 조회하는 비율")
+    parser.add_argument("--with-rate-limits", action="store_true", help="공급자별 요청 한도 적용 (기본은 해제)")
+    parser.add_argument("--no-keepalive", action="store_true", help="조회마다 클라이언트를 새로 만듦 (공유 연결 풀과 비교용)")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--max-p95-ms", type=float)
+    parser.add_argument("--min-throughput", type=float)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("OPENAI_API_KEY", "bench")  # chatbot 패키지 import 시 필요
+    main()
@@ -0,0 +1,347 @@
+"""
+탐색기 API 스텁 서버 (오프라인 벤치마크용)
+
+CHAIN_CONFIGS의 모든 체인 요청을 하나의 로컬 서버가 받아 체인별로 기록된 응답을 재생합니다.
+요청은 StubRoutingTransport가 원래 URL을 X-Original-URL 헤더에 담아 이 서버로 보내며, 서버는 URL 접두사로
+체인을 구분합니다. 지연 시간과 404/429/500, 느린 본문, 타임아웃 비율은 체인별로 설정할 수 있습니다.
+
+사용법:
+    python scripts/bench/explorer_stub.py serve --port 8765 --latency-ms 80 --jitter-ms 40 --rate-429 0.02
+    python scripts/bench/explorer_stub.py serve --profile profile.json
+    python scripts/bench/explorer_stub.py record <txid> [<txid> ...] --out recorded_responses.json  (실제 탐색기 호출)
+
+프로필 JSON 형식:
+    {"default": {"latency_ms": 80, "rate_429": 0.01}, "chains": {"tron": {"latency_ms": 400, "rate_timeout": 0.05}}}
+
+통계: GET /__stats (연결 수, 최대 동시 연결 수, 요청 수), POST /__reset
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import sys
+from pathlib import Path
+
+import httpx
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.services import http_client
+from src.services.chain_registry import chain_registry
+
+DEFAULT_RECORDINGS = Path(__file__).resolve().parent / "recorded_responses.json"
+TXID_MARKER = "__TXID__"
+TXID_PATTERN = re.compile(r"(?:0x)?[0-9a-fA-F]{64}|[1-9A-HJ-NP-Za-km-z]{80,90}")
+ORIGINAL_URL_HEADER = "X-Original-URL"
+
+DEFAULT_BEHAVIOR = {
+    "latency_ms": 50.0,      # 기본 지연 시간
+    "jitter_ms": 25.0,       # 지수 분포 추가 지연의 평균 (꼬리 지연 재현)
+    "rate_404": 0.0,         # 트랜잭션이 있어도 404로 응답하는 비율
+    "rate_429": 0.0,
+    "rate_500": 0.0,
+    "rate_slow_body": 0.0,   # 헤더를 보낸 뒤 본문을 천천히 보내는 비율
+    "slow_body_seconds": 3.0,
+    "rate_timeout": 0.0,     # 응답하지 않고 hang_seconds 후 연결을 끊는 비율
+    "hang_seconds": 35.0,
+}
+
+
+def chain_url_prefixes():
+    """
+    체인별 요청 URL 접두사 (txid 앞부분까지). 가장 긴 접두사가 먼저 오도록 정렬.
+    대체 공급자는 경로 키("체인@공급자")로 구분하므로 --behaviors에서 공급자별로 장애를 재현할 수 있습니다.
+    """
+    prefixes = []
+    for routes in chain_registry.routes.values():
+        for route in routes:
+            template = chain_registry.request_templates[route.key]
+            urls = template.rpc_url or route.cfg["api"](TXID_MARKER)
+            for url in urls if isinstance(urls, list) else [urls]:
+                prefixes.append((url.split(TXID_MARKER)[0], route.key))
+    return sorted(prefixes, key=lambda item: len(item[0]), reverse=True)
+
+
+def match_chain(url: str, prefixes):
+    for prefix, key in prefixes:
+        if url.startswith(prefix):
+            return key
+    return None
+
+
+def is_hit(txid: str, hit_ratio: float) -> bool:
+    """txid 해시로 적중 여부를 결정 (같은 txid는 항상 같은 결과)"""
+    if not txid:
+        return False
+    return int(hashlib.md5(txid.encode()).hexdigest()[:8], 16) / 0xFFFFFFFF < hit_ratio
+
+
+class ExplorerStub:
+    """asyncio.start_server 기반 HTTP/1.1 스텁 서버 (keep-alive 지원)"""
+
+    def __init__(self, recordings: dict, behaviors: dict, hit_chains, hit_ratio: float, seed: int = None):
+        self.recordings = recordings
+        self.default_behavior = {**DEFAULT_BEHAVIOR, **behaviors.get("default", {})}
+        self.chain_behaviors = behaviors.get("chains", {})
+        self.hit_chains = set(hit_chains)
+        self.hit_ratio = hit_ratio
+        self.prefixes = chain_url_prefixes()
+        self.random = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.connections = 0
+        self.open_connections = 0
+        self.peak_connections = 0
+        self.requests = 0
+        self.by_chain = {}
+        self.by_outcome = {}
+
+    def stats(self) -> dict:
+        return {
+            "connections": self.connections,
+            "open_connections": self.open_connections,
+            "peak_connections": self.peak_connections,
+            "requests": self.requests,
+            "by_chain": self.by_chain,
+            "by_outcome": self.by_outcome,
+        }
+
+    def behavior(self, chain: str) -> dict:
+        return {**self.default_behavior, **self.chain_behaviors.get(chain, {})}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        self.open_connections += 1
+        self.peak_connections = max(self.peak_connections, self.open_connections)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = lines[0].split(" ", 2)
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0") or 0))
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if not await self.handle_request(method, target, headers, body, writer):
+                    break
+                if not keep_alive:
+                    break
+        finally:
+            self.open_connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, method: str, target: str, headers: dict, body: bytes, writer) -> bool:
+        """요청 하나를 처리. 연결을 계속 쓸 수 없으면 False"""
+        if target == "/__stats":
+            await self.write_response(writer, 200, self.stats())
+            return True
+        if target == "/__reset":
+            self.reset()
+            await self.write_response(writer, 200, {"reset": True})
+            return True
+
+        self.requests += 1
+        url = headers.get(ORIGINAL_URL_HEADER.lower(), target)
+        chain = match_chain(url, self.prefixes) or "unknown"
+        self.by_chain[chain] = self.by_chain.get(chain, 0) + 1
+        behavior = self.behavior(chain)
+
+        latency_ms = behavior["latency_ms"]
+        if behavior["jitter_ms"]:
+            latency_ms += self.random.expovariate(1 / behavior["jitter_ms"])
+        await asyncio.sleep(latency_ms / 1000)
+
+        roll = self.random.random()
+        for outcome, status in (("rate_timeout", None), ("rate_429", 429), ("rate_500", 500), ("rate_404", 404)):
+            if roll < behavior[outcome]:
+                self.count(outcome)
+                if status is None:
+                    await asyncio.sleep(behavior["hang_seconds"])
+                    return False
+                await self.write_response(writer, status, {"error": outcome}, extra_headers={"Retry-After": "1"} if status == 429 else None)
+                return True
+            roll -= behavior[outcome]
+
+        payload = self.respond(chain, url, body)
+        slow = self.random.random() < behavior["rate_slow_body"]
+        self.count("slow_body" if slow else "ok")
+        await self.write_response(writer, payload[0], payload[1], slow_seconds=behavior["slow_body_seconds"] if slow else 0)
+        return True
+
+    def count(self, outcome: str):
+        self.by_outcome[outcome] = self.by_outcome.get(outcome, 0) + 1
+
+    def respond(self, chain: str, url: str, body: bytes):
+        """기록된 응답 재생 (적중이 아니면 체인 형식에 맞는 "없음" 응답)"""
+        rpc_request = json.loads(body) if body else None
+        if isinstance(rpc_request, list):  # JSON-RPC 배치
+            return 200, [self.respond_rpc(chain, item) for item in rpc_request]
+        if isinstance(rpc_request, dict):
+            return 200, self.respond_rpc(chain, rpc_request)
+        match = TXID_PATTERN.search(url)
+        txid = match.group(0) if match else ""
+        recorded = self.recorded(chain, txid)
+        if recorded is None:
+            return 404, {"error": "not found"}
+        return recorded["status"], recorded["body"]
+
+    def respond_rpc(self, chain: str, request: dict):
+        method = request.get("method")
+        if method == "eth_blockNumber":
+            latest_block = self.recordings.get(chain, {}).get("latest_block", "0x0")
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": latest_block}
+        params = request.get("params") or [""]
+        txid = params[0] if isinstance(params[0], str) else ""
+        recorded = self.recorded(chain, txid, method)
+        if recorded is None:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "result": None}
+        return {**recorded["body"], "id": request.get("id")}
+
+    def recorded(self, chain: str, txid: str, rpc_method: str = None):
+        """기록된 응답. rpc_method가 기록의 "rpc"에 있으면 그 메서드의 응답 (예: eth_getTransactionReceipt)"""
+        if chain not in self.hit_chains or chain not in self.recordings or not is_hit(txid, self.hit_ratio):
+            return None
+        recording = self.recordings[chain]
+        body = recording.get("rpc", {}).get(rpc_method, recording["body"])
+        return {"status": recording["status"], "body": json.loads(json.dumps(body).replace("{txid}", txid))}
+
+    async def write_response(self, writer, status: int, payload, extra_headers: dict = None, slow_seconds: float = 0):
+        data = json.dumps(payload).encode()
+        reason = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}.get(status, "OK")
+        head = [f"HTTP/1.1 {status} {reason}", "Content-Type: application/json", f"Content-Length: {len(data)}"]
+        head += [f"{name}: {value}" for name, value in (extra_headers or {}).items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode())
+        if slow_seconds and len(data) > 1:
+            # 본문을 10조각으로 나눠 천천히 전송
+            chunk = max(1, len(data) // 10)
+            for start in range(0, len(data), chunk):
+                writer.write(data[start:start + chunk])
+                await writer.drain()
+                await asyncio.sleep(slow_seconds / 10)
+        else:
+            writer.write(data)
+        await writer.drain()
+
+
+class StubRoutingTransport(httpx.AsyncBaseTransport):
+    """모든 탐색기 요청을 스텁 서버로 보내는 transport (원래 URL은 헤더로 전달)"""
+
+    def __init__(self, stub_url: str):
+        self._stub = httpx.URL(stub_url)
+        self._transport = httpx.AsyncHTTPTransport(verify=http_client.explorer_ssl_context(), limits=http_client.explorer_limits())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.headers[ORIGINAL_URL_HEADER] = str(request.url)
+        request.url = request.url.copy_with(scheme=self._stub.scheme, host=self._stub.host, port=self._stub.port)
+        request.headers["Host"] = f"{self._stub.host}:{self._stub.port}"
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제 탐색기 응답 중 정상(200) 응답을 체인별로 기록"""
+
+    def __init__(self, recordings: dict, prefixes):
+        self._transport = httpx.AsyncHTTPTransport()
+        self._recordings = recordings
+        self._prefixes = prefixes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        await response.aread()
+        chain = match_chain(str(request.url), self._prefixes)
+        if chain and response.status_code == 200:
+            try:
+                self._recordings.setdefault(chain, []).append({"status": 200, "body": response.json()})
+            except ValueError:
+                pass
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+async def serve(args):
+    recordings = json.loads(Path(args.recordings).read_text())
+    behaviors = json.loads(Path(args.profile).read_text()) if args.profile else {}
+    defaults = behaviors.setdefault("default", {})
+    for name in DEFAULT_BEHAVIOR:
+        value = getattr(args, name, None)
+        if value is not None:
+            defaults[name] = value
+    stub = ExplorerStub(recordings, behaviors, args.hit_chains.split(","), args.hit_ratio, seed=args.seed)
+    server = await asyncio.start_server(stub.handle_connection, args.host, args.port, backlog=1024)
+    print(f"explorer stub listening on http://{args.host}:{args.port} ({len(stub.prefixes)} chain routes)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+async def record(args):
+    """실제 탐색기에서 txid들을 조회해 찾은 체인의 응답을 기록 (txid 부분은 {txid}로 치환)"""
+    from src.services import http_client
+    from src.services.transaction_service import lookup_transaction
+
+    captured = {}
+    prefixes = chain_url_prefixes()
+    http_client.set_transport_factory(lambda: RecordingTransport(captured, prefixes))
+    recordings = json.loads(Path(args.out).read_text()) if Path(args.out).exists() else {}
+    for txid in args.txids:
+        captured.clear()
+        lookup = await lookup_transaction(txid)
+        for result in lookup["results"]:
+            for response in captured.get(result["chain"], []):
+                body = json.dumps(response["body"]).replace(result["txid"], "{txid}")
+                recordings[result["chain"]] = {"status": 200, "body": json.loads(body)}
+                print(f"recorded {result['chain']}")
+    Path(args.out).write_text(json.dumps(recordings, indent=2, ensure_ascii=False) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="탐색기 API 스텁 서버")
+    subparsers = parser.add_subparsers(dest="command")
+
+    serve_parser = subparsers.add_parser("serve", help="스텁 서버 실행 (기본)")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--recordings", default=str(DEFAULT_RECORDINGS))
+    serve_parser.add_argument("--profile", help="체인별 지연/오류 설정 JSON 파일")
+    serve_parser.add_argument("--hit-chains", default="ethereum,bitcoin,tron", help="기록된 응답을 돌려줄 체인 (쉼표 구분)")
+    serve_parser.add_argument("--hit-ratio", type=float, default=0.8, help="기록된 응답을 돌려줄 txid 비율")
+    serve_parser.add_argument("--seed", type=int)
+    for name, value in DEFAULT_BEHAVIOR.items():
+        serve_parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=float, help=f"기본값 {value}")
+
+    record_parser = subparsers.add_parser("record", help="실제 탐색기 응답 기록")
+    record_parser.add_argument("txids", nargs="+")
+    record_parser.add_argument("--out", default=str(DEFAULT_RECORDINGS))
+
+    args = parser.parse_args()
+    if args.command == "record":
+        asyncio.run(record(args))
+    else:
+        if args.command is None:
+            args = serve_parser.parse_args([])
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
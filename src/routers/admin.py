@@ -6,7 +6,19 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
 from chatbot import mongodb_client
+from chatbot.price_prefetch import price_prefetcher
+from chatbot.cmc_id_map import cmc_id_map
 from src.services.admin_service import verify_admin_password, is_admin_authenticated, require_admin_auth
+from src.services.chain_stats import chain_stats, STAGE1_SIZE, STAGE1_DEADLINE_SECONDS
+from src.services.cache import cache_stats
+from src.services.rate_limiter import rate_limiter
+from src.services.tx_watcher import tx_watcher
+from src.services.transaction_service import hedge_stats
+from src.services.tx_archive import tx_archive
+from src.services.api_key_pool import api_key_pools
+from src.services.provider_router import provider_router
+from src.services.response_reader import response_stats
+from src.services import http_client
 import logging
 import bcrypt
 import os
@@ -205,6 +217,60 @@ def register_admin_routes(app, templates: Jinja2Templates):
                 content={"success": False, "message": "서버 오류가 발생했습니다."}
             )
     
+    # API - Chain Lookup Stats
+    @app.get("/api/admin/chains/stats")
+    async def get_chain_lookup_stats(request: Request):
+        """체인별 트랜잭션 조회 적중률/지연 시간 통계 API"""
+        try:
+            if not is_admin_authenticated(request):
+                return JSONResponse(
+                    status_code=401,
+                    content={"success": False, "message": "인증이 필요합니다."}
+                )
+            return JSONResponse(content={
+                "success": True,
+                "stage1_size": STAGE1_SIZE,
+                "stage1_deadline_seconds": STAGE1_DEADLINE_SECONDS,
+                "stats": chain_stats.snapshot(),
+                "cache": cache_stats(),
+                "rate_limits": rate_limiter.snapshot(),
+                "pending_watcher": tx_watcher.snapshot(),
+                "hedging": dict(hedge_stats),
+                "archive": tx_archive.snapshot(),
+                "api_keys": api_key_pools.snapshot(),
+                "providers": provider_router.snapshot(),
+                "responses": dict(response_stats),
+                "connections": http_client.snapshot()
+            })
+        except Exception as e:
+            logger.error(f"체인 조회 통계 API 오류: {e}", exc_info=True)
+            return JSONResponse(
+                status_code=500,
+                content={"success": False, "message": "서버 오류가 발생했습니다."}
+            )
+    
+    # API - Price Stats
+    @app.get("/api/admin/prices/stats")
+    async def get_price_stats(request: Request):
+        """시세 캐시, 미리 받기, 코인마켓캡 ID 맵 상태 API"""
+        try:
+            if not is_admin_authenticated(request):
+                return JSONResponse(
+                    status_code=401,
+                    content={"success": False, "message": "인증이 필요합니다."}
+                )
+            return JSONResponse(content={
+                "success": True,
+                "prices": price_prefetcher.snapshot(),
+                "coin_id_map": cmc_id_map.snapshot()
+            })
+        except Exception as e:
+            logger.error(f"시세 통계 API 오류: {e}", exc_info=True)
+            return JSONResponse(
+                status_code=500,
+                content={"success": False, "message": "서버 오류가 발생했습니다."}
+            )
+    
     @app.get("/api/admin/chat/content-stats")
     async def get_chat_content_stats(request: Request):
         """채팅 내용 분석 통계 API (AI 분석 포함)"""
@@ -2,12 +2,20 @@
 API 라우터 (트랜잭션, 체인, 연락처 등)
 """
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
-from src.services.transaction_service import detect_transaction
-from src.services.chain_configs import get_chain_configs
+from src.services.transaction_service import (
+    transaction_response, iter_transaction_results, iter_batch_transaction_results, chains_with_outcome,
+    LOOKUP_UNAVAILABLE, LOOKUP_RATE_LIMITED, BATCH_MAX_TXIDS
+)
+from src.services.chain_registry import chain_registry
+from src.services.tx_watcher import tx_watcher
+from src.services.http_caching import (
+    conditional_response, tx_cache_control, CHAINS_MAX_AGE, CHAINS_STALE_WHILE_REVALIDATE
+)
 from chatbot import mongodb_client
+import asyncio
 import logging
 import httpx
 import json
@@ -19,35 +27,146 @@ from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
+WATCH_KEEPALIVE_SECONDS = 15
+
 router = APIRouter(prefix="/api", tags=["api"])
 
 def register_api_routes(app, templates: Jinja2Templates):
     """API 라우트를 FastAPI 앱에 등록"""
     
     @app.get("/api/tx/{txid}")
-    async def get_transaction(txid: str):
-        """트랜잭션 조회 API"""
-        results = await detect_transaction(txid)
-        if results:
-            return JSONResponse(content={"found": True, "results": results})
-        else:
-            return JSONResponse(content={"found": False, "message": "Transaction not found on supported chains."})
+    async def get_transaction(txid: str, request: Request):
+        """트랜잭션 조회 API (상태별 Cache-Control, ETag가 같으면 304)"""
+        content = await transaction_response(txid)
+        response = JSONResponse(content=content, headers={"Cache-Control": tx_cache_control(content)})
+        return conditional_response(request, response)
+    
+    @app.get("/api/tx/{txid}/stream")
+    async def stream_transaction(txid: str, first_match: bool = False):
+        """
+        트랜잭션 조회 스트리밍 API (Server-Sent Events)
+        체인별 결과를 응답이 오는 즉시 전송하며, first_match=true이면 첫 결과 이후 나머지 요청을 취소
+        """
+        async def generate_stream():
+            found_count = 0
+            outcomes = {}
+            try:
+                yield f"data: {json.dumps({'type': 'start', 'txid': txid})}\n\n"
+                async for result in iter_transaction_results(txid, first_match=first_match, outcomes=outcomes):
+                    found_count += 1
+                    yield f"data: {json.dumps({'type': 'result', 'result': result})}\n\n"
+                done_event = {'type': 'done', 'found': found_count > 0, 'count': found_count}
+                unavailable = chains_with_outcome(outcomes, LOOKUP_UNAVAILABLE)
+                if unavailable:
+                    done_event['unavailableChains'] = unavailable
+                rate_limited = chains_with_outcome(outcomes, LOOKUP_RATE_LIMITED)
+                if rate_limited:
+                    done_event['rateLimitedChains'] = rate_limited
+                if tx_watcher.is_watching(txid):
+                    done_event['watch'] = f"/api/tx/{txid}/watch"
+                yield f"data: {json.dumps(done_event)}\n\n"
+            except Exception as e:
+                logger.error(f"트랜잭션 스트리밍 조회 오류: {e}", exc_info=True)
+                yield f"data: {json.dumps({'type': 'error', 'message': 'Transaction lookup failed.'})}\n\n"
+
+        return StreamingResponse(
+            generate_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
+    @app.get("/api/tx/{txid}/watch")
+    async def watch_transaction(txid: str):
+        """
+        대기중 트랜잭션 상태 변경 구독 API (Server-Sent Events)
+        감시 중이면 상태가 바뀔 때마다 'status', 감시가 끝나면 'done'을 전송. 감시 중이 아니면 바로 'done'
+        """
+        async def generate_stream():
+            queue = tx_watcher.subscribe(txid)
+            if queue is None:
+                yield f"data: {json.dumps({'type': 'done', 'txid': txid, 'watching': False})}\n\n"
+                return
+            try:
+                yield f"data: {json.dumps({'type': 'start', 'txid': txid, 'watching': True})}\n\n"
+                while True:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), timeout=WATCH_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"  # 프록시가 유휴 연결을 끊지 않도록
+                        continue
+                    if event is None:
+                        break
+                    yield f"data: {json.dumps(event)}\n\n"
+            finally:
+                tx_watcher.unsubscribe(txid, queue)
+
+        return StreamingResponse(
+            generate_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
+    @app.post("/api/tx/batch")
+    async def batch_transactions(request: Request):
+        """
+        트랜잭션 일괄 조회 API (Server-Sent Events)
+        요청 본문: {"txids": [...]} (최대 BATCH_MAX_TXIDS개). 결과는 찾는 즉시 'result', txid별 조회가 끝나면 'tx_done'으로 전송
+        """
+        try:
+            data = await request.json()
+        except Exception:
+            data = None
+        txids = data.get("txids") if isinstance(data, dict) else None
+        if not isinstance(txids, list) or not all(isinstance(txid, str) for txid in txids):
+            return JSONResponse(status_code=400, content={"success": False, "message": "txids must be a list of strings."})
+        txids = list(dict.fromkeys(txid.strip() for txid in txids if txid.strip()))
+        if not txids:
+            return JSONResponse(status_code=400, content={"success": False, "message": "txids must not be empty."})
+        if len(txids) > BATCH_MAX_TXIDS:
+            return JSONResponse(
+                status_code=400,
+                content={"success": False, "message": f"Up to {BATCH_MAX_TXIDS} txids can be looked up at once."}
+            )
+
+        async def generate_stream():
+            found_txids = 0
+            outcomes = {}
+            try:
+                yield f"data: {json.dumps({'type': 'start', 'txids': txids})}\n\n"
+                async for event, txid, payload in iter_batch_transaction_results(txids, outcomes=outcomes):
+                    if event == "result":
+                        yield f"data: {json.dumps({'type': 'result', 'txid': txid, 'result': payload})}\n\n"
+                        continue
+                    found_txids += 1 if payload else 0
+                    tx_done_event = {'type': 'tx_done', 'txid': txid, 'found': payload > 0, 'count': payload}
+                    unavailable = chains_with_outcome(outcomes.get(txid, {}), LOOKUP_UNAVAILABLE)
+                    if unavailable:
+                        tx_done_event['unavailableChains'] = unavailable
+                    rate_limited = chains_with_outcome(outcomes.get(txid, {}), LOOKUP_RATE_LIMITED)
+                    if rate_limited:
+                        tx_done_event['rateLimitedChains'] = rate_limited
+                    if tx_watcher.is_watching(txid):
+                        tx_done_event['watch'] = f"/api/tx/{txid}/watch"
+                    yield f"data: {json.dumps(tx_done_event)}\n\n"
+                yield f"data: {json.dumps({'type': 'done', 'total': len(txids), 'found': found_txids})}\n\n"
+            except Exception as e:
+                logger.error(f"트랜잭션 일괄 조회 오류: {e}", exc_info=True)
+                yield f"data: {json.dumps({'type': 'error', 'message': 'Batch transaction lookup failed.'})}\n\n"
+
+        return StreamingResponse(
+            generate_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
     
     @app.get("/api/chains")
-    async def get_chains():
-        """지원하는 체인 목록 조회 API"""
-        configs = get_chain_configs()
-        supported_chains = []
-        for key, config in configs.items():
-            if key == "avalanche_henesys_subnet":
-                continue
-            else:
-                supported_chains.append({
-                    "name": config["name"], 
-                    "symbol": config["symbol"],
-                    "explorer": config["explorer"].replace("/tx/", "/")
-                })
-        return JSONResponse(content={"supportedChains": supported_chains})
+    async def get_chains(request: Request):
+        """지원하는 체인 목록 조회 API (시작 시 직렬화한 본문과 ETag 사용)"""
+        cache_control = f"public, max-age={CHAINS_MAX_AGE}, stale-while-revalidate={CHAINS_STALE_WHILE_REVALIDATE}"
+        response = Response(content=chain_registry.chains_body, media_type="application/json",
+                            headers={"Cache-Control": cache_control})
+        return conditional_response(request, response, etag=chain_registry.chains_etag,
+                                    last_modified=chain_registry.chains_last_modified)
     
     @app.post("/api/contact")
     async def submit_contact(request: Request):
@@ -29,6 +29,7 @@ NODE_DISPLAY_NAMES = {
     "simple_chat_specialist": "💬 응답 생성 중...",
     "faq_specialist": "📚 FAQ 검색 중...",
     "transaction_specialist": "🔍 트랜잭션 조회 중...",
+    "price_specialist": "💰 시세 조회 중...",
     "planner": "📋 검색 계획 중...",
     "researcher": "🔎 웹 검색 중...",
     "grader": "📊 결과 평가 중...",
@@ -44,12 +45,13 @@ ALLOWED_STREAM_NODES = {
     "simple_chat_specialist", 
     "faq_specialist", 
     "transaction_specialist", 
+    "price_specialist",
     "intent_clarifier"
 }
 
 RESPONSE_NODES = {
     "writer", "simple_chat_specialist", "faq_specialist", 
-    "intent_clarifier", "transaction_specialist"
+    "intent_clarifier", "transaction_specialist", "price_specialist"
 }
 
 JSON_KEYWORDS = [
@@ -389,6 +391,10 @@ async def chat_stream(request: Request):
                             if specialist == "faq" or (question_type and str(question_type).endswith("FAQ")):
                                 target_node = "faq_specialist"
                                 executed_nodes.append("faq_specialist")
+                            elif specialist == "price":
+                                # 시세 질문 빠른 경로 (question_type은 WEB_SEARCH이므로 먼저 확인)
+                                target_node = "price_specialist"
+                                executed_nodes.append("price_specialist")
                             elif specialist == "web_search" or (question_type and "WEB_SEARCH" in str(question_type)):
                                 target_node = "planner"
                                 executed_nodes.extend(["planner", "researcher", "grader", "writer"])
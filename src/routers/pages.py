@@ -5,7 +5,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
-from src.services.chain_configs import get_chain_configs
+from src.services.chain_registry import chain_registry
 from chatbot import config
 
 router = APIRouter(prefix="", tags=["pages"])
@@ -16,14 +16,7 @@ def register_pages_routes(app, templates: Jinja2Templates):
     @app.get("/", response_class=HTMLResponse)
     async def home(request: Request):
         """홈 페이지"""
-        excluded_chains = ["litecoin", "dogecoin"]
-        CHAIN_CONFIGS = get_chain_configs()
-        supported_chains = [
-            {"name": config["name"], "symbol": config["symbol"]} 
-            for key, config in CHAIN_CONFIGS.items() 
-            if "name" in config and key not in excluded_chains
-        ]
-        return templates.TemplateResponse("pages/explorer_ui.html", {"request": request, "supported_chains": supported_chains})
+        return templates.TemplateResponse("pages/explorer_ui.html", {"request": request, "supported_chains": chain_registry.home_chains})
     
     @app.get("/stk", response_class=HTMLResponse)
     async def staking_calculator(request: Request):
@@ -8,6 +8,7 @@ import time
 from datetime import datetime
 
 from src.blog.posts import BLOG_POSTS
+from src.services.circuit_breaker import circuit_breakers
 
 router = APIRouter(prefix="", tags=["utility"])
 
@@ -16,8 +17,8 @@ def register_utility_routes(app):
     
     @app.get("/health")
     async def health_check():
-        """헬스 체크 엔드포인트"""
-        return {"status": "healthy", "timestamp": time.time()}
+        """헬스 체크 엔드포인트 (체인별 서킷 브레이커 상태 포함)"""
+        return {"status": "healthy", "timestamp": time.time(), "circuit_breakers": circuit_breakers.snapshot()}
     
     @app.get("/favicon.ico")
     async def favicon():
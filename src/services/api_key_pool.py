@@ -0,0 +1,107 @@
+"""
+탐색기 API 키 풀
+
+api_key_env_var 환경 변수에 쉼표로 구분한 여러 키를 넣으면(예: BASE_API_KEY="key1,key2,key3") 요청마다 키를
+돌아가며 사용합니다. 요청 한도는 (공급자, API 키)별로 적용되므로 처리량이 보유한 키 수만큼 늘어납니다.
+429를 받은 키는 Retry-After 동안, 인증에 실패한 키는 더 오래 쉬게 하고 나머지 키로 요청합니다.
+같은 환경 변수를 쓰는 체인(예: blockcypher의 BTC/LTC/DOGE)은 하나의 풀을 함께 사용합니다.
+"""
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INVALID_KEY_COOLDOWN_SECONDS = float(os.getenv("API_KEY_INVALID_COOLDOWN", "600"))
+
+
+def parse_api_keys(value: Optional[str]) -> List[str]:
+    """쉼표로 구분한 키 목록 (공백과 중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(key.strip() for key in (value or "").split(",") if key.strip()))
+
+
+def mask_api_key(api_key: str) -> str:
+    return f"…{api_key[-4:]}" if len(api_key) > 8 else "…"
+
+
+class _KeyState:
+    def __init__(self, key: str):
+        self.key = key
+        self.available_at = 0.0  # monotonic 기준, 이 시각 전에는 사용하지 않음
+        self.uses = 0
+        self.cooldowns = 0
+
+
+class ApiKeyPool:
+    """키를 순서대로 돌려 쓰되, 쉬는 중인 키는 건너뜀"""
+
+    def __init__(self, name: str, keys: List[str]):
+        self.name = name
+        self._keys = [_KeyState(key) for key in keys]
+        self._by_key = {state.key: state for state in self._keys}
+        self._next = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def choose(self) -> Optional[str]:
+        """다음으로 사용할 키 (모든 키가 쉬는 중이면 None)"""
+        now = time.monotonic()
+        for _ in range(len(self._keys)):
+            state = self._keys[self._next]
+            self._next = (self._next + 1) % len(self._keys)
+            if state.available_at <= now:
+                state.uses += 1
+                return state.key
+        return None
+
+    def cooldown(self, api_key: str, seconds: float):
+        """키를 seconds 동안 사용하지 않음 (429 응답, 인증 실패 등)"""
+        state = self._by_key.get(api_key)
+        if state is None:
+            return
+        state.available_at = max(state.available_at, time.monotonic() + seconds)
+        state.cooldowns += 1
+        logger.debug(f"[{self.name}] API 키 {mask_api_key(api_key)} {seconds:.1f}초 동안 사용 중지")
+
+    def mark_invalid(self, api_key: str):
+        logger.warning(f"[{self.name}] API 키 {mask_api_key(api_key)} 인증 실패, {INVALID_KEY_COOLDOWN_SECONDS:.0f}초 동안 사용 중지")
+        self.cooldown(api_key, INVALID_KEY_COOLDOWN_SECONDS)
+
+    def snapshot(self) -> dict:
+        """키별 사용 현황 (키 값은 마지막 4자리만 노출)"""
+        now = time.monotonic()
+        return {
+            "keys": len(self._keys),
+            "available": sum(1 for state in self._keys if state.available_at <= now),
+            "usage": [
+                {"key": mask_api_key(state.key), "uses": state.uses, "cooldowns": state.cooldowns,
+                 "cooling_down": state.available_at > now}
+                for state in self._keys
+            ],
+        }
+
+
+class ApiKeyPools:
+    """환경 변수 이름별 키 풀 (키가 없는 환경 변수는 풀이 없음)"""
+
+    def __init__(self):
+        self._pools: Dict[str, ApiKeyPool] = {}
+
+    def get(self, env_var: Optional[str]) -> Optional[ApiKeyPool]:
+        """환경 변수의 키 풀 (처음 요청할 때 한 번만 환경 변수를 읽음)"""
+        if not env_var:
+            return None
+        if env_var not in self._pools:
+            keys = parse_api_keys(os.getenv(env_var))
+            self._pools[env_var] = ApiKeyPool(env_var, keys) if keys else None
+            if len(keys) > 1:
+                logger.info(f"[{env_var}] API 키 {len(keys)}개를 번갈아 사용")
+        return self._pools[env_var]
+
+    def snapshot(self) -> dict:
+        return {name: pool.snapshot() for name, pool in self._pools.items() if pool is not None}
+
+
+api_key_pools = ApiKeyPools()
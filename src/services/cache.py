@@ -1,30 +1,100 @@
+import os
 import time
+import logging
+from collections import OrderedDict
 
-class SimpleCache:
-    def __init__(self, ttl_seconds=60):
-        self.cache = {}
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """크기 제한이 있는 LRU + TTL 캐시 (항목별 TTL 지정 가능)"""
+
+    def __init__(self, max_size=1000, ttl_seconds=60, name="cache"):
+        self._entries = OrderedDict()  # key -> (value, expires_at)
+        self.max_size = max_size
         self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def get(self, key):
-        if key in self.cache:
-            result, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl_seconds:
-                print(f"[Cache Hit] Key: {key}")
-                return result
-            else:
-                print(f"[Cache Miss] Key: {key} (Expired)")
-                del self.cache[key]
-        else:
-            print(f"[Cache Miss] Key: {key}")
-        return None
-
-    def set(self, key, value):
-        self.cache[key] = (value, time.time())
-        print(f"[Cache Set] Key: {key}")
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            logger.debug(f"[{self.name}] Cache miss: {key}")
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            self.expirations += 1
+            logger.debug(f"[{self.name}] Cache miss (expired): {key}")
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.debug(f"[{self.name}] Cache hit: {key}")
+        return value
+
+    def set(self, key, value, ttl_seconds=None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"[{self.name}] Cache evict: {evicted_key}")
+        logger.debug(f"[{self.name}] Cache set: {key} (ttl={ttl}s)")
 
     def delete(self, key):
-        if key in self.cache:
-            del self.cache[key]
-            print(f"[Cache Delete] Key: {key}")
+        if self._entries.pop(key, None) is not None:
+            logger.debug(f"[{self.name}] Cache delete: {key}")
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+# 트랜잭션 상태별 TTL: 확정된 트랜잭션은 바뀌지 않으므로 길게, 대기중인 트랜잭션은 곧 바뀌므로 짧게
+TX_FINAL_TTL = int(os.getenv("TX_CACHE_FINAL_TTL", "21600"))  # 6시간
+TX_PENDING_TTL = int(os.getenv("TX_CACHE_PENDING_TTL", "10"))
+TX_DEFAULT_TTL = int(os.getenv("TX_CACHE_DEFAULT_TTL", "300"))  # 상태를 알 수 없는 경우 (예: "unknown")
+FINAL_TX_STATUSES = {"confirmed", "failed"}
+
+def transaction_cache_ttl(results) -> int:
+    """조회 결과 목록의 상태로 캐시 TTL 결정 (하나라도 대기중이면 가장 짧은 TTL)"""
+    statuses = [str(result.get("status") or "unknown").lower() for result in results]
+    if any("pending" in status for status in statuses):
+        return TX_PENDING_TTL
+    if statuses and all(status in FINAL_TX_STATUSES for status in statuses):
+        return TX_FINAL_TTL
+    return TX_DEFAULT_TTL
+
+cache = LRUCache(max_size=int(os.getenv("TX_CACHE_MAX_SIZE", "5000")), ttl_seconds=TX_DEFAULT_TTL, name="tx")
+
+# 부정 캐시: 방금 브로드캐스트되어 아직 전파되지 않은 트랜잭션일 수 있으므로 짧게 유지
+negative_cache = LRUCache(max_size=10000, ttl_seconds=int(os.getenv("TX_NEGATIVE_CACHE_TTL", "15")), name="tx-miss")  # 어떤 체인에서도 찾지 못한 txid
+chain_miss_cache = LRUCache(max_size=50000, ttl_seconds=int(os.getenv("TX_CHAIN_MISS_CACHE_TTL", "15")), name="tx-chain-miss")  # 특정 체인에서 찾지 못한 "체인:txid"
+
+def chain_miss_key(chain: str, txid: str) -> str:
+    return f"{chain}:{txid}"
 
-cache = SimpleCache(ttl_seconds=300) # 5분 TTL 설정
+def cache_stats() -> dict:
+    """트랜잭션 관련 캐시 통계 (관리자/헬스 체크용)"""
+    return {c.name: c.stats() for c in (cache, negative_cache, chain_miss_cache)}
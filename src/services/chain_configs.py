@@ -1,10 +1,55 @@
 #chain_configs.py
 
 import os
+import base64
+import binascii
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# --- 트랜잭션 해시 형식 분류기 ---
+# 각 체인 설정의 "classify_txid"는 입력 txid를 해당 체인 API가 기대하는 형태로 변환해 반환하고,
+# 형식상 그 체인의 해시가 될 수 없으면 None을 반환합니다. 네트워크 요청 전에 후보 체인을 고르는 데 사용됩니다.
+_HEX64_RE = re.compile(r"^[0-9a-fA-F]{64}$")
+_EVM_HASH_RE = re.compile(r"^0x[0-9a-fA-F]{64}$")
+_BASE58_SIGNATURE_RE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{80,90}$")
+_BASE64_RE = re.compile(r"^[A-Za-z0-9+/\-_]+={0,2}$")
+
+def classify_hex_txid(txid: str):
+    """0x 접두사 없는 64자리 HEX 해시 (Bitcoin 계열, Tron, XRP, Stellar, Cosmos 계열)"""
+    return txid if _HEX64_RE.match(txid) else None
+
+def classify_evm_txid(txid: str):
+    """EVM 트랜잭션 해시는 0x 유무와 관계없이 64자리 HEX로 받으며, API 호출 시 0x를 붙입니다."""
+    if _EVM_HASH_RE.match(txid):
+        return txid
+    return "0x" + txid if _HEX64_RE.match(txid) else None
+
+def classify_stacks_txid(txid: str):
+    """Stacks는 0x 유무와 관계없이 64자리 HEX 해시를 받으며, API 호출 시 0x를 붙입니다."""
+    if _EVM_HASH_RE.match(txid):
+        return txid
+    return "0x" + txid if _HEX64_RE.match(txid) else None
+
+def classify_solana_txid(txid: str):
+    """Base58로 인코딩된 64바이트 서명 (보통 87~88자)"""
+    return txid if _BASE58_SIGNATURE_RE.match(txid) else None
+
+def classify_ton_txid(txid: str):
+    """TON 해시는 Base64/Base64URL(43, 44, 47, 48자) 또는 HEX(64자)로 입력되며, tonapi.io 호출용 HEX로 변환합니다."""
+    if _HEX64_RE.match(txid):
+        return txid
+    if len(txid) not in (43, 44, 47, 48) or not _BASE64_RE.match(txid):
+        return None
+    missing_padding = len(txid) % 4
+    txid_padded = txid + '=' * (4 - missing_padding) if missing_padding else txid
+    try:
+        decoded_bytes = base64.b64decode(txid_padded.replace('-', '+').replace('_', '/'), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return decoded_bytes.hex() if decoded_bytes else None
+
 # Solana getTransaction 응답에서 시스템 전송 정보를 추출하는 헬퍼 함수 (람다 내부에 포함시키기 복잡해서 개념적으로 분리)
 # 실제로는 이 로직을 람다 내에 next()와 제너레이터 표현식으로 구현합니다.
 def find_solana_system_transfer(instructions_list):
@@ -77,11 +122,45 @@ def normalize_solana_transaction(res: dict):
         "symbol": "SOL"
     }
 
+def esplora_normalizer(chain: str, explorer: str, symbol: str):
+    """Esplora API(mempool.space 계열) /tx 응답을 blockcypher 정규화와 같은 스키마로 바꾸는 함수"""
+    def normalize(res: dict):
+        if not (res.get("txid") and res.get("vin") and res.get("vout")):
+            return None
+        status = res.get("status") or {}
+        return {
+            "txid": res.get("txid"),
+            "from": (res["vin"][0].get("prevout") or {}).get("scriptpubkey_address"),
+            "to": res["vout"][0].get("scriptpubkey_address"),
+            "value": sum(output.get("value", 0) for output in res["vout"]) / 1e8,
+            "blockNumber": status.get("block_height"),
+            "status": "confirmed" if status.get("confirmed") else "pending",
+            "chain": chain,
+            "explorer": explorer,
+            "symbol": symbol
+        }
+    return normalize
+
+# "provider": 탐색기 공급자 이름으로, 요청 한도 값(초당 요청 수)을 정합니다. 한도는 (공급자, 요청 호스트, API 키)
+# 단위로 적용되므로 같은 호스트를 쓰는 체인만 한도를 공유합니다. 지정하지 않으면 체인 키가 공급자 이름으로 사용됩니다.
+# (rate_limiter.py 참고)
+# "api_key_env_var": API 키 환경 변수. 쉼표로 여러 키를 넣으면 번갈아 사용합니다. (api_key_pool.py 참고)
+# 키는 URL 함수("api")에 넣지 않으며, 요청 시 쿼리 파라미터("api_key_param", 기본 apikey) 또는 인증 헤더로 붙습니다.
+# "fallbacks": 기본 공급자가 느리거나 실패할 때 조회하는 대체 공급자 목록 (순서가 우선순위). 각 항목은 provider, api와
+# 요청 관련 필드만 지정하고 나머지(이름, 탐색기, normalize 등)는 체인 설정을 물려받으며, 정규화 결과는 같은 스키마여야
+# 합니다. 실제 조회 순서는 공급자별 지연 시간과 오류율로 정합니다. (provider_router.py 참고)
 def get_chain_configs():
     return {
         "bitcoin": {
             "name": "Bitcoin",
             "symbol": "BTC",
+            "classify_txid": classify_hex_txid,
+            "provider": "blockcypher",
+            # 선택 사항: 토큰이 있으면 무료 한도보다 높은 한도로 조회 (쉼표로 여러 토큰 지정 가능)
+            "api_key_env_var": "BLOCKCYPHER_TOKEN",
+            "api_key_param": "token",
+            # 입력/출력이 많은 트랜잭션은 응답이 수 MB가 되므로 정규화에 필요한 필드만 스트리밍 파싱 (response_reader.py 참고)
+            "stream_fields": ["hash", "total", "block_height", "confirmations", "inputs", "outputs"],
             "explorer": "https://www.blockchain.com/btc/tx/",
             "api": lambda txid: f"https://api.blockcypher.com/v1/btc/main/txs/{txid}",
             "normalize": lambda res: {
@@ -94,11 +173,21 @@ def get_chain_configs():
                 "chain": "bitcoin",
                 "explorer": "https://www.blockchain.com/btc/tx/",
                 "symbol": "BTC"
-            } if res.get("hash") and res.get("inputs") and res.get("outputs") else None
+            } if res.get("hash") and res.get("inputs") and res.get("outputs") else None,
+            "fallbacks": [{
+                "provider": "mempool_space",
+                "api": lambda txid: f"https://mempool.space/api/tx/{txid}",
+                "normalize": esplora_normalizer("bitcoin", "https://www.blockchain.com/btc/tx/", "BTC"),
+            }]
         },
         "litecoin": {
             "name": "Litecoin",
             "symbol": "LTC",
+            "classify_txid": classify_hex_txid,
+            "provider": "blockcypher",
+            "api_key_env_var": "BLOCKCYPHER_TOKEN",
+            "api_key_param": "token",
+            "stream_fields": ["hash", "total", "block_height", "confirmations", "inputs", "outputs"],
             "explorer": "https://live.blockcypher.com/ltc/tx/",
             "api": lambda txid: f"https://api.blockcypher.com/v1/ltc/main/txs/{txid}",
             "normalize": lambda res: {
@@ -111,11 +200,21 @@ def get_chain_configs():
                 "chain": "litecoin",
                 "explorer": "https://live.blockcypher.com/ltc/tx/",
                 "symbol": "LTC"
-            } if res.get("hash") and res.get("inputs") and res.get("outputs") else None
+            } if res.get("hash") and res.get("inputs") and res.get("outputs") else None,
+            "fallbacks": [{
+                "provider": "litecoinspace",
+                "api": lambda txid: f"https://litecoinspace.org/api/tx/{txid}",
+                "normalize": esplora_normalizer("litecoin", "https://live.blockcypher.com/ltc/tx/", "LTC"),
+            }]
         },
         "dogecoin": {
             "name": "Dogecoin",
             "symbol": "DOGE",
+            "classify_txid": classify_hex_txid,
+            "provider": "blockcypher",
+            "api_key_env_var": "BLOCKCYPHER_TOKEN",
+            "api_key_param": "token",
+            "stream_fields": ["hash", "total", "block_height", "confirmations", "inputs", "outputs"],
             "explorer": "https://live.blockcypher.com/doge/tx/",
             "api": lambda txid: f"https://api.blockcypher.com/v1/doge/main/txs/{txid}",
             "normalize": lambda res: {
@@ -133,12 +232,16 @@ def get_chain_configs():
         "ethereum": {
             "name": "Ethereum",
             "symbol": "ETH",
+            "classify_txid": classify_evm_txid,
             "rpc_mode": True,
             "rpc_method": "eth_getTransactionByHash",
+            "rpc_receipt": True,  # 영수증과 최신 블록 번호를 같은 배치 요청으로 조회 (가스, 실행 결과, 확인 수)
             "explorer": "https://etherscan.io/tx/",
             # 이더스캔 V1 API가 2025년 8월 15일 중단되어 RPC 모드로 전환
             # 공개 RPC 엔드포인트 사용 (또는 환경 변수로 커스텀 RPC URL 설정 가능)
             "api": lambda txid: os.getenv('ETHEREUM_RPC_URL', 'https://eth.llamarpc.com'),
+            # 기본 엔드포인트가 p95 지연 시간 안에 응답하지 않으면 함께 조회하는 예비 엔드포인트
+            "api_mirrors": [lambda txid: os.getenv('ETHEREUM_RPC_MIRROR_URL', 'https://ethereum-rpc.publicnode.com')],
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),  # 전체 해시 보존
                 "from": res.get("result", {}).get("from"),
@@ -154,8 +257,11 @@ def get_chain_configs():
         "bnb_smart_chain": {
             "name": "BNB Smart Chain",
             "symbol": "BNB",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "BNB_SMART_CHAIN_API_KEY",
             "explorer": "https://bscscan.com/tx/",
-            "api": lambda txid: f"https://api.bscscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('BNB_SMART_CHAIN_API_KEY')}",
+            "api": lambda txid: f"https://api.bscscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -166,18 +272,27 @@ def get_chain_configs():
                 "chain": "bnb_smart_chain",
                 "explorer": "https://bscscan.com/tx/",
                 "symbol": "BNB"
-            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None
+            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None,
+            "fallbacks": [{
+                "provider": "publicnode",
+                # 탐색기 proxy API와 응답 형태({"result": {...}})가 같아 정규화 함수를 그대로 사용
+                "rpc_mode": True,
+                "api": lambda txid: os.getenv('BNB_SMART_CHAIN_RPC_URL', 'https://bsc-rpc.publicnode.com'),
+            }]
         },
         "polygon": {
             "name": "Polygon",
             "symbol": "MATIC",
+            "classify_txid": classify_evm_txid,
             "rpc_mode": True,
             "rpc_method": "eth_getTransactionByHash",
+            "rpc_receipt": True,
             "explorer": "https://polygonscan.com/tx/",
             # PolygonScan V1 API가 deprecated되어 RPC 모드로 전환
             # 공개 RPC 엔드포인트 사용 (또는 환경 변수로 커스텀 RPC URL 설정 가능)
             # 공식 RPC: https://polygon-rpc.com 또는 https://rpc-mainnet.maticvigil.com
             "api": lambda txid: os.getenv('POLYGON_RPC_URL', 'https://polygon-rpc.com'),
+            "api_mirrors": [lambda txid: os.getenv('POLYGON_RPC_MIRROR_URL', 'https://polygon-bor-rpc.publicnode.com')],
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -193,6 +308,8 @@ def get_chain_configs():
         "tron": {
             "name": "Tron",
             "symbol": "TRX",
+            "classify_txid": classify_hex_txid,
+            "provider": "tronscan",
             "explorer": "https://tronscan.org/#/transaction/",
             "api": lambda txid: f"https://apilist.tronscan.org/api/transaction-info?hash={txid}",
             "normalize": lambda res: {
@@ -210,8 +327,11 @@ def get_chain_configs():
         "arbitrum_one": {
             "name": "Arbitrum One",
             "symbol": "ARB",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "ARBITRUM_API_KEY",
             "explorer": "https://arbiscan.io/tx/",
-            "api": lambda txid: f"https://api.arbiscan.io/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('ARBITRUM_API_KEY')}",
+            "api": lambda txid: f"https://api.arbiscan.io/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -222,13 +342,21 @@ def get_chain_configs():
                 "chain": "arbitrum_one",
                 "explorer": "https://arbiscan.io/tx/",
                 "symbol": "ARB"
-            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None
+            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None,
+            "fallbacks": [{
+                "provider": "publicnode",
+                "rpc_mode": True,
+                "api": lambda txid: os.getenv('ARBITRUM_RPC_URL', 'https://arbitrum-one-rpc.publicnode.com'),
+            }]
         },
         "optimism": {
             "name": "Optimism",
             "symbol": "OP",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "OPTIMISM_API_KEY",
             "explorer": "https://optimistic.etherscan.io/tx/",
-            "api": lambda txid: f"https://api-optimistic.etherscan.io/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('OPTIMISM_API_KEY')}",
+            "api": lambda txid: f"https://api-optimistic.etherscan.io/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -239,13 +367,21 @@ def get_chain_configs():
                 "chain": "optimism",
                 "explorer": "https://optimistic.etherscan.io/tx/",
                 "symbol": "OP"
-            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None
+            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None,
+            "fallbacks": [{
+                "provider": "publicnode",
+                "rpc_mode": True,
+                "api": lambda txid: os.getenv('OPTIMISM_RPC_URL', 'https://optimism-rpc.publicnode.com'),
+            }]
         },
         "etc": {
             "name": "Ethereum Classic",
             "symbol": "ETC",
+            "classify_txid": classify_evm_txid,
+            "provider": "blockscout",
             "rpc_mode": True,
             "rpc_method": "eth_getTransactionByHash", # 명시
+            "rpc_receipt": True,
             "explorer": "https://etc.blockscout.com/tx/",
             "api": lambda txid: "https://etc.blockscout.com/api/eth-rpc", # txid 인자 사용 안 함
             "normalize": lambda res: {
@@ -264,8 +400,11 @@ def get_chain_configs():
         "avalanche_c_chain": {
             "name": "Avalanche C-Chain",
             "symbol": "AVAX",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "AVALANCHE_API_KEY",
             "explorer": "https://snowtrace.io/tx/",
-            "api": lambda txid: f"https://api.snowtrace.io/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('AVALANCHE_API_KEY')}",
+            "api": lambda txid: f"https://api.snowtrace.io/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -276,11 +415,18 @@ def get_chain_configs():
                 "chain": "avalanche_c_chain",
                 "explorer": "https://snowtrace.io/tx/",
                 "symbol": "AVAX"
-            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None
+            } if isinstance(res.get("result"), dict) and res.get("result", {}).get("hash") else None,
+            "fallbacks": [{
+                "provider": "publicnode",
+                "rpc_mode": True,
+                "api": lambda txid: os.getenv('AVALANCHE_RPC_URL', 'https://avalanche-c-chain-rpc.publicnode.com'),
+            }]
         },
         "solana": {
             "name": "Solana ",
             "symbol": "SOL",
+            "classify_txid": classify_solana_txid,
+            "provider": "solana_rpc",
             "explorer": "https://solscan.io/tx/",
             "rpc_mode": True,
             "rpc_method": "getTransaction",
@@ -294,6 +440,8 @@ def get_chain_configs():
         "ton": {
             "name": "TON",
             "symbol": "TON",
+            "classify_txid": classify_ton_txid,
+            "provider": "tonapi",
             "explorer": "https://tonviewer.com/transaction/", # Tonviewer uses Base64URL for display in URL
             "api_requires_header_auth": True,
             "api_auth_header_name": "Authorization",
@@ -319,14 +467,16 @@ def get_chain_configs():
                 "explorer": "https://tonviewer.com/transaction/", # For display, still links to Tonviewer with Base64URL
                 "note": "TON 트랜잭션은 Base64 URL 해시를 사용합니다. 입력값은 Base64 또는 HEX가 될 수 있습니다.",
                 "destination_tag": None # TON은 destination tag를 직접 제공하지 않음
-            } if res.get("hash") else None,
-            "api_url_type": "hex_from_base64_input" # 입력된 txid를 Base64로 간주하고 HEX로 변환
+            } if res.get("hash") else None
         },
         "mantle": {
             "name": "Mantle",
             "symbol": "MNT",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "MANTLE_API_KEY",
             "explorer": "https://mantlescan.xyz/tx/",
-            "api": lambda txid: f"https://api.mantlescan.xyz/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('MANTLE_API_KEY')}",
+            "api": lambda txid: f"https://api.mantlescan.xyz/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -342,8 +492,11 @@ def get_chain_configs():
         "base": {
             "name": "Base",
             "symbol": "BASE",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "BASE_API_KEY",
             "explorer": "https://basescan.org/tx/",
-            "api": lambda txid: f"https://api.basescan.org/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('BASE_API_KEY')}",
+            "api": lambda txid: f"https://api.basescan.org/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -359,8 +512,11 @@ def get_chain_configs():
         "wemix": {
             "name": "WEMIX",
             "symbol": "WEMIX",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "WEMIX_API_KEY",
             "explorer": "https://wemixscan.com/tx/",
-            "api": lambda txid: f"https://api.wemixscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('WEMIX_API_KEY')}",
+            "api": lambda txid: f"https://api.wemixscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -376,10 +532,13 @@ def get_chain_configs():
         "endurance": {
             "name": "Endurance", # Fusionist / ACE
             "symbol": "ACE",  # Endurance의 네이티브 토큰 심볼
+            "classify_txid": classify_evm_txid,
+            "provider": "blockscout",
+            "api_key_env_var": "ENDURANCE_API_KEY",
             # explorer URL도 하이픈(-)을 사용하는 새 주소로 변경
             "explorer": "https://explorer-endurance.fusionist.io/tx/",
             # api URL도 하이픈(-)을 사용하는 새 주소로 변경
-            "api": lambda txid: f"https://explorer-endurance.fusionist.io/api?module=transaction&action=gettxinfo&txhash={txid}&apikey={os.getenv('ENDURANCE_API_KEY')}",
+            "api": lambda txid: f"https://explorer-endurance.fusionist.io/api?module=transaction&action=gettxinfo&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -396,8 +555,11 @@ def get_chain_configs():
         "blast": {
             "name": "Blast",
             "symbol": "BLAST",
+            "classify_txid": classify_evm_txid,
+            "provider": "ankr",
             "rpc_mode": True,
             "rpc_method": "eth_getTransactionByHash",
+            "rpc_receipt": True,
             "explorer": "https://blastscan.io/tx/",
             # BlastScan V1 API가 deprecated되어 RPC 모드로 전환
             # 공개 RPC 엔드포인트 사용 (또는 환경 변수로 커스텀 RPC URL 설정 가능)
@@ -417,8 +579,11 @@ def get_chain_configs():
         "scroll": {
             "name": "Scroll",
             "symbol": "SCR",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "SCROLL_API_KEY",
             "explorer": "https://scrollscan.com/tx/",
-            "api": lambda txid: f"https://api.scrollscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('SCROLL_API_KEY')}",
+            "api": lambda txid: f"https://api.scrollscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -434,8 +599,11 @@ def get_chain_configs():
         "linea": {
             "name": "Linea",
             "symbol": "ETH_Linea",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "LINEA_API_KEY",
             "explorer": "https://lineascan.build/tx/",
-            "api": lambda txid: f"https://api.lineascan.build/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('LINEA_API_KEY')}",
+            "api": lambda txid: f"https://api.lineascan.build/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -451,6 +619,7 @@ def get_chain_configs():
         "zksync_era": {
             "name": "zkSync Era",
             "symbol": "ETH_zkSync",
+            "classify_txid": classify_evm_txid,
             "explorer": "https://explorer.zksync.io/tx/",
             # zkSync Era 공식 블록 탐색기 API 사용
             "api": lambda txid: f"https://block-explorer-api.mainnet.zksync.io/transactions/{txid}", # API 키 필요 여부 문서에서 확인 필요
@@ -475,9 +644,12 @@ def get_chain_configs():
         "world_chain": {
             "name": "World Chain",
             "symbol": "WLD",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "WORLDCHAIN_API_KEY",
             "explorer": "https://worldscan.org/tx/",
             # API 기본 URL을 api.worldscan.org로 변경하고, API 키 사용
-            "api": lambda txid: f"https://api.worldscan.org/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('WORLDCHAIN_API_KEY')}",
+            "api": lambda txid: f"https://api.worldscan.org/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 # 표준 EVM 트랜잭션 상세 정보 정규화 로직
                 "txid": res.get("result", {}).get("hash"),
@@ -494,9 +666,12 @@ def get_chain_configs():
         "swell_l2": {
             "name": "Swell L2 (Swellchain)",
             "symbol": "SWELL",
+            "classify_txid": classify_evm_txid,
+            "provider": "ankr",
             "explorer": "https://explorer.swellnetwork.io/tx/", # 공식 탐색기 주소로 추정/변경
             "rpc_mode": True,
             "rpc_method": "eth_getTransactionByHash",
+            "rpc_receipt": True,
             # Ankr에서 제공하는 Swell L2 (Swellchain) 공개 RPC 엔드포인트 사용
             "api": lambda txid: "https://rpc.ankr.com/swell", # txid 인자 사용 안 함
             # "rpc_params_lambda"는 기본 EVM [txid]를 사용하므로 별도 정의 불필요
@@ -515,6 +690,7 @@ def get_chain_configs():
         "kaia": {
             "name": "KAIA",
             "symbol": "KAIA",
+            "classify_txid": classify_evm_txid,
             "explorer": "https://kaiascan.io/tx/",
             "rpc_mode": False,
             "api_requires_header_auth": True,
@@ -539,6 +715,7 @@ def get_chain_configs():
         "xrp": {
             "name": "Ripple",
             "symbol": "XRP",
+            "classify_txid": classify_hex_txid,
             "explorer": "https://xrpscan.com/tx/",
             "api_requires_header_auth": False, # XRPSCAN의 이 엔드포인트는 키 없이 시도
             "api": lambda txid: f"https://api.xrpscan.com/api/v1/tx/{txid}",
@@ -579,6 +756,7 @@ def get_chain_configs():
         "stellar": {
             "name": "Stellar",
             "symbol": "XLM",
+            "classify_txid": classify_hex_txid,
             "explorer": "https://stellarchain.io/tx/",
             "api": lambda txid: f"https://horizon.stellar.org/transactions/{txid}",
             "normalize": lambda res: {
@@ -596,8 +774,11 @@ def get_chain_configs():
         "injective": {
             "name": "Injective",
             "symbol": "INJ",
+            "classify_txid": classify_hex_txid,
             "explorer": "https://explorer.injective.network/transaction/",
             "api": lambda txid: f"https://lcd.injective.network/cosmos/tx/v1beta1/txs/{txid}",
+            # tx_response의 logs/events가 큰 경우가 많아 메시지와 결과 필드만 파싱
+            "stream_fields": ["tx.body.messages", "tx_response.txhash", "tx_response.height", "tx_response.code"],
             "normalize": lambda res: {
                 "txid": res.get("tx_response", {}).get("txhash"),
                 "from": res.get("tx", {}).get("body", {}).get("messages", [{}])[0].get("from_address"),
@@ -613,8 +794,10 @@ def get_chain_configs():
         "atom": {
             "name": "Cosmos Hub",
             "symbol": "ATOM",
+            "classify_txid": classify_hex_txid,
             "explorer": "https://www.mintscan.io/cosmos/txs/",
             "api": lambda txid: f"https://rest.cosmos.directory/cosmoshub/cosmos/tx/v1beta1/txs/{txid}",
+            "stream_fields": ["tx.body.messages", "tx_response.txhash", "tx_response.height", "tx_response.code"],
             "normalize": lambda res: {
                 "txid": res.get("tx_response", {}).get("txhash"),
                 "from": res.get("tx", {}).get("body", {}).get("messages", [{}])[0].get("from_address"),
@@ -630,8 +813,10 @@ def get_chain_configs():
         "xpla": {
             "name": "XPLA",
             "symbol": "XPLA",
+            "classify_txid": classify_hex_txid,
             "explorer": "https://explorer.xpla.io/mainnet/tx/",
             "api": lambda txid: f"https://dimension-lcd.xpla.dev/cosmos/tx/v1beta1/txs/{txid}",
+            "stream_fields": ["tx.body.messages", "tx_response.txhash", "tx_response.height", "tx_response.code"],
             "normalize": lambda res: {
                 "txid": res.get("tx_response", {}).get("txhash"),
                 "from": res.get("tx", {}).get("body", {}).get("messages", [{}])[0].get("from_address"),
@@ -647,8 +832,11 @@ def get_chain_configs():
         "cronos": {
             "name": "Cronos",
             "symbol": "CRO",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
+            "api_key_env_var": "CRONOS_API_KEY",
             "explorer": "https://cronoscan.com/tx/",
-            "api": lambda txid: f"https://api.cronoscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}&apikey={os.getenv('CRONOS_API_KEY')}",
+            "api": lambda txid: f"https://api.cronoscan.com/api?module=proxy&action=eth_getTransactionByHash&txhash={txid}",
             "normalize": lambda res: {
                 "txid": res.get("result", {}).get("hash"),
                 "from": res.get("result", {}).get("from"),
@@ -664,6 +852,7 @@ def get_chain_configs():
         "stacks": {
             "name": "Stacks",
             "symbol": "STX",
+            "classify_txid": classify_stacks_txid,
             "explorer": "https://explorer.stacks.co/txid/",
             "api": lambda txid: f"https://api.hiro.so/extended/v1/tx/{txid if txid.startswith('0x') else '0x'+txid}",
             "normalize": lambda res: {
@@ -680,6 +869,8 @@ def get_chain_configs():
         "sophon": {
             "name": "Sophon",
             "symbol": "SOPH",
+            "classify_txid": classify_evm_txid,
+            "provider": "etherscan",
             "explorer": "https://sophscan.xyz/tx/",
             "api_requires_header_auth": False,
             "api_key_env_var": "SOPHSCAN_API_KEY", # 서비스가 API 키를 읽기 위해 필요
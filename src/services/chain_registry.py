@@ -0,0 +1,300 @@
+"""
+체인 레지스트리 (배포 단위로 고정되는 체인 설정)
+
+get_chain_configs()는 호출할 때마다 람다가 담긴 설정 딕셔너리를 새로 만들고 환경 변수를 다시 읽습니다.
+레지스트리는 시작 시 한 번만 설정을 만들어 검증하고, 읽기 전용으로 고정한 뒤 공개 메타데이터(/api/chains,
+홈 화면), 체인별 요청 템플릿(HTTP 메서드, 헤더, RPC 엔드포인트), 공급자 경로(기본 설정 + fallbacks)와
+직렬화된 /api/chains 응답 본문을 미리 계산합니다.
+설정 오류(필수 필드 누락, 오타 등)는 요청 시점이 아니라 시작 시 ChainConfigError로 드러납니다.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from email.utils import formatdate
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Tuple
+
+import httpx
+
+from .api_key_pool import ApiKeyPool, api_key_pools
+from .chain_configs import get_chain_configs
+from .response_reader import MAX_RESPONSE_BYTES, STREAMING_PARSER_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_FIELDS = ("name", "symbol", "classify_txid", "explorer", "api", "normalize")
+CALLABLE_FIELDS = ("classify_txid", "api", "normalize", "rpc_params_lambda")
+KNOWN_FIELDS = frozenset(REQUIRED_FIELDS) | {
+    "provider", "api_key_env_var", "api_key_is_mandatory",
+    "api_requires_header_auth", "api_auth_header_name", "api_auth_value_prefix",
+    "api_key_param", "rpc_mode", "rpc_method", "rpc_params_lambda", "rpc_receipt", "api_mirrors", "fallbacks",
+    "max_response_bytes", "stream_fields",
+}
+# 대체 공급자(fallbacks 항목)에 지정할 수 있는 요청 관련 필드. 나머지 체인 정보는 기본 설정에서 물려받음
+FALLBACK_FIELDS = frozenset({
+    "provider", "api", "normalize", "api_key_env_var", "api_key_is_mandatory",
+    "api_requires_header_auth", "api_auth_header_name", "api_auth_value_prefix",
+    "api_key_param", "rpc_mode", "rpc_method", "rpc_params_lambda", "rpc_receipt", "api_mirrors",
+    "max_response_bytes", "stream_fields",
+})
+INHERITED_FIELDS = ("name", "symbol", "classify_txid", "explorer", "normalize")
+
+# /api/chains 목록에서 제외하는 체인과 홈 화면 목록에서 제외하는 체인
+HIDDEN_CHAINS = frozenset({"avalanche_henesys_subnet"})
+HOME_EXCLUDED_CHAINS = frozenset({"litecoin", "dogecoin"})
+
+DEFAULT_USER_AGENT = "Mozilla/5.0"
+DEFAULT_RPC_METHOD = "eth_getTransactionByHash"
+DEFAULT_API_KEY_PARAM = "apikey"
+RPC_BLOCK_NUMBER_ID = "blockNumber"
+
+
+class ChainConfigError(ValueError):
+    """체인 설정 검증 실패"""
+
+
+@dataclass(frozen=True)
+class ChainRequestTemplate:
+    """체인별로 요청마다 바뀌지 않는 부분 (시작 시 환경 변수에서 한 번 계산)"""
+    method: str                      # "GET" 또는 "POST"(rpc_mode)
+    headers: Mapping[str, str]       # User-Agent, Content-Type (인증 헤더는 request_headers에서 키별로 추가)
+    rpc_url: Optional[str] = None    # rpc_mode 체인의 엔드포인트 (txid와 무관)
+    rpc_method: Optional[str] = None
+    rpc_params: Optional[Callable] = None
+    rpc_mirror_urls: Tuple[str, ...] = ()  # rpc_mode 체인의 예비 엔드포인트 (api_mirrors)
+    rpc_receipt: bool = False        # 트랜잭션과 함께 영수증, 최신 블록 번호를 배치 요청으로 조회 (EVM)
+    key_pool: Optional[ApiKeyPool] = None  # api_key_env_var의 키 풀 (키가 없으면 None)
+    api_key_param: Optional[str] = None    # 쿼리 문자열로 키를 전달하는 파라미터 이름
+    auth_header_name: Optional[str] = None  # 헤더로 키를 전달하는 경우 헤더 이름
+    auth_value_prefix: str = ""
+    missing_api_key: bool = False          # 필수 API 키가 없어 요청할 수 없음
+    max_response_bytes: int = MAX_RESPONSE_BYTES
+    stream_fields: Tuple[str, ...] = ()    # 큰 응답에서 필드 선택 파싱할 경로 (response_reader.py 참고)
+    host: str = ""                         # 기본 요청 호스트 (요청 한도 버킷 구분, rate_limiter.py 참고)
+
+    def request_headers(self, api_key: Optional[str]) -> Mapping[str, str]:
+        if not (api_key and self.auth_header_name):
+            return self.headers
+        return {**self.headers, self.auth_header_name: f"{self.auth_value_prefix}{api_key}"}
+
+    def keyed_url(self, url: str, api_key: Optional[str]) -> str:
+        """쿼리 문자열 인증이면 키를 URL에 붙임 (일부 서버의 파라미터 처리 버그 때문에 직접 붙임)"""
+        if not (api_key and self.api_key_param):
+            return url
+        return f"{url}{'&' if '?' in url else '?'}{self.api_key_param}={api_key}"
+
+    def rpc_payload(self, txid_for_api: str, request_id: int = 1) -> dict:
+        params = self.rpc_params(txid_for_api) if self.rpc_params else [txid_for_api]
+        return {"jsonrpc": "2.0", "method": self.rpc_method, "params": params, "id": request_id}
+
+    def rpc_receipt_payload(self, txids_for_api) -> list:
+        """
+        txid별 트랜잭션("tx:{index}")과 영수증("receipt:{index}"), 최신 블록 번호("blockNumber")를
+        요청하는 JSON-RPC 배치 (POST 한 번으로 가스 사용량, 실행 결과, 확인 수까지 조회)
+        """
+        payload = []
+        for index, txid_for_api in enumerate(txids_for_api):
+            payload.append(self.rpc_payload(txid_for_api, request_id=f"tx:{index}"))
+            payload.append({"jsonrpc": "2.0", "method": "eth_getTransactionReceipt", "params": [txid_for_api], "id": f"receipt:{index}"})
+        payload.append({"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": RPC_BLOCK_NUMBER_ID})
+        return payload
+
+
+@dataclass(frozen=True)
+class ProviderRoute:
+    """체인을 조회하는 공급자 하나 (rank 0은 체인 기본 설정, 이후는 fallbacks 순서)"""
+    key: str        # 요청 템플릿, 서킷 브레이커, 공급자 통계의 키 (기본 공급자는 체인 키, 대체 공급자는 "체인@공급자")
+    chain: str
+    provider: str
+    rank: int
+    cfg: Mapping
+
+
+def fallback_route_key(key: str, provider: str) -> str:
+    return f"{key}@{provider}"
+
+
+def fallback_config(cfg: Mapping, fallback: Mapping) -> dict:
+    """대체 공급자 설정 (이름, 심볼, 탐색기, txid 분류, 정규화 함수는 기본 설정에서 물려받음)"""
+    return {**{field: cfg[field] for field in INHERITED_FIELDS if field in cfg}, **fallback}
+
+
+def _config_errors(key: str, cfg: Mapping) -> list:
+    errors = []
+    for field in REQUIRED_FIELDS:
+        if field not in cfg:
+            errors.append(f"{key}: 필수 필드 '{field}' 누락")
+    for field in CALLABLE_FIELDS:
+        if field in cfg and not callable(cfg[field]):
+            errors.append(f"{key}: '{field}'는 함수여야 합니다")
+    unknown = set(cfg) - KNOWN_FIELDS
+    if unknown:
+        errors.append(f"{key}: 알 수 없는 필드 {sorted(unknown)}")
+    explorer = cfg.get("explorer", "")
+    if not (isinstance(explorer, str) and explorer.startswith("https://") and explorer.endswith("/")):
+        errors.append(f"{key}: explorer는 'https://'로 시작하고 '/'로 끝나야 합니다 ({explorer!r})")
+    if cfg.get("api_requires_header_auth") and not (cfg.get("api_key_env_var") and cfg.get("api_auth_header_name")):
+        errors.append(f"{key}: 헤더 인증에는 api_key_env_var와 api_auth_header_name이 필요합니다")
+    if cfg.get("api_key_param") and (cfg.get("api_requires_header_auth") or not cfg.get("api_key_env_var")):
+        errors.append(f"{key}: api_key_param은 쿼리 문자열 인증(api_key_env_var, 헤더 인증 아님)에서만 사용됩니다")
+    mirrors = cfg.get("api_mirrors", ())
+    if not (isinstance(mirrors, (list, tuple)) and all(callable(mirror) for mirror in mirrors)):
+        errors.append(f"{key}: api_mirrors는 'api'와 같은 형태의 함수 목록이어야 합니다")
+    max_response_bytes = cfg.get("max_response_bytes", MAX_RESPONSE_BYTES)
+    if not (isinstance(max_response_bytes, int) and max_response_bytes > 0):
+        errors.append(f"{key}: max_response_bytes는 양의 정수여야 합니다")
+    stream_fields = cfg.get("stream_fields", ())
+    if not (isinstance(stream_fields, (list, tuple)) and all(isinstance(field, str) and field for field in stream_fields)):
+        errors.append(f"{key}: stream_fields는 점으로 구분한 필드 경로 목록이어야 합니다")
+    if cfg.get("rpc_params_lambda") and not cfg.get("rpc_mode"):
+        errors.append(f"{key}: rpc_params_lambda는 rpc_mode에서만 사용됩니다")
+    if cfg.get("rpc_receipt") and (not cfg.get("rpc_mode") or cfg.get("rpc_method", DEFAULT_RPC_METHOD) != DEFAULT_RPC_METHOD):
+        errors.append(f"{key}: rpc_receipt는 {DEFAULT_RPC_METHOD}를 사용하는 rpc_mode 체인에서만 사용됩니다")
+    return errors
+
+
+def _fallback_errors(key: str, cfg: Mapping) -> list:
+    fallbacks = cfg.get("fallbacks", ())
+    if not (isinstance(fallbacks, (list, tuple)) and all(isinstance(fallback, Mapping) for fallback in fallbacks)):
+        return [f"{key}: fallbacks는 공급자 설정(dict) 목록이어야 합니다"]
+    errors = []
+    providers = {cfg.get("provider", key)}
+    for index, fallback in enumerate(fallbacks):
+        provider = fallback.get("provider")
+        if not provider or "api" not in fallback:
+            errors.append(f"{key}: fallbacks[{index}]에는 provider와 api가 필요합니다")
+            continue
+        if provider in providers:
+            errors.append(f"{key}: fallbacks[{index}] 공급자 이름 중복 ({provider!r})")
+        providers.add(provider)
+        unknown = set(fallback) - FALLBACK_FIELDS
+        if unknown:
+            errors.append(f"{key}: fallbacks[{index}] 알 수 없는 필드 {sorted(unknown)}")
+        else:
+            errors.extend(_config_errors(fallback_route_key(key, provider), fallback_config(cfg, fallback)))
+    return errors
+
+
+def validate_chain_configs(configs: Mapping[str, dict]):
+    """모든 체인 설정을 검증하고, 문제가 있으면 전부 모아 ChainConfigError로 알림"""
+    errors = []
+    for key, cfg in configs.items():
+        errors.extend(_config_errors(key, cfg))
+        errors.extend(_fallback_errors(key, cfg))
+    if errors:
+        raise ChainConfigError("체인 설정 오류:\n" + "\n".join(errors))
+
+
+def request_host(key: str, cfg: Mapping) -> str:
+    """체인 설정의 기본 요청 URL 호스트 (URL 목록이면 첫 번째, 계산할 수 없으면 빈 문자열)"""
+    try:
+        url = cfg["api"]("")
+        return httpx.URL(url[0] if isinstance(url, list) else url).host
+    except Exception as e:
+        logger.debug(f"[{key}] 요청 호스트 계산 실패: {e}")
+        return ""
+
+
+def build_request_template(key: str, cfg: Mapping) -> ChainRequestTemplate:
+    headers = {"User-Agent": DEFAULT_USER_AGENT}
+    api_key_env_var = cfg.get("api_key_env_var")
+    key_pool = api_key_pools.get(api_key_env_var)
+    missing_api_key = False
+    if api_key_env_var and key_pool is None:
+        if cfg.get("api_key_is_mandatory", False):
+            logger.warning(f"[{key}] Mandatory API Key not found in env: {api_key_env_var}")
+            missing_api_key = True
+        else:
+            logger.debug(f"[{key}] API Key not found in env: {api_key_env_var}")
+
+    header_auth = bool(cfg.get("api_requires_header_auth"))
+    key_options = dict(
+        key_pool=key_pool,
+        api_key_param=cfg.get("api_key_param", DEFAULT_API_KEY_PARAM) if api_key_env_var and not header_auth else None,
+        auth_header_name=cfg.get("api_auth_header_name") if header_auth else None,
+        auth_value_prefix=cfg.get("api_auth_value_prefix", ""),
+        missing_api_key=missing_api_key,
+        max_response_bytes=cfg.get("max_response_bytes", MAX_RESPONSE_BYTES),
+        stream_fields=tuple(cfg.get("stream_fields", ())),
+        host=request_host(key, cfg),
+    )
+
+    if cfg.get("rpc_mode"):
+        headers["Content-Type"] = "application/json"
+        return ChainRequestTemplate(
+            method="POST",
+            headers=MappingProxyType(headers),
+            rpc_url=cfg["api"](""),  # RPC 엔드포인트는 txid와 무관 (txid는 payload로 전달)
+            rpc_method=cfg.get("rpc_method", DEFAULT_RPC_METHOD),
+            rpc_params=cfg.get("rpc_params_lambda"),
+            rpc_mirror_urls=tuple(mirror("") for mirror in cfg.get("api_mirrors", ())),
+            rpc_receipt=bool(cfg.get("rpc_receipt")),
+            **key_options,
+        )
+    return ChainRequestTemplate(method="GET", headers=MappingProxyType(headers), **key_options)
+
+
+class ChainRegistry:
+    """검증된 읽기 전용 체인 설정과 미리 계산한 메타데이터"""
+
+    def __init__(self, configs: Mapping[str, dict]):
+        validate_chain_configs(configs)
+        self.configs = MappingProxyType({key: MappingProxyType(dict(cfg)) for key, cfg in configs.items()})
+        self.order = MappingProxyType({key: index for index, key in enumerate(self.configs)})
+        templates = {key: build_request_template(key, cfg) for key, cfg in self.configs.items()}
+        self.routes = MappingProxyType({key: self._build_routes(key, cfg, templates) for key, cfg in self.configs.items()})
+        self.request_templates = MappingProxyType(templates)  # 체인 키와 대체 공급자 경로 키
+        if not STREAMING_PARSER_AVAILABLE and any(template.stream_fields for template in templates.values()):
+            logger.info("ijson이 설치되지 않아 stream_fields 체인도 응답 본문 전체를 읽습니다 (최대 크기 제한은 적용)")
+
+        self.public_chains = tuple(
+            MappingProxyType({
+                "name": cfg["name"],
+                "symbol": cfg["symbol"],
+                "explorer": cfg["explorer"].replace("/tx/", "/"),
+            })
+            for key, cfg in self.configs.items() if key not in HIDDEN_CHAINS
+        )
+        self.home_chains = tuple(
+            MappingProxyType({"name": cfg["name"], "symbol": cfg["symbol"]})
+            for key, cfg in self.configs.items() if key not in HOME_EXCLUDED_CHAINS
+        )
+
+        # /api/chains 응답은 배포 단위로 고정이므로 본문, ETag, Last-Modified(레지스트리를 만든 시각)를 미리 만들어 둠
+        self.chains_body = json.dumps(
+            {"supportedChains": [dict(chain) for chain in self.public_chains]},
+            ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        self.chains_etag = f'"{hashlib.sha256(self.chains_body).hexdigest()[:16]}"'
+        self.chains_last_modified = formatdate(usegmt=True)
+        logger.info(f"체인 레지스트리 초기화: {len(self.configs)}개 체인")
+
+    @staticmethod
+    def _build_routes(key: str, cfg: Mapping, templates: dict):
+        """체인의 공급자 경로 (필수 API 키가 없는 대체 공급자는 제외)"""
+        routes = [ProviderRoute(key=key, chain=key, provider=cfg.get("provider", key), rank=0, cfg=cfg)]
+        for fallback in cfg.get("fallbacks", ()):
+            route_key = fallback_route_key(key, fallback["provider"])
+            route_cfg = MappingProxyType(fallback_config(cfg, fallback))
+            template = build_request_template(route_key, route_cfg)
+            if template.missing_api_key:
+                continue
+            templates[route_key] = template
+            routes.append(ProviderRoute(key=route_key, chain=key, provider=fallback["provider"], rank=len(routes), cfg=route_cfg))
+        return tuple(routes)
+
+    def __getitem__(self, key: str) -> Mapping:
+        return self.configs[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.configs
+
+    def __iter__(self):
+        return iter(self.configs)
+
+    def __len__(self):
+        return len(self.configs)
+
+
+chain_registry = ChainRegistry(get_chain_configs())
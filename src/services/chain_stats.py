@@ -0,0 +1,143 @@
+"""
+체인별 트랜잭션 조회 통계 (적중률, 지연 시간)
+
+detect_transaction이 체인마다 기록한 결과를 바탕으로 자주 적중하는 체인을 먼저 조회하는
+단계별(staged) 조회 순서를 계산합니다. 누적 카운터는 MongoDB에 주기적으로 증분 저장되어
+재시작 후에도 유지됩니다.
+"""
+import asyncio
+import logging
+import os
+from collections import deque
+
+from chatbot import mongodb_client
+
+logger = logging.getLogger(__name__)
+
+# 통계가 쌓이기 전에 우선 조회할 체인 (실제 조회 트래픽 기준 상위 체인)
+DEFAULT_PRIORITY_CHAINS = ("ethereum", "tron", "bnb_smart_chain", "bitcoin")
+
+# 1단계에서 조회할 체인 수와, 적중이 없을 때 나머지 체인으로 확장하기까지의 대기 시간
+STAGE1_SIZE = int(os.getenv("CHAIN_STAGE1_SIZE", "4"))
+STAGE1_DEADLINE_SECONDS = float(os.getenv("CHAIN_STAGE1_DEADLINE", "2.0"))
+PERSIST_INTERVAL_SECONDS = float(os.getenv("CHAIN_STATS_PERSIST_INTERVAL", "60"))
+
+# 적중률 추정 시 사용하는 사전 분포 (조회 수가 적은 체인이 우연한 적중 한 번으로 순위가 튀지 않도록)
+_PRIOR_LOOKUPS = 20
+_PRIOR_HIT_RATE_PRIORITY = 0.3
+_PRIOR_HIT_RATE_DEFAULT = 0.01
+_LATENCY_WINDOW = 200
+
+_COUNTER_FIELDS = ("lookups", "hits", "latency_total")
+
+
+class ChainStats:
+    """체인별 조회 수, 적중 수, 지연 시간을 추적"""
+
+    def __init__(self):
+        self._persisted = {}  # MongoDB에서 불러온 누적값
+        self._pending = {}    # 아직 저장되지 않은 이 워커의 증분
+        self._latencies = {}  # 최근 지연 시간 (p95 계산용)
+        self._flush_lock = asyncio.Lock()
+
+    def record(self, chain: str, hit: bool, latency: float):
+        """체인 조회 결과 한 건을 기록"""
+        counters = self._pending.setdefault(chain, dict.fromkeys(_COUNTER_FIELDS, 0))
+        counters["lookups"] += 1
+        counters["hits"] += 1 if hit else 0
+        counters["latency_total"] += latency
+        self._latencies.setdefault(chain, deque(maxlen=_LATENCY_WINDOW)).append(latency)
+
+    def _totals(self, chain: str) -> dict:
+        persisted = self._persisted.get(chain, {})
+        pending = self._pending.get(chain, {})
+        return {field: persisted.get(field, 0) + pending.get(field, 0) for field in _COUNTER_FIELDS}
+
+    def hit_rate(self, chain: str) -> float:
+        """사전 분포로 보정한 적중률 추정치"""
+        totals = self._totals(chain)
+        prior_rate = _PRIOR_HIT_RATE_PRIORITY if chain in DEFAULT_PRIORITY_CHAINS else _PRIOR_HIT_RATE_DEFAULT
+        return (totals["hits"] + prior_rate * _PRIOR_LOOKUPS) / (totals["lookups"] + _PRIOR_LOOKUPS)
+
+    def mean_latency(self, chain: str):
+        totals = self._totals(chain)
+        return totals["latency_total"] / totals["lookups"] if totals["lookups"] else None
+
+    def latency_percentile(self, chain: str, percentile: float = 0.95):
+        """최근 지연 시간 기준 백분위수 (표본이 없으면 None)"""
+        samples = sorted(self._latencies.get(chain, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(percentile * (len(samples) - 1))))
+        return samples[index]
+
+    def rank(self, chains):
+        """적중률 내림차순, 같으면 평균 지연 시간 오름차순으로 정렬"""
+        def sort_key(chain):
+            latency = self.mean_latency(chain)
+            return (-self.hit_rate(chain), latency if latency is not None else float("inf"))
+        return sorted(chains, key=sort_key)
+
+    def split_stages(self, chains, stage1_size: int = STAGE1_SIZE):
+        """후보 체인을 (1단계, 나머지)로 나눔. 후보가 적으면 전부 1단계"""
+        ranked = self.rank(chains)
+        if len(ranked) <= stage1_size:
+            return ranked, []
+        return ranked[:stage1_size], ranked[stage1_size:]
+
+    def snapshot(self) -> dict:
+        """관리자 API용 체인별 통계"""
+        chains = set(self._persisted) | set(self._pending)
+        result = {}
+        for chain in self.rank(chains):
+            totals = self._totals(chain)
+            mean_latency = self.mean_latency(chain)
+            p95_latency = self.latency_percentile(chain)
+            result[chain] = {
+                "lookups": totals["lookups"],
+                "hits": totals["hits"],
+                "hit_rate": round(totals["hits"] / totals["lookups"], 4) if totals["lookups"] else 0.0,
+                "score": round(self.hit_rate(chain), 4),
+                "mean_latency_ms": round(mean_latency * 1000, 1) if mean_latency is not None else None,
+                "p95_latency_ms": round(p95_latency * 1000, 1) if p95_latency is not None else None,
+            }
+        return result
+
+    async def load(self):
+        """MongoDB에서 누적 통계 로드"""
+        stored = await mongodb_client.get_chain_stats()
+        self._persisted = {
+            chain: {field: doc.get(field, 0) for field in _COUNTER_FIELDS}
+            for chain, doc in stored.items()
+        }
+        logger.info(f"체인 조회 통계 로드 완료: {len(self._persisted)}개 체인")
+
+    async def flush(self):
+        """이 워커의 증분을 MongoDB에 저장하고 누적값에 반영"""
+        async with self._flush_lock:
+            if not self._pending or mongodb_client.chain_stats_collection is None:
+                return
+            deltas, self._pending = self._pending, {}
+            if await mongodb_client.increment_chain_stats(deltas):
+                for chain, counters in deltas.items():
+                    persisted = self._persisted.setdefault(chain, dict.fromkeys(_COUNTER_FIELDS, 0))
+                    for field, value in counters.items():
+                        persisted[field] += value
+            else:
+                # 저장 실패 시 다음 주기에 다시 시도
+                for chain, counters in deltas.items():
+                    pending = self._pending.setdefault(chain, dict.fromkeys(_COUNTER_FIELDS, 0))
+                    for field, value in counters.items():
+                        pending[field] += value
+
+    async def run_persistence_loop(self, interval: float = PERSIST_INTERVAL_SECONDS):
+        """주기적으로 통계를 저장하는 백그라운드 작업"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"체인 조회 통계 저장 실패: {e}")
+
+
+chain_stats = ChainStats()
@@ -0,0 +1,117 @@
+"""
+체인별 서킷 브레이커
+
+탐색기 API가 연속으로 실패하거나 지나치게 느려지면 해당 체인의 서킷을 열어(open) 일정 시간 동안
+요청을 보내지 않고 즉시 "일시적으로 사용할 수 없음"으로 처리합니다. 복구 대기 시간이 지나면
+반열림(half-open) 상태에서 한 건의 시험 요청만 허용하고, 성공하면 다시 닫습니다(closed).
+"""
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+RECOVERY_TIMEOUT_SECONDS = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30"))
+SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "10"))
+
+
+class CircuitBreaker:
+    """단일 체인의 서킷 상태"""
+
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 recovery_timeout: float = RECOVERY_TIMEOUT_SECONDS, slow_call_seconds: float = SLOW_CALL_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_failure_reason = None
+        self.total_failures = 0
+        self.total_rejected = 0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인 (열린 서킷은 복구 대기 시간이 지나면 시험 요청 한 건만 허용)"""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self.state = STATE_HALF_OPEN
+            logger.info(f"[{self.name}] 서킷 반열림: 시험 요청 허용")
+        if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.total_rejected += 1
+        return False
+
+    def record_success(self, latency: float):
+        """정상 응답 기록 (트랜잭션 없음 포함). 너무 느린 응답은 실패로 간주"""
+        if latency >= self.slow_call_seconds:
+            self.record_failure(f"slow response ({latency:.1f}s)")
+            return
+        if self.state != STATE_CLOSED:
+            logger.info(f"[{self.name}] 서킷 닫힘: 정상 응답 확인")
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self, reason: str = None):
+        """오류/타임아웃 기록. 반열림 상태의 실패나 연속 실패가 임계값에 도달하면 서킷을 엶"""
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        self.last_failure_reason = reason
+        self._probe_in_flight = False
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                logger.warning(f"[{self.name}] 서킷 열림: 연속 실패 {self.consecutive_failures}회 ({reason})")
+            self.state = STATE_OPEN
+            self.opened_at = time.monotonic()
+
+    def abandon(self):
+        """결과 없이 취소된 요청 처리 (반열림 상태의 시험 요청 슬롯 반환)"""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        retry_in = None
+        if self.state == STATE_OPEN:
+            retry_in = round(max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at)), 1)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "total_rejected": self.total_rejected,
+            "last_failure_reason": self.last_failure_reason,
+            "retry_in_seconds": retry_in,
+        }
+
+
+class CircuitBreakerRegistry:
+    """체인 키별 서킷 브레이커 모음"""
+
+    def __init__(self):
+        self._breakers = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(key)
+        return breaker
+
+    def snapshot(self) -> dict:
+        """헬스 체크용 상태 요약"""
+        chains = {key: breaker.snapshot() for key, breaker in sorted(self._breakers.items())}
+        return {
+            "open": [key for key, state in chains.items() if state["state"] == STATE_OPEN],
+            "half_open": [key for key, state in chains.items() if state["state"] == STATE_HALF_OPEN],
+            "chains": chains,
+        }
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,69 @@
+"""
+자주 적중하는 탐색기 호스트로 연결 미리 맺기 (prewarm)
+
+시작 직후나 한동안 요청이 없던 뒤의 첫 조회가 DNS 조회와 TCP/TLS 핸드셰이크 비용을 치르지 않도록, 적중률 상위
+체인의 요청 호스트에 가벼운 HEAD 요청을 보내 DNS 캐시와 keep-alive 연결을 채워 둡니다. 유휴 연결은
+keepalive_expiry가 지나면 닫히므로, 그보다 짧은 간격으로 그동안 요청이 없던 상위 호스트만 다시 연결합니다.
+"""
+import asyncio
+import logging
+import os
+
+import httpx
+
+from . import http_client
+from .chain_registry import chain_registry
+from .chain_stats import chain_stats
+
+logger = logging.getLogger(__name__)
+
+PREWARM_ENABLED = os.getenv("EXPLORER_PREWARM_ENABLED", "true").lower() != "false"
+PREWARM_TOP_CHAINS = int(os.getenv("EXPLORER_PREWARM_TOP_CHAINS", "8"))
+PREWARM_INTERVAL_SECONDS = float(os.getenv(
+    "EXPLORER_PREWARM_INTERVAL", str(max(5.0, http_client.KEEPALIVE_EXPIRY_SECONDS - 10))
+))
+
+
+def prewarm_origins(limit: int = PREWARM_TOP_CHAINS):
+    """적중률 상위 체인의 기본 요청 호스트 (https://host/ 형태, 중복 제거)"""
+    origins = []
+    for key in chain_stats.rank(list(chain_registry))[:limit]:
+        template = chain_registry.request_templates[key]
+        try:
+            url = template.rpc_url or chain_registry[key]["api"]("")
+        except Exception:
+            continue
+        url = httpx.URL(url[0] if isinstance(url, list) else url)
+        origin = f"{url.scheme}://{url.netloc.decode('ascii')}/"
+        if origin not in origins:
+            origins.append(origin)
+    return origins
+
+
+async def prewarm_once(idle_only: bool = False) -> int:
+    """상위 호스트 연결 미리 맺기 (idle_only이면 최근 PREWARM_INTERVAL_SECONDS 동안 요청이 없던 호스트만)"""
+    origins = prewarm_origins()
+    if idle_only:
+        origins = [origin for origin in origins
+                   if http_client.idle_seconds(httpx.URL(origin).host) >= PREWARM_INTERVAL_SECONDS]
+    warmed = await http_client.prewarm(origins)
+    if origins:
+        logger.debug(f"탐색기 연결 미리 맺기: {warmed}/{len(origins)}개 호스트")
+    return warmed
+
+
+async def run_prewarm_loop(interval: float = PREWARM_INTERVAL_SECONDS):
+    """시작 시 한 번, 이후 주기적으로 유휴 상위 호스트의 연결을 다시 맺는 백그라운드 작업"""
+    if not PREWARM_ENABLED or not http_client.KEEPALIVE_ENABLED:
+        return
+    try:
+        warmed = await prewarm_once()
+        logger.info(f"탐색기 연결 미리 맺기 완료: {warmed}개 호스트")
+    except Exception as e:
+        logger.warning(f"탐색기 연결 미리 맺기 실패: {e}")
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await prewarm_once(idle_only=True)
+        except Exception as e:
+            logger.warning(f"탐색기 연결 미리 맺기 실패: {e}")
@@ -0,0 +1,135 @@
+"""
+탐색기 호스트 DNS 캐시
+
+체인마다 다른 탐색기 호스트로 요청하므로 연결을 새로 맺을 때마다 DNS 조회가 지연 시간에 더해집니다. 조회한 주소는
+레코드 TTL 동안(최소/최대 범위 제한) 프로세스 안에 보관하고, 같은 호스트를 동시에 조회하면 한 번만 조회합니다.
+dnspython이 있으면 레코드 TTL을 사용하고, 없거나 조회에 실패하면 시스템 resolver(getaddrinfo)와 기본 TTL을 사용합니다.
+조회가 실패해도 만료된 주소가 있으면 잠시 더 사용합니다(서비스 중단보다 오래된 주소가 낫기 때문).
+"""
+import asyncio
+import ipaddress
+import logging
+import os
+import socket
+import time
+
+import httpcore
+
+from chatbot.single_flight import SingleFlight
+
+# 선택적 의존성 (TTL을 알려주는 DNS resolver, pymongo가 설치하는 dnspython)
+try:
+    import dns.asyncresolver
+    import dns.exception
+except ImportError:
+    dns = None
+
+logger = logging.getLogger(__name__)
+
+DNS_CACHE_ENABLED = os.getenv("DNS_CACHE_ENABLED", "true").lower() != "false"
+DNS_MIN_TTL_SECONDS = float(os.getenv("DNS_CACHE_MIN_TTL", "30"))
+DNS_MAX_TTL_SECONDS = float(os.getenv("DNS_CACHE_MAX_TTL", "600"))
+DNS_DEFAULT_TTL_SECONDS = float(os.getenv("DNS_CACHE_DEFAULT_TTL", "60"))  # TTL을 알 수 없을 때
+DNS_STALE_GRACE_SECONDS = 30.0
+DNS_TIMEOUT_SECONDS = 3.0
+
+
+class DNSCache:
+    """호스트 이름 → IP 주소 목록 (TTL 동안 유지)"""
+
+    def __init__(self):
+        self._entries = {}  # host -> (addresses, expires_at)
+        self._lookups = SingleFlight("dns")
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.stale_served = 0
+
+    async def resolve(self, host: str):
+        """연결할 주소 목록 (IP 주소는 그대로)"""
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+        entry = self._entries.get(host)
+        if entry and entry[1] > time.monotonic():
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return await self._lookups.do(host, self._refresh, host)
+
+    async def _refresh(self, host: str):
+        try:
+            addresses, ttl = await self._lookup(host)
+        except (OSError, asyncio.TimeoutError) as e:
+            self.errors += 1
+            entry = self._entries.get(host)
+            if entry:
+                self.stale_served += 1
+                logger.warning(f"DNS 조회 실패, 만료된 주소 사용: {host} → {e}")
+                self._entries[host] = (entry[0], time.monotonic() + DNS_STALE_GRACE_SECONDS)
+                return entry[0]
+            raise httpcore.ConnectError(f"DNS 조회 실패: {host} ({e})") from e
+        ttl = min(DNS_MAX_TTL_SECONDS, max(DNS_MIN_TTL_SECONDS, ttl))
+        self._entries[host] = (addresses, time.monotonic() + ttl)
+        logger.debug(f"DNS 캐시 갱신: {host} → {addresses} (TTL {ttl:.0f}s)")
+        return addresses
+
+    async def _lookup(self, host: str):
+        """(주소 목록, TTL초)"""
+        if dns is not None:
+            for record_type in ("A", "AAAA"):
+                try:
+                    answer = await dns.asyncresolver.resolve(host, record_type, lifetime=DNS_TIMEOUT_SECONDS)
+                except dns.exception.DNSException:
+                    continue
+                addresses = [record.to_text() for record in answer]
+                if addresses:
+                    return addresses, float(answer.rrset.ttl)
+        # /etc/hosts, 컨테이너 내부 이름 등은 시스템 resolver로
+        infos = await asyncio.wait_for(
+            asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM), timeout=DNS_TIMEOUT_SECONDS
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            raise OSError(f"주소 없음: {host}")
+        return addresses, DNS_DEFAULT_TTL_SECONDS
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {
+            "hosts": len(self._entries),
+            "fresh": sum(1 for _, expires_at in self._entries.values() if expires_at > now),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "stale_served": self.stale_served,
+        }
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """DNS 캐시로 주소를 찾아 연결하는 httpcore network backend (TLS 인증서 검증과 SNI는 원래 호스트 이름 사용)"""
+
+    def __init__(self, cache: DNSCache, backend: httpcore.AsyncNetworkBackend = None):
+        self._cache = cache
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        last_error = None
+        for address in await self._cache.resolve(host):
+            try:
+                return await self._backend.connect_tcp(address, port, timeout=timeout, local_address=local_address,
+                                                       socket_options=socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e  # 다음 주소로 시도
+        raise last_error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float):
+        await self._backend.sleep(seconds)
+
+
+dns_cache = DNSCache()
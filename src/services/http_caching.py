@@ -0,0 +1,86 @@
+"""
+API 응답의 HTTP 캐시 헤더 (ETag, Last-Modified, Cache-Control)와 조건부 요청(304) 처리
+
+브라우저와 리버스 프록시가 같은 트랜잭션/체인 목록을 다시 받지 않도록 응답 본문의 해시를 ETag로 보내고,
+If-None-Match(없으면 If-Modified-Since)가 맞으면 본문 없이 304를 돌려줍니다. 트랜잭션 응답의 보관 기간은
+상태를 따릅니다: 확정되어 더 바뀌지 않는 결과는 길게(immutable), 대기중인 결과는 짧게, 찾지 못했거나 일부
+체인을 조회하지 못한 응답은 곧 바뀔 수 있으므로 짧게 두거나 매번 재검증하게 합니다.
+"""
+import hashlib
+import os
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from .tx_archive import is_final
+from .tx_watcher import is_pending_status
+
+TX_FINAL_MAX_AGE = int(os.getenv("API_TX_FINAL_MAX_AGE", "31536000"))  # 1년
+TX_PENDING_MAX_AGE = int(os.getenv("API_TX_PENDING_MAX_AGE", "5"))
+TX_NOT_FOUND_MAX_AGE = int(os.getenv("API_TX_NOT_FOUND_MAX_AGE", "15"))  # 부정 캐시 TTL과 같게
+TX_DEFAULT_MAX_AGE = int(os.getenv("API_TX_DEFAULT_MAX_AGE", "30"))  # 확인 수가 적거나 상태를 알 수 없는 결과
+# 체인 목록은 배포 단위로만 바뀌므로 길게 두되, 배포 후 한 시간 안에는 새 목록을 받도록 만료 후 백그라운드 재검증
+CHAINS_MAX_AGE = int(os.getenv("API_CHAINS_MAX_AGE", "3600"))
+CHAINS_STALE_WHILE_REVALIDATE = int(os.getenv("API_CHAINS_STALE_WHILE_REVALIDATE", "86400"))
+
+
+def body_etag(body: bytes) -> str:
+    """응답 본문의 강한 ETag"""
+    return f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 값(쉼표로 구분된 목록, *, 약한 ETag 포함)이 etag와 맞는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 압축하는 프록시가 강한 ETag를 W/로 바꿔 돌려줄 수 있으므로 약한 비교
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[str]) -> bool:
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def tx_cache_control(content: dict) -> str:
+    """/api/tx 응답 본문의 상태에 따른 Cache-Control"""
+    if content.get("unavailableChains") or content.get("rateLimitedChains"):
+        return "no-cache"  # 조회하지 못한 체인이 있으면 다음 요청에서 결과가 달라질 수 있음
+    results = content.get("results") or []
+    if not results:
+        return f"public, max-age={TX_NOT_FOUND_MAX_AGE}"
+    if any(is_pending_status(result.get("status")) for result in results):
+        return f"public, max-age={TX_PENDING_MAX_AGE}"
+    if all(is_final(result) for result in results):
+        return f"public, max-age={TX_FINAL_MAX_AGE}, immutable"
+    return f"public, max-age={TX_DEFAULT_MAX_AGE}"
+
+
+def conditional_response(request: Request, response: Response, etag: Optional[str] = None,
+                         last_modified: Optional[str] = None) -> Response:
+    """
+    response에 ETag(없으면 본문 해시)와 Last-Modified를 붙이고, 요청의 조건이 맞으면 같은 헤더의 304로 바꿔 반환.
+    If-None-Match가 있으면 If-Modified-Since는 보지 않음 (RFC 9110)
+    """
+    etag = etag or body_etag(response.body)
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = last_modified
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        unchanged = etag_matches(if_none_match, etag)
+    else:
+        unchanged = not_modified_since(request.headers.get("if-modified-since"), last_modified)
+    if not unchanged:
+        return response
+    headers = {name: value for name, value in response.headers.items()
+               if name in ("etag", "last-modified", "cache-control", "vary")}
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,166 @@
+"""
+탐색기 API용 HTTP 클라이언트
+
+트랜잭션 조회와 대기중 트랜잭션 감시는 워커(이벤트 루프)마다 하나의 keep-alive 클라이언트를 함께 사용합니다.
+조회마다 클라이언트를 새로 만들면 체인마다 DNS 조회, TCP 연결, TLS 핸드셰이크를 매번 다시 하므로, 유휴 연결을
+KEEPALIVE_EXPIRY_SECONDS 동안 풀에 남겨 두고 호스트 주소는 DNS 캐시(dns_cache.py)에서 TTL 동안 재사용합니다.
+EXPLORER_KEEPALIVE=false이면 예전처럼 사용할 때마다 클라이언트를 새로 만들고 닫습니다.
+클라이언트에 transport를 직접 지정하므로 환경 변수의 프록시 설정(HTTP_PROXY, HTTPS_PROXY 등, httpx의 trust_env)은
+탐색기 요청에 적용되지 않습니다.
+이벤트 루프별 공유와 set_transport_factory()는 chatbot/shared_http_client.py를 참고하세요.
+"""
+import asyncio
+import logging
+import os
+import ssl
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+
+import certifi
+import httpcore
+import httpx
+
+from chatbot.shared_http_client import SharedClient, TransportFactory
+from .dns_cache import DNS_CACHE_ENABLED, CachingNetworkBackend, dns_cache
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_ENABLED = os.getenv("EXPLORER_KEEPALIVE", "true").lower() != "false"
+# 호스트별 연결 풀 크기: 동시 연결 수는 기본적으로 제한하지 않고(0), 남겨 두는 유휴 연결 수만 제한
+MAX_CONNECTIONS = int(os.getenv("EXPLORER_MAX_CONNECTIONS", "0")) or None
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("EXPLORER_MAX_KEEPALIVE_CONNECTIONS", "32"))
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("EXPLORER_KEEPALIVE_EXPIRY", "60"))
+PREWARM_TIMEOUT_SECONDS = 5.0
+
+_ssl_context: Optional[ssl.SSLContext] = None
+_last_request_at = {}  # 호스트 -> 마지막 요청 시각 (유휴 호스트 판단용)
+pool_stats = {"clients_created": 0, "prewarmed": 0, "prewarm_failures": 0}
+
+
+def explorer_ssl_context() -> ssl.SSLContext:
+    """호스트별 transport가 함께 쓰는 TLS 설정 (인증서 묶음을 호스트마다 다시 읽지 않도록 한 번만 만듦)"""
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return _ssl_context
+
+
+class DNSCachingTransport(httpx.AsyncHTTPTransport):
+    """
+    DNS 캐시를 거쳐 연결하는 transport (httpx는 network_backend 인자를 받지 않아 연결 풀을 직접 구성).
+    부모 생성자가 만드는 풀은 연결이 없는 빈 객체이지만, 인증서 묶음을 다시 읽지 않도록 같은 TLS 설정을 넘김
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        super().__init__(verify=explorer_ssl_context(), limits=limits)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=explorer_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=CachingNetworkBackend(dns_cache),
+        )
+
+
+class PerHostTransport(httpx.AsyncBaseTransport):
+    """
+    origin(scheme, host, port)마다 transport(연결 풀)를 따로 두는 transport.
+    httpcore 연결 풀은 요청을 배정할 때마다 풀의 모든 연결을 훑으므로, 수십 개 탐색기 호스트의 연결을 한 풀에
+    모으면 동시 조회가 많을 때 배정 비용이 연결 수 × 대기 요청 수로 늘어납니다.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._factory = factory
+        self._transports = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin = (request.url.scheme, request.url.host, request.url.port)
+        transport = self._transports.get(origin)
+        if transport is None:
+            transport = self._transports[origin] = self._factory()
+        return await transport.handle_async_request(request)
+
+    async def aclose(self):
+        transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            await transport.aclose()
+
+
+async def _note_request(request: httpx.Request):
+    _last_request_at[request.url.host] = time.monotonic()
+
+
+def explorer_limits() -> httpx.Limits:
+    """탐색기 호스트별 연결 풀 크기와 유휴 연결 유지 시간"""
+    return httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS)
+
+
+def _create_client(transport_factory: Optional[TransportFactory]) -> httpx.AsyncClient:
+    pool_stats["clients_created"] += 1
+    limits = explorer_limits()
+    hooks = {"request": [_note_request]}
+    if transport_factory is not None:
+        factory = transport_factory
+    elif DNS_CACHE_ENABLED:
+        factory = lambda: DNSCachingTransport(limits)
+    else:
+        factory = lambda: httpx.AsyncHTTPTransport(verify=explorer_ssl_context(), limits=limits)
+    return httpx.AsyncClient(transport=PerHostTransport(factory), event_hooks=hooks)
+
+
+_clients = SharedClient(_create_client)
+set_transport_factory = _clients.set_transport_factory
+shared_client = _clients.get
+aclose = _clients.aclose
+
+
+@asynccontextmanager
+async def explorer_client():
+    """탐색기 API 호출용 클라이언트 (async with로 사용). keep-alive가 켜져 있으면 공유 클라이언트라 닫지 않음"""
+    if KEEPALIVE_ENABLED:
+        yield shared_client()
+        return
+    async with _clients.create() as client:
+        yield client
+
+
+def idle_seconds(host: str) -> float:
+    """호스트로 마지막 요청을 보낸 뒤 지난 시간 (요청한 적이 없으면 무한대)"""
+    last = _last_request_at.get(host)
+    return float("inf") if last is None else time.monotonic() - last
+
+
+async def prewarm(origins) -> int:
+    """
+    origins(https://host/)에 가벼운 HEAD 요청을 보내 DNS 캐시와 keep-alive 연결을 미리 채움.
+    응답 상태와 관계없이 연결이 맺어지면 성공으로 보고, 성공한 호스트 수를 반환
+    """
+    if not KEEPALIVE_ENABLED or not origins:
+        return 0
+    client = shared_client()
+
+    async def warm(origin: str) -> bool:
+        try:
+            await client.head(origin, timeout=PREWARM_TIMEOUT_SECONDS)
+            return True
+        except httpx.HTTPError as e:
+            logger.debug(f"연결 미리 맺기 실패: {origin} → {e}")
+            return False
+
+    results = await asyncio.gather(*(warm(origin) for origin in origins))
+    pool_stats["prewarmed"] += sum(results)
+    pool_stats["prewarm_failures"] += len(results) - sum(results)
+    return sum(results)
+
+
+def snapshot() -> dict:
+    return {
+        "keepalive": KEEPALIVE_ENABLED,
+        "keepalive_expiry_seconds": KEEPALIVE_EXPIRY_SECONDS,
+        "hosts_used": len(_last_request_at),
+        "pools": len(_clients.current._transport._transports) if _clients.current is not None else 0,
+        **pool_stats,
+        "dns": dns_cache.snapshot(),
+    }
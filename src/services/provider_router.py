@@ -0,0 +1,98 @@
+"""
+체인별 공급자 선택 (기본 탐색기 + 대체 공급자)
+
+체인 설정의 "fallbacks"에 순서대로 적은 대체 공급자(공개 RPC, 다른 탐색기 등)는 기본 설정과 같은 스키마로
+정규화되므로 어느 공급자가 응답해도 결과가 같습니다. 공급자별 최근 지연 시간과 오류율(지수 이동 평균)로 기대 응답
+시간을 추정해 가장 빠를 것으로 보이는 공급자부터 조회하고, 실패하거나 hedge 대기 시간 안에 응답하지 않으면 다음
+공급자도 함께 조회합니다. 설정 순서는 작은 가산점으로만 반영되므로 기본 탐색기가 느려지거나 오류를 내면 대체
+공급자가 앞으로 오고, 한동안 조회하지 않은 공급자의 통계는 만료되어 설정 순서로 돌아갑니다.
+"""
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+EWMA_ALPHA = float(os.getenv("PROVIDER_EWMA_ALPHA", "0.2"))
+RANK_BIAS_SECONDS = float(os.getenv("PROVIDER_RANK_BIAS", "0.25"))       # 설정 순서 한 칸당 가산점
+FAILURE_PENALTY_SECONDS = float(os.getenv("PROVIDER_FAILURE_PENALTY", "5.0"))  # 오류율 100%일 때 가산점
+STATS_TTL_SECONDS = float(os.getenv("PROVIDER_STATS_TTL", "120"))
+DEFAULT_LATENCY_SECONDS = 0.5  # 표본이 없는 공급자의 지연 시간 추정치
+
+
+class _ProviderHealth:
+    def __init__(self):
+        self.latency = None       # 지연 시간 지수 이동 평균 (초)
+        self.failure_rate = 0.0   # 오류율 지수 이동 평균
+        self.updated_at = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.wins = 0             # 다른 공급자보다 먼저 유효한 응답을 준 횟수
+
+
+class ProviderRouter:
+    """공급자 경로(ProviderRoute)별 상태를 추적하고 조회 순서를 정함"""
+
+    def __init__(self):
+        self._health = {}
+
+    def _get(self, route_key: str) -> _ProviderHealth:
+        health = self._health.get(route_key)
+        if health is None:
+            health = self._health[route_key] = _ProviderHealth()
+        return health
+
+    def record(self, route_key: str, ok: bool, latency: float = None):
+        """요청 한 건의 결과 기록 (latency가 None이면 오류율만 반영)"""
+        health = self._get(route_key)
+        health.requests += 1
+        health.failures += 0 if ok else 1
+        health.failure_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - health.failure_rate)
+        if latency is not None:
+            health.latency = latency if health.latency is None else health.latency + EWMA_ALPHA * (latency - health.latency)
+        health.updated_at = time.monotonic()
+
+    def record_abandoned(self, route_key: str, elapsed: float):
+        """다른 공급자가 먼저 응답해 취소된 요청: 추정치가 없거나 그보다 오래 걸렸을 때만 반영 (최소한 그만큼 느렸음)"""
+        health = self._get(route_key)
+        if health.latency is None:
+            health.latency = elapsed
+        elif elapsed > health.latency:
+            health.latency += EWMA_ALPHA * (elapsed - health.latency)
+        else:
+            return
+        health.updated_at = time.monotonic()
+
+    def record_win(self, route_key: str):
+        self._get(route_key).wins += 1
+
+    def expected_latency(self, route) -> float:
+        """기대 응답 시간 = 지연 시간 추정치 + 오류율 가산점 + 설정 순서 가산점 (통계가 만료되면 설정 순서만 반영)"""
+        health = self._health.get(route.key)
+        bias = route.rank * RANK_BIAS_SECONDS
+        if health is None or time.monotonic() - health.updated_at > STATS_TTL_SECONDS:
+            return DEFAULT_LATENCY_SECONDS + bias
+        latency = health.latency if health.latency is not None else DEFAULT_LATENCY_SECONDS
+        return latency + health.failure_rate * FAILURE_PENALTY_SECONDS + bias
+
+    def rank(self, routes):
+        """기대 응답 시간 오름차순 (같으면 설정 순서)"""
+        return sorted(routes, key=lambda route: (self.expected_latency(route), route.rank))
+
+    def snapshot(self) -> dict:
+        """관리자 API용 공급자별 상태"""
+        now = time.monotonic()
+        return {
+            route_key: {
+                "requests": health.requests,
+                "failures": health.failures,
+                "wins": health.wins,
+                "latency_ms": round(health.latency * 1000, 1) if health.latency is not None else None,
+                "failure_rate": round(health.failure_rate, 3),
+                "stale": now - health.updated_at > STATS_TTL_SECONDS,
+            }
+            for route_key, health in sorted(self._health.items())
+        }
+
+
+provider_router = ProviderRouter()
@@ -0,0 +1,119 @@
+"""
+탐색기 공급자별 요청 한도 (토큰 버킷)
+
+같은 요청 호스트와 API 키를 쓰는 체인들(예: api.blockcypher.com의 BTC/LTC/DOGE)은 하나의 버킷을 함께 사용하고,
+공급자 이름은 버킷의 한도 값만 정합니다. Etherscan 계열(bscscan, arbiscan 등)처럼 같은 공급자라도 탐색기 도메인이
+다르면 한도를 공유하지 않으므로 버킷을 따로 둡니다. 토큰이 부족하면 최대 RATE_LIMIT_MAX_WAIT초까지 대기열에서 기다리고, 그보다 오래 기다려야
+하면 요청을 보내지 않고 버립니다(shed). 업스트림이 429를 돌려주면 Retry-After 동안 버킷을 비워 둡니다.
+"""
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# 공급자별 (초당 요청 수, 버스트 크기). 무료 플랜 문서 기준이며 RATE_LIMIT_<PROVIDER>="rate[:burst]"로 재정의 가능
+DEFAULT_RATE_LIMITS = {
+    "blockcypher": (3.0, 3),
+    "etherscan": (5.0, 5),
+    "blockscout": (10.0, 10),
+    "tonapi": (1.0, 1),
+    "solana_rpc": (10.0, 10),
+    "tronscan": (5.0, 5),
+    "ankr": (20.0, 20),
+}
+FALLBACK_RATE_LIMIT = (10.0, 10)
+MAX_WAIT_SECONDS = float(os.getenv("RATE_LIMIT_MAX_WAIT", "1.0"))
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() != "false"  # 로컬 스텁 벤치마크 등에서 끔
+
+
+def _configured_rate_limit(provider: str):
+    override = os.getenv(f"RATE_LIMIT_{provider.upper()}")
+    if override:
+        try:
+            rate, _, burst = override.partition(":")
+            return float(rate), int(burst) if burst else max(1, int(float(rate)))
+        except ValueError:
+            logger.warning(f"잘못된 요청 한도 설정 무시: RATE_LIMIT_{provider.upper()}={override}")
+    return DEFAULT_RATE_LIMITS.get(provider, FALLBACK_RATE_LIMIT)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.throttled = 0
+        self.shed = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, max_wait: float):
+        """토큰 한 개를 예약하고 기다려야 할 시간을 반환 (max_wait보다 길면 예약하지 않고 None)"""
+        self._refill()
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        if wait > max_wait:
+            self.shed += 1
+            return None
+        self.tokens -= 1
+        if wait > 0:
+            self.throttled += 1
+        return wait
+
+    def backoff(self, seconds: float):
+        """업스트림 429 응답 후 seconds 동안 토큰을 지급하지 않음"""
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+class RateLimiter:
+    """(공급자, 요청 호스트, API 키)별 토큰 버킷 모음"""
+
+    def __init__(self, max_wait: float = MAX_WAIT_SECONDS, enabled: bool = RATE_LIMIT_ENABLED):
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self._buckets = {}
+
+    def _bucket(self, provider: str, api_key: str, host: str) -> TokenBucket:
+        bucket_key = (provider, host or "", api_key or "")
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = TokenBucket(*_configured_rate_limit(provider))
+        return bucket
+
+    async def acquire(self, provider: str, api_key: str = None, host: str = None) -> bool:
+        """요청 한 건을 보낼 수 있을 때까지 대기. 한도 때문에 버려야 하면 False"""
+        if not self.enabled:
+            return True
+        wait = self._bucket(provider, api_key, host).reserve(self.max_wait)
+        if wait is None:
+            logger.debug(f"[{provider}] 요청 한도 초과로 요청을 보내지 않음 ({host})")
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def penalize(self, provider: str, api_key: str = None, host: str = None, retry_after: float = 1.0):
+        """업스트림이 429를 반환했을 때 호출"""
+        logger.debug(f"[{provider}] 업스트림 429 ({host}), {retry_after:.1f}초 동안 요청 보류")
+        self._bucket(provider, api_key, host).backoff(retry_after)
+
+    def snapshot(self) -> dict:
+        """공급자별 버킷 상태 (API 키는 노출하지 않음)"""
+        result = {}
+        for (provider, _, _), bucket in self._buckets.items():
+            entry = result.setdefault(provider, {"rate": bucket.rate, "burst": bucket.burst, "buckets": 0, "throttled": 0, "shed": 0})
+            entry["buckets"] += 1
+            entry["throttled"] += bucket.throttled
+            entry["shed"] += bucket.shed
+        return result
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,161 @@
+"""
+탐색기 응답 본문 제한 읽기
+
+탐색기 응답은 스트리밍으로 읽으며 체인별 최대 크기(max_response_bytes)를 넘으면 더 읽지 않습니다. 입력이 수천 개인
+Bitcoin 계열 트랜잭션이나 로그가 긴 Cosmos 계열 응답처럼 큰 본문을 전부 메모리에 올려 파싱하지 않도록,
+stream_fields를 지정한 체인은 ijson(requirements.txt)으로 본문을 받는 대로 파싱하면서 지정한 필드만 조립하고 배열은
+앞쪽 몇 개 항목만 남깁니다. 최대 크기에서 멈추면 그때까지 읽은 필드를 돌려주고 잘림(truncated)으로 표시합니다.
+ijson이 없거나 stream_fields가 없는 체인은 최대 크기까지 읽은 본문을 한 번에 파싱하고, 넘으면 ResponseTooLarge입니다.
+"""
+import json
+import logging
+import os
+
+import httpx
+
+# 스트리밍 JSON 파서 (requirements.txt에 포함, 설치되지 않은 환경에서는 본문 전체 파싱으로 대체)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+MAX_RESPONSE_BYTES = int(os.getenv("EXPLORER_MAX_RESPONSE_BYTES", str(2 * 1024 * 1024)))
+STREAM_MAX_ARRAY_ITEMS = int(os.getenv("EXPLORER_STREAM_MAX_ARRAY_ITEMS", "5"))
+STREAMING_PARSER_AVAILABLE = ijson is not None
+# 한도 초과/인증 실패 응답 판별에 필요하므로 stream_fields와 관계없이 항상 남기는 필드
+ALWAYS_KEPT_FIELDS = ("result", "message", "error")
+
+response_stats = {"streamed": 0, "truncated": 0, "too_large": 0}
+
+
+class ResponseTooLarge(Exception):
+    """응답 본문이 최대 크기를 넘어 파싱하지 않음"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"응답 본문이 최대 크기({limit} bytes)를 넘음")
+        self.limit = limit
+
+
+async def read_body(response: httpx.Response, max_bytes: int) -> bytes:
+    """스트리밍 응답 본문을 max_bytes까지만 읽음 (Content-Length가 이미 크면 읽지 않음)"""
+    content_length = response.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        response_stats["too_large"] += 1
+        raise ResponseTooLarge(max_bytes)
+    chunks = []
+    total = 0
+    async for chunk in response.aiter_bytes():
+        total += len(chunk)
+        if total > max_bytes:
+            response_stats["too_large"] += 1
+            raise ResponseTooLarge(max_bytes)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def read_json(response: httpx.Response, max_bytes: int = MAX_RESPONSE_BYTES, fields=()):
+    """
+    응답 본문을 JSON으로 읽어 (데이터, 잘림 여부)를 반환합니다. fields가 있고 ijson이 설치되어 있으면 필드 선택 파싱.
+    JSON이 아니면 ValueError, 최대 크기를 넘으면(필드 선택 파싱이 아닐 때) ResponseTooLarge.
+    """
+    if fields and STREAMING_PARSER_AVAILABLE:
+        return await _read_selected(response, max_bytes, fields)
+    body = await read_body(response, max_bytes)
+    try:
+        return json.loads(body), False
+    except ValueError as e:
+        raise ValueError(f"{e}. 응답 본문: {body[:200].decode('utf-8', 'replace')}") from e
+
+
+async def _read_selected(response: httpx.Response, max_bytes: int, fields):
+    selector = _FieldSelector((*fields, *ALWAYS_KEPT_FIELDS), STREAM_MAX_ARRAY_ITEMS)
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)  # 정규화 함수가 float 연산을 하므로 Decimal 대신 float
+    total = 0
+    truncated = False
+    response_stats["streamed"] += 1
+    try:
+        async for chunk in response.aiter_bytes():
+            if total + len(chunk) > max_bytes:
+                chunk = chunk[:max_bytes - total]
+                truncated = True
+            total += len(chunk)
+            parser.send(chunk)
+            selector.feed_all(events)
+            del events[:]
+            if truncated:
+                break
+        if not truncated:
+            parser.close()
+            selector.feed_all(events)
+    except ijson.JSONError as e:
+        raise ValueError(f"JSON 스트림 파싱 실패: {e}") from e
+    if truncated:
+        response_stats["truncated"] += 1
+        logger.debug(f"응답 본문을 {max_bytes} bytes에서 자르고 읽은 필드만 사용")
+    return selector.finish(), truncated
+
+
+class _FieldSelector:
+    """ijson 이벤트 중 지정한 경로(점 구분, 배열 안 경로 제외)의 값만 조립하고, 배열은 앞쪽 max_items개만 남김"""
+
+    def __init__(self, fields, max_items: int):
+        self.fields = frozenset(fields)
+        self.max_items = max_items
+        self.document = {}
+        self._path = None
+        self._builder = None
+        self._stack = []       # 조립 중인 컨테이너: 배열이면 [항목 수], 객체면 None
+        self._skip_depth = 0   # 버리는 배열 항목의 중첩 깊이
+
+    def feed_all(self, events):
+        for prefix, event, value in events:
+            self.feed(prefix, event, value)
+
+    def feed(self, prefix: str, event: str, value):
+        if self._builder is None:
+            if prefix not in self.fields or event in ("map_key", "end_map", "end_array"):
+                return
+            self._path = prefix
+            self._builder = ijson.ObjectBuilder()
+        if self._skip_depth:
+            if event in ("start_map", "start_array"):
+                self._skip_depth += 1
+            elif event in ("end_map", "end_array"):
+                self._skip_depth -= 1
+            return
+        starts_value = event not in ("map_key", "end_map", "end_array")
+        if starts_value and self._stack and self._stack[-1] is not None:
+            self._stack[-1][0] += 1
+            if self._stack[-1][0] > self.max_items:
+                if event in ("start_map", "start_array"):
+                    self._skip_depth = 1
+                return
+        self._builder.event(event, value)
+        if event == "start_map":
+            self._stack.append(None)
+        elif event == "start_array":
+            self._stack.append([0])
+        elif event in ("end_map", "end_array"):
+            self._stack.pop()
+        if not self._stack:
+            self._store()
+
+    def _store(self):
+        target = self.document
+        *parents, name = self._path.split(".")
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = self._builder.value
+        self._builder = None
+        self._path = None
+
+    def finish(self) -> dict:
+        """지금까지 조립한 문서 (잘려서 조립 중인 값이 있으면 그 부분까지 포함)"""
+        if self._builder is not None and hasattr(self._builder, "value"):
+            self._stack = []
+            self._skip_depth = 0
+            self._store()
+        return self.document
@@ -1,145 +1,820 @@
 import asyncio
+import functools
 import httpx
 import os
-import base64
-import urllib.parse
-import certifi
 import logging
-from .chain_configs import get_chain_configs
-from .cache import cache
+import time
+from .chain_registry import chain_registry, RPC_BLOCK_NUMBER_ID
+from .http_client import explorer_client
+from .cache import cache, negative_cache, chain_miss_cache, chain_miss_key, transaction_cache_ttl
+from .chain_stats import chain_stats, STAGE1_DEADLINE_SECONDS
+from .circuit_breaker import circuit_breakers
+from .provider_router import provider_router
+from .rate_limiter import rate_limiter
+from .response_reader import ResponseTooLarge, read_json
+from .tx_watcher import tx_watcher
+from .tx_archive import tx_archive
+from chatbot.single_flight import SingleFlight
 
-CHAIN_CONFIGS = get_chain_configs()
+CHAIN_CONFIGS = chain_registry.configs
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-async def detect_transaction(txid: str):
+# 체인별 조회 결과 상태
+LOOKUP_FOUND = "found"
+LOOKUP_NOT_FOUND = "not_found"
+LOOKUP_ERROR = "error"
+LOOKUP_UNAVAILABLE = "unavailable"  # 서킷이 열려 있어 조회하지 않음
+LOOKUP_RATE_LIMITED = "rate_limited"  # 공급자 요청 한도 때문에 조회하지 못함 (로컬 제한 또는 업스트림 429)
+
+# 배치 조회: 한 번에 받을 수 있는 최대 txid 수와 JSON-RPC 배치 요청 하나에 담을 최대 호출 수
+BATCH_MAX_TXIDS = int(os.getenv("TX_BATCH_MAX_TXIDS", "50"))
+RPC_BATCH_SIZE = int(os.getenv("RPC_BATCH_SIZE", "20"))
+RPC_BATCH_UNSUPPORTED_STATUSES = (400, 404, 405, 413)  # 배치 요청을 거부하는 엔드포인트
+
+# 같은 txid에 대한 동시 조회를 하나로 합침 (전체 조회 / 체인별 요청)
+transaction_lookups = SingleFlight("tx-lookup")
+chain_lookups = SingleFlight("tx-chain")
+
+# 예비 엔드포인트(api_mirrors) 헤지 요청: 기본 엔드포인트가 체인 p95 지연 시간 안에 응답하지 않으면 다음 엔드포인트도 요청
+HEDGE_ENABLED = os.getenv("TX_HEDGE_ENABLED", "true").lower() != "false"
+HEDGE_DEFAULT_DELAY = float(os.getenv("TX_HEDGE_DEFAULT_DELAY", "1.0"))  # 지연 시간 표본이 없을 때
+HEDGE_MIN_DELAY = float(os.getenv("TX_HEDGE_MIN_DELAY", "0.2"))
+HEDGE_MAX_DELAY = float(os.getenv("TX_HEDGE_MAX_DELAY", "3.0"))
+hedge_stats = {"requests": 0, "hedged": 0, "mirror_wins": 0}
+
+OUTCOME_MESSAGES = {
+    LOOKUP_UNAVAILABLE: "chain temporarily unavailable",
+    LOOKUP_RATE_LIMITED: "chain rate limited, please retry shortly",
+}
+
+def select_candidate_chains(txid: str):
+    """TXID 형식으로 후보 체인을 고릅니다. (체인 키, 설정, API 호출용 txid) 목록을 반환합니다."""
+    candidates = []
+    if not isinstance(txid, str):
+        return candidates
+    for key, cfg in CHAIN_CONFIGS.items():
+        classify = cfg.get("classify_txid")
+        txid_for_api = classify(txid) if classify else txid
+        if txid_for_api:
+            candidates.append((key, cfg, txid_for_api))
+    return candidates
+
+async def iter_transaction_results(txid: str, first_match: bool = False, outcomes: dict = None):
+    """
+    후보 체인을 동시에 조회하면서 정규화된 결과를 응답이 오는 순서대로 yield 합니다.
+
+    Args:
+        txid: 사용자가 입력한 트랜잭션 해시
+        first_match: True이면 첫 번째 결과를 yield 한 뒤 나머지 체인 요청을 취소
+        outcomes: 전달하면 조회한 체인별 결과 상태(LOOKUP_*)를 채워 넣음
+
+    전체 체인 조회가 끝난 경우에만 결과를 캐시에 저장합니다. 소비자가 중간에 이터레이션을 멈추면
+    (클라이언트 연결 종료 등) 진행 중인 요청도 함께 취소됩니다.
+
+    찾지 못한 결과는 짧은 TTL의 부정 캐시에 기록됩니다. 모든 후보 체인이 "없음"으로 응답하면 txid 전체를,
+    일부 체인만 응답했거나 오류가 섞였으면 "없음"으로 응답한 체인만 기록해 재시도 시 나머지 체인만 조회합니다.
+    """
     cached_result = cache.get(txid)
     if cached_result:
         logger.debug(f"Cache hit for txid: {txid}")
-        return cached_result
+        for result in cached_result[:1] if first_match else cached_result:
+            yield result
+        return
     logger.debug(f"Cache miss for txid: {txid}")
+    if negative_cache.get(txid):
+        logger.debug(f"Negative cache hit for txid: {txid}")
+        return
+    # 확정된 트랜잭션은 체인 조회 없이 아카이브에서 반환 (다른 워커나 이전 배포에서 조회한 결과 포함)
+    archived_result = await tx_archive.get(txid)
+    if archived_result:
+        logger.debug(f"Archive hit for txid: {txid}")
+        cache.set(txid, archived_result, ttl_seconds=transaction_cache_ttl(archived_result))
+        for result in archived_result[:1] if first_match else archived_result:
+            yield result
+        return
 
-    async with httpx.AsyncClient(verify=certifi.where()) as client:
-        tasks = []
-        for key, cfg in CHAIN_CONFIGS.items():
-            input_txid_for_chain = txid
+    candidates = select_candidate_chains(txid)
+    if not candidates:
+        logger.debug(f"TXID '{txid}' 형식과 일치하는 체인이 없습니다. 조회를 건너뜁니다.")
+        return
+    candidates = [candidate for candidate in candidates if not chain_miss_cache.get(chain_miss_key(candidate[0], txid))]
+    if not candidates:
+        logger.debug(f"모든 후보 체인이 최근 조회에서 '없음'으로 응답했습니다: {txid}")
+        return
+    logger.debug(f"후보 체인 {len(candidates)}/{len(CHAIN_CONFIGS)}개: {[key for key, _, _ in candidates]}")
 
-            if key == "ton" and cfg.get("api_url_type") == "hex_from_base64_input":
-                if isinstance(txid, str) and (len(txid) == 44 or len(txid) == 47 or len(txid) == 48) and \
-                   ('/' in txid or '+' in txid or txid.endswith('=')):
+    candidates_by_key = {key: (cfg, txid_for_api) for key, cfg, txid_for_api in candidates}
+    # 적중률이 높은 체인부터 조회하고, 마감 시간 내 적중이 없을 때만 나머지 체인으로 확장
+    stage1_keys, stage2_keys = chain_stats.split_stages(list(candidates_by_key))
+    found_results = []
+    not_found_keys = []
+    completed = False
+
+    async def run(key):
+        cfg, txid_for_api = candidates_by_key[key]
+        status, result = await lookup_chain(client, txid_for_api, key, cfg, txid)
+        if outcomes is not None:
+            outcomes[key] = status
+        if status == LOOKUP_NOT_FOUND:
+            not_found_keys.append(key)
+        return key, result
+
+    async with explorer_client() as client:
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.create_task(run(key)) for key in stage1_keys]
+        pending = set(tasks)
+        widened = not stage2_keys
+        stage1_deadline = loop.time() + STAGE1_DEADLINE_SECONDS
+        try:
+            while pending:
+                timeout = None if widened else max(0.0, stage1_deadline - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
                     try:
-                        logger.debug(f"[{key}] Attempting to convert Base64 TXID '{txid}' to HEX for API call.")
-                        missing_padding = len(txid) % 4
-                        txid_padded = txid + '=' * (4 - missing_padding) if missing_padding else txid
-                        
-                        decoded_bytes = None
-                        try:
-                            decoded_bytes = base64.b64decode(txid_padded)
-                        except base64.binascii.Error:
-                            txid_urlsafe_corrected = txid_padded.replace('-', '+').replace('_', '/')
-                            decoded_bytes = base64.b64decode(txid_urlsafe_corrected)
-                        
-                        if decoded_bytes:
-                            input_txid_for_chain = decoded_bytes.hex()
-                            logger.debug(f"[{key}] Converted Base64 TXID '{txid}' to HEX '{input_txid_for_chain}'")
-                        else:
-                            logger.debug(f"[{key}] Base64 decoding resulted in None for TXID '{txid}'. Using original.")
+                        chain_key, result = task.result()
                     except Exception as e:
-                        logger.debug(f"[{key}] Failed to convert TXID '{txid}' from Base64 to HEX: {e}. Using original txid '{txid}'.")
-                elif len(txid) == 64 and all(c in '0123456789abcdefABCDEF' for c in txid.lower()):
-                    logger.debug(f"[{key}] TXID '{txid}' appears to be already in HEX format.")
-                    input_txid_for_chain = txid
-                else:
-                    logger.debug(f"[{key}] TXID '{txid}' format not recognized as Base64 or HEX for TON. Using original for API call.")
-            
-            tasks.append(fetch_and_normalize(client, input_txid_for_chain, key, cfg, original_input_txid=txid))
-
-        results_with_errors = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        found_results = []
-        for i, res_or_err in enumerate(results_with_errors):
-            chain_key = list(CHAIN_CONFIGS.keys())[i]
-            if isinstance(res_or_err, Exception):
-                logger.debug(f"[{chain_key}] 작업 중 예외 발생: {res_or_err}")
-            elif res_or_err:
-                found_results.append(res_or_err)
-                
+                        logger.debug(f"작업 중 예외 발생: {e}")
+                        continue
+                    if result:
+                        found_results.append((chain_key, result))
+                        yield result
+                        if first_match:
+                            return
+                if not widened and not found_results and (not pending or loop.time() >= stage1_deadline):
+                    logger.debug(f"1단계 체인 {stage1_keys}에서 적중 없음, 나머지 {len(stage2_keys)}개 체인으로 확장")
+                    stage2_tasks = [asyncio.create_task(run(key)) for key in stage2_keys]
+                    tasks.extend(stage2_tasks)
+                    pending |= set(stage2_tasks)
+                    widened = True
+            completed = True
+        finally:
+            in_flight = [task for task in tasks if not task.done()]
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                logger.debug(f"진행 중인 체인 요청 {len(in_flight)}개 취소")
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    if completed:
+        _cache_lookup_outcome(txid, found_results, not_found_keys, candidates)
+
+async def lookup_transaction(txid: str):
+    """
+    트랜잭션을 조회해 결과와 함께 조회하지 못한 체인 정보를 반환합니다.
+    같은 txid의 동시 호출은 하나의 조회를 공유하므로 반환값을 수정하지 마세요.
+
+    Returns:
+        {"results": [...], "unavailable": [{"chain", "name", "message"}, ...], "rate_limited": [...]}
+    """
+    return await transaction_lookups.do(txid, _lookup_transaction, txid)
+
+async def _lookup_transaction(txid: str):
+    outcomes = {}
+    found_results = [result async for result in iter_transaction_results(txid, outcomes=outcomes)]
+    # 캐시와 동일하게 체인 설정 순서로 정렬
+    found_results.sort(key=lambda result: chain_registry.order.get(result.get("chain"), len(chain_registry.order)))
+    return {
+        "results": found_results,
+        "unavailable": chains_with_outcome(outcomes, LOOKUP_UNAVAILABLE),
+        "rate_limited": chains_with_outcome(outcomes, LOOKUP_RATE_LIMITED),
+    }
+
+def chains_with_outcome(outcomes: dict, status: str):
+    """체인별 결과 상태에서 주어진 상태(UNAVAILABLE, RATE_LIMITED)로 끝난 체인 목록을 만듦"""
+    return [
+        {"chain": key, "name": CHAIN_CONFIGS[key]["name"].strip(), "message": OUTCOME_MESSAGES[status]}
+        for key, outcome in outcomes.items() if outcome == status
+    ]
+
+async def transaction_response(txid: str) -> dict:
+    """
+    /api/tx/{txid} 응답 본문. 웹 API와 챗봇(transaction_specialist)이 같은 프로세스에서 공유하는 조회 인터페이스로,
+    캐시, 동시 요청 병합, HTTP 클라이언트를 함께 사용합니다.
+    """
+    lookup = await lookup_transaction(txid)
+    results = lookup["results"]
+    if results:
+        content = {"found": True, "results": results}
+    else:
+        content = {"found": False, "message": "Transaction not found on supported chains."}
+    # 서킷이 열렸거나 요청 한도에 걸려 조회하지 못한 체인은 "찾을 수 없음"과 구분해서 알려줌
+    if lookup["unavailable"]:
+        content["unavailableChains"] = lookup["unavailable"]
+    if lookup["rate_limited"]:
+        content["rateLimitedChains"] = lookup["rate_limited"]
+    # 대기중인 트랜잭션은 감시 중이므로 다시 조회하지 않고 상태 변경을 구독할 수 있음
+    if tx_watcher.is_watching(txid):
+        content["watch"] = f"/api/tx/{txid}/watch"
+    return content
+
+async def detect_transaction(txid: str):
+    return (await lookup_transaction(txid))["results"]
+
+async def iter_batch_transaction_results(txids, outcomes: dict = None):
+    """
+    여러 트랜잭션을 함께 조회하면서 (이벤트, txid, 데이터)를 응답이 오는 순서대로 yield 합니다.
+
+    - ("result", txid, 정규화된 결과): 결과 하나를 찾음
+    - ("done", txid, 찾은 결과 수): 해당 txid의 조회가 끝남 (캐시 반영 완료)
+
+    체인별로 요청을 모아 rpc_mode 체인은 JSON-RPC 배치 요청(최대 RPC_BATCH_SIZE개)으로, 나머지 체인은 txid별로
+    조회합니다. 단일 조회와 같이 적중률 상위 체인부터 조회하고, 1단계에서 찾지 못한 txid만 나머지 체인으로
+    확장합니다. outcomes를 전달하면 txid별 {체인: 결과 상태(LOOKUP_*)}를 채워 넣습니다.
+    """
+    if outcomes is None:
+        outcomes = {}
+    candidates = {}  # txid -> {체인 키: API 호출용 txid}
+    stages = {}      # txid -> (1단계 체인, 나머지 체인)
+    for txid in dict.fromkeys(txids):
+        cached_result = cache.get(txid)
+        if cached_result:
+            for result in cached_result:
+                yield "result", txid, result
+            yield "done", txid, len(cached_result)
+            continue
+        if negative_cache.get(txid):
+            yield "done", txid, 0
+            continue
+        by_key = {
+            key: txid_for_api for key, _, txid_for_api in select_candidate_chains(txid)
+            if not chain_miss_cache.get(chain_miss_key(key, txid))
+        }
+        if not by_key:
+            yield "done", txid, 0
+            continue
+        candidates[txid] = by_key
+        stages[txid] = chain_stats.split_stages(list(by_key))
+    for txid, archived_result in (await tx_archive.get_many(list(candidates))).items():
+        cache.set(txid, archived_result, ttl_seconds=transaction_cache_ttl(archived_result))
+        for result in archived_result:
+            yield "result", txid, result
+        yield "done", txid, len(archived_result)
+        del candidates[txid], stages[txid]
+    if not candidates:
+        return
+
+    found_results = {txid: [] for txid in candidates}
+    not_found_keys = {txid: [] for txid in candidates}
+    outstanding = dict.fromkeys(candidates, 0)  # txid별 진행 중인 체인 조회 수
+    widened = set()
+    reported = set()
+    tasks = []
+    pending = set()
+
+    async def run(key, cfg, items):
+        started = time.monotonic()
+        try:
+            if len(items) == 1:
+                txid, txid_for_api = items[0]
+                statuses = [(txid, *await lookup_chain(client, txid_for_api, key, cfg, txid))]
+            else:
+                statuses = await fetch_chain_results_batch(client, items, key, cfg)
+                latency = time.monotonic() - started
+                for txid, status, _ in statuses:
+                    _record_chain_outcome(key, txid, status, latency)
+        except Exception as e:
+            logger.debug(f"[{key}] 배치 조회 작업 중 예외 발생: {e}")
+            statuses = [(txid, LOOKUP_ERROR, None) for txid, _ in items]
+        for txid, status, _ in statuses:
+            outcomes.setdefault(txid, {})[key] = status
+            if status == LOOKUP_NOT_FOUND:
+                not_found_keys[txid].append(key)
+        return key, statuses
+
+    def launch(pairs):
+        """(txid, 체인 키) 목록을 체인별로 묶어 요청 작업을 시작"""
+        items_by_key = {}
+        for txid, key in pairs:
+            outstanding[txid] += 1
+            items_by_key.setdefault(key, []).append((txid, candidates[txid][key]))
+        for key, items in items_by_key.items():
+            cfg = CHAIN_CONFIGS[key]
+            batch_size = RPC_BATCH_SIZE if cfg.get("rpc_mode") else 1
+            if cfg.get("rpc_receipt"):
+                batch_size = max(1, RPC_BATCH_SIZE // 2)  # txid마다 트랜잭션과 영수증 두 건을 호출
+            for start in range(0, len(items), batch_size):
+                task = asyncio.create_task(run(key, cfg, items[start:start + batch_size]))
+                tasks.append(task)
+                pending.add(task)
+
+    async with explorer_client() as client:
+        loop = asyncio.get_running_loop()
+        stage1_deadline = loop.time() + STAGE1_DEADLINE_SECONDS
+        launch([(txid, key) for txid, (stage1_keys, _) in stages.items() for key in stage1_keys])
+        try:
+            while pending:
+                waiting = any(txid not in widened and not found_results[txid] for txid in candidates)
+                timeout = max(0.0, stage1_deadline - loop.time()) if waiting else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                for task in done:
+                    key, statuses = task.result()
+                    for txid, _, result in statuses:
+                        outstanding[txid] -= 1
+                        if result:
+                            found_results[txid].append((key, result))
+                            yield "result", txid, result
+
+                # 1단계 조회가 끝났거나 마감 시간이 지났는데 찾지 못한 txid만 나머지 체인으로 확장
+                deadline_passed = loop.time() >= stage1_deadline
+                widen_pairs = []
+                for txid, (_, stage2_keys) in stages.items():
+                    if txid in widened or found_results[txid]:
+                        continue
+                    if outstanding[txid] == 0 or deadline_passed:
+                        widened.add(txid)
+                        widen_pairs.extend((txid, key) for key in stage2_keys)
+                if widen_pairs:
+                    logger.debug(f"1단계에서 적중 없는 txid {len({txid for txid, _ in widen_pairs})}개를 나머지 체인으로 확장")
+                    launch(widen_pairs)
+
+                for txid in candidates:
+                    if txid in reported or outstanding[txid] or not (found_results[txid] or txid in widened):
+                        continue
+                    reported.add(txid)
+                    _cache_lookup_outcome(txid, found_results[txid], not_found_keys[txid], candidates[txid])
+                    yield "done", txid, len(found_results[txid])
+        finally:
+            in_flight = [task for task in tasks if not task.done()]
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                logger.debug(f"진행 중인 배치 조회 요청 {len(in_flight)}개 취소")
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+def _cache_lookup_outcome(txid: str, found_results: list, not_found_keys: list, candidate_keys):
+    """조회가 끝난 txid의 결과를 캐시에 반영 (결과는 체인 설정 순서로 정렬, 대기중이면 감시 시작, 확정이면 아카이브)"""
     if found_results:
-        logger.debug(f"Setting cache for original input txid: {txid} with results: {found_results}")
-        cache.set(txid, found_results)
+        found_results = sorted(found_results, key=lambda item: chain_registry.order[item[0]])
+        results = [result for _, result in found_results]
+        logger.debug(f"Setting cache for original input txid: {txid} with results: {results}")
+        cache.set(txid, results, ttl_seconds=transaction_cache_ttl(results))
+        # 대기중인 결과는 찾은 체인만 다시 조회하며 캐시를 갱신하고, 확정된 결과는 아카이브에 저장
+        tx_watcher.watch(txid, found_results)
+        tx_archive.archive(txid, found_results)
+    elif len(not_found_keys) == len(candidate_keys):
+        logger.debug(f"Setting negative cache for txid: {txid}")
+        negative_cache.set(txid, True)
+
+async def lookup_chain(client: httpx.AsyncClient, txid_for_api: str, key: str, cfg: dict, txid: str):
+    """
+    체인 하나를 조회하고 적중률 통계와 체인별 부정 캐시에 반영해 (조회 결과 상태, 정규화된 데이터)를 반환합니다.
+    스트리밍/일반/배치 조회가 같은 (체인, txid)를 동시에 조회하면 요청 하나를 공유합니다.
+    """
+    return await chain_lookups.do((key, txid), _lookup_chain, client, txid_for_api, key, cfg, txid)
+
+async def _lookup_chain(client: httpx.AsyncClient, txid_for_api: str, key: str, cfg: dict, txid: str):
+    started = time.monotonic()
+    status, result = await fetch_chain_result(client, txid_for_api, key, cfg, original_input_txid=txid)
+    _record_chain_outcome(key, txid, status, time.monotonic() - started)
+    return status, result
 
-    return found_results
+def _record_chain_outcome(key: str, txid: str, status: str, latency: float):
+    """실제 요청한 체인 조회 결과를 통계와 체인별 부정 캐시에 기록 (요청하지 못한 경우는 제외)"""
+    if status in (LOOKUP_UNAVAILABLE, LOOKUP_RATE_LIMITED):
+        return
+    chain_stats.record(key, status == LOOKUP_FOUND, latency)
+    if status == LOOKUP_NOT_FOUND:
+        chain_miss_cache.set(chain_miss_key(key, txid), True)
 
 async def fetch_and_normalize(client: httpx.AsyncClient, txid_for_api: str, key: str, cfg: dict, original_input_txid: str):
+    """체인 하나를 조회해 정규화된 결과를 반환 (없거나 실패하면 None)"""
+    _, normalized_data = await fetch_chain_result(client, txid_for_api, key, cfg, original_input_txid)
+    return normalized_data
+
+async def fetch_chain_result(client: httpx.AsyncClient, txid_for_api: str, key: str, cfg: dict, original_input_txid: str):
+    """
+    체인 하나를 조회해 (조회 결과 상태, 정규화된 데이터)를 반환합니다.
+
+    상태는 LOOKUP_FOUND, LOOKUP_NOT_FOUND(정상 응답이지만 트랜잭션 없음), LOOKUP_ERROR(네트워크/서버/설정 오류),
+    LOOKUP_UNAVAILABLE(서킷이 열려 요청하지 않음), LOOKUP_RATE_LIMITED(공급자 요청 한도) 중 하나이며,
+    NOT_FOUND만 부정 캐시 대상이 됩니다. 오류와 지연 시간은 공급자별 서킷 브레이커에 기록됩니다.
+    대체 공급자(fallbacks)가 있는 체인은 provider_router가 정한 순서로 조회합니다.
+    """
+    routes = chain_registry.routes[key]
+    if len(routes) == 1:
+        return await _fetch_provider_result(client, txid_for_api, key, cfg, original_input_txid)
+    return await _fetch_with_fallbacks(client, txid_for_api, routes, original_input_txid)
+
+async def _fetch_with_fallbacks(client: httpx.AsyncClient, txid_for_api: str, routes, original_input_txid: str):
+    """
+    기대 응답 시간이 짧은 공급자부터 조회하고, 실패하거나 hedge 대기 시간 안에 응답하지 않으면 다음 공급자도 조회
+    (헤지가 꺼져 있으면 실패한 경우에만 다음 공급자로 넘어감)
+    """
+    ranked = provider_router.rank(routes)
+    attempts = [functools.partial(_fetch_route, client, txid_for_api, route, original_input_txid) for route in ranked]
+    delay = hedge_delay(ranked[0].chain) if HEDGE_ENABLED else None
+
+    def on_next(index):
+        logger.debug(f"[{ranked[0].chain}] 다음 공급자 조회 시작: {ranked[index].provider}")
+
+    status, normalized_data, winner = await _first_settled(attempts, delay, on_next)
+    if winner is not None:
+        provider_router.record_win(ranked[winner].key)
+    return status, normalized_data
+
+async def _fetch_route(client: httpx.AsyncClient, txid_for_api: str, route, original_input_txid: str):
+    """공급자 하나로 조회하고 지연 시간과 오류를 provider_router에 기록 (요청하지 못한 경우는 제외)"""
+    started = time.monotonic()
+    try:
+        status, normalized_data = await _fetch_provider_result(client, txid_for_api, route.key, route.cfg, original_input_txid)
+    except asyncio.CancelledError:
+        provider_router.record_abandoned(route.key, time.monotonic() - started)
+        raise
+    if status not in (LOOKUP_UNAVAILABLE, LOOKUP_RATE_LIMITED):
+        provider_router.record(route.key, status != LOOKUP_ERROR, time.monotonic() - started)
+    return status, normalized_data
+
+async def _fetch_provider_result(client: httpx.AsyncClient, txid_for_api: str, key: str, cfg: dict, original_input_txid: str):
+    """공급자 하나(체인 기본 설정 또는 대체 공급자 경로 키)로 조회 (fetch_chain_result 참고)"""
+    breaker = circuit_breakers.get(key)
+    if not breaker.allow_request():
+        logger.debug(f"[{key}] 서킷 열림 상태, 조회 건너뜀")
+        return LOOKUP_UNAVAILABLE, None
+
+    try:
+        has_key, api_key = choose_api_key(key)
+        if not has_key or not await rate_limiter.acquire(*rate_limit_bucket(key, cfg, api_key)):
+            breaker.abandon()
+            return LOOKUP_RATE_LIMITED, None
+        started = time.monotonic()
+        status, normalized_data = await _request_chain(client, txid_for_api, key, cfg, original_input_txid, api_key)
+    except asyncio.CancelledError:
+        breaker.abandon()
+        raise
+    if status == LOOKUP_RATE_LIMITED:
+        # 한도 초과는 탐색기 장애가 아니므로 서킷에 반영하지 않음
+        breaker.abandon()
+    elif status == LOOKUP_ERROR:
+        breaker.record_failure("request error")
+    else:
+        breaker.record_success(time.monotonic() - started)
+    return status, normalized_data
+
+async def fetch_chain_results_batch(client: httpx.AsyncClient, items, key: str, cfg: dict):
+    """
+    rpc_mode 체인에서 여러 txid를 JSON-RPC 배치 요청 하나로 조회해 [(txid, 조회 결과 상태, 정규화된 데이터)]를 반환합니다.
+
+    items는 [(사용자 입력 txid, API 호출용 txid)] 목록입니다. 배치 요청은 서킷 브레이커와 요청 한도에서 한 건으로
+    계산되며, 엔드포인트가 배치를 지원하지 않으면 txid별 요청으로 대체합니다. 대체 공급자가 있는 체인은 배치로
+    조회하지 못한 txid를 대체 공급자로 다시 조회하고, 대체 공급자가 더 빠를 것으로 보이면 처음부터 txid별로 조회합니다.
+    """
+    routes = chain_registry.routes[key]
+    if len(routes) == 1:
+        return await _fetch_provider_batch(client, items, key, cfg)
+    if provider_router.rank(routes)[0].key != key:
+        statuses = await asyncio.gather(*(
+            _fetch_with_fallbacks(client, txid_for_api, routes, original_input_txid=txid) for txid, txid_for_api in items
+        ))
+        return [(txid, *status) for (txid, _), status in zip(items, statuses)]
+
+    results = await _fetch_provider_batch(client, items, key, cfg)
+    if {status for _, status, _ in results} == {LOOKUP_ERROR}:
+        provider_router.record(key, ok=False)
+    failed = [index for index, (_, status, _) in enumerate(results) if status not in (LOOKUP_FOUND, LOOKUP_NOT_FOUND)]
+    if failed:
+        retried = await asyncio.gather(*(
+            _fetch_with_fallbacks(client, items[index][1], routes[1:], original_input_txid=items[index][0]) for index in failed
+        ))
+        for index, status in zip(failed, retried):
+            results[index] = (items[index][0], *status)
+    return results
+
+async def _fetch_provider_batch(client: httpx.AsyncClient, items, key: str, cfg: dict):
+    breaker = circuit_breakers.get(key)
+    if not breaker.allow_request():
+        logger.debug(f"[{key}] 서킷 열림 상태, 배치 조회 건너뜀")
+        return [(txid, LOOKUP_UNAVAILABLE, None) for txid, _ in items]
+
+    try:
+        has_key, api_key = choose_api_key(key)
+        if not has_key or not await rate_limiter.acquire(*rate_limit_bucket(key, cfg, api_key)):
+            breaker.abandon()
+            return [(txid, LOOKUP_RATE_LIMITED, None) for txid, _ in items]
+        started = time.monotonic()
+        results = await _request_rpc_batch(client, items, key, cfg, api_key)
+    except asyncio.CancelledError:
+        breaker.abandon()
+        raise
+
+    if results is None:
+        breaker.abandon()
+        logger.debug(f"[{key}] JSON-RPC 배치 미지원, txid별 요청으로 대체")
+        statuses = await asyncio.gather(*(
+            _fetch_provider_result(client, txid_for_api, key, cfg, original_input_txid=txid) for txid, txid_for_api in items
+        ))
+        return [(txid, *status) for (txid, _), status in zip(items, statuses)]
+
+    statuses = {status for _, status, _ in results}
+    if LOOKUP_RATE_LIMITED in statuses:
+        breaker.abandon()
+    elif statuses == {LOOKUP_ERROR}:
+        breaker.record_failure("batch request error")
+    else:
+        breaker.record_success(time.monotonic() - started)
+    return results
+
+async def _request_rpc_batch(client: httpx.AsyncClient, items, key: str, cfg: dict, api_key: str = None):
+    """JSON-RPC 배치 요청 및 정규화 (배치를 지원하지 않는 응답이면 None)"""
+    template = chain_registry.request_templates[key]
+    if template.rpc_receipt:
+        payload = template.rpc_receipt_payload([txid_for_api for _, txid_for_api in items])
+    else:
+        payload = [template.rpc_payload(txid_for_api, request_id=index) for index, (_, txid_for_api) in enumerate(items)]
+    api_url = template.rpc_url
+
+    def all_items(status):
+        return [(txid, status, None) for txid, _ in items]
+
+    if template.missing_api_key:
+        return all_items(LOOKUP_ERROR)
+    try:
+        res = await client.post(template.keyed_url(api_url, api_key), json=payload, headers=template.request_headers(api_key), timeout=30.0)
+        logger.debug(f"[{key}] 응답 상태코드 (batch {len(items)}건): {res.status_code}")
+        res.raise_for_status()
+        json_data = res.json()
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        if status_code == 429:
+            logger.warning(f"[{key}] HTTP 429 (요청 한도 초과, batch): {api_url}")
+            _penalize(key, cfg, api_key, retry_after=_retry_after_seconds(e.response))
+            return all_items(LOOKUP_RATE_LIMITED)
+        if status_code in RPC_BATCH_UNSUPPORTED_STATUSES:
+            return None
+        logger.warning(f"[{key}] HTTP 오류 (상태코드: {status_code}, batch) → {e}. API: {api_url}")
+        return all_items(LOOKUP_ERROR)
+    except httpx.RequestError as e:
+        logger.warning(f"[{key}] 요청 오류 (batch) → {e}. API: {api_url}")
+        return all_items(LOOKUP_ERROR)
+    except ValueError as e:
+        logger.warning(f"[{key}] JSON 파싱 실패 (batch) → {e}. 응답 본문: {res.text[:200]}")
+        return all_items(LOOKUP_ERROR)
+
+    if not isinstance(json_data, list):
+        return None
+    if _is_rate_limit_body(json_data):
+        logger.warning(f"[{key}] 공급자 요청 한도 초과 응답 (batch)")
+        _penalize(key, cfg, api_key)
+        return all_items(LOOKUP_RATE_LIMITED)
+
+    responses = {response.get("id"): response for response in json_data if isinstance(response, dict)}
+    results = []
+    for index, (txid, _) in enumerate(items):
+        response = _merge_receipt_responses(responses, index) if template.rpc_receipt else responses.get(index)
+        if response is None or response.get("error"):
+            logger.debug(f"[{key}] 배치 응답 누락 또는 오류 (id={index}): {response}")
+            results.append((txid, LOOKUP_ERROR, None))
+            continue
+        try:
+            normalized_data = cfg["normalize"](response) if response.get("result") else None
+            if normalized_data and template.rpc_receipt:
+                _apply_receipt(normalized_data, response)
+        except Exception as e:
+            logger.warning(f"[{key}] 배치 응답 정규화 실패 (id={index}) → {e}")
+            results.append((txid, LOOKUP_ERROR, None))
+            continue
+        results.append((txid, LOOKUP_FOUND if normalized_data else LOOKUP_NOT_FOUND, normalized_data))
+    return results
+
+def choose_api_key(key: str):
+    """
+    요청에 사용할 (사용 가능 여부, API 키). 키 풀이 없으면 (True, None)이고,
+    풀의 모든 키가 한도 초과나 인증 실패로 쉬는 중이면 (False, None)
+    """
+    key_pool = chain_registry.request_templates[key].key_pool
+    if key_pool is None:
+        return True, None
+    api_key = key_pool.choose()
+    if api_key is None:
+        logger.debug(f"[{key}] 사용할 수 있는 API 키 없음 (모든 키가 대기 중)")
+    return api_key is not None, api_key
+
+def rate_limit_bucket(key: str, cfg: dict, api_key: str = None):
+    """요청 한도를 적용할 (공급자, API 키, 요청 호스트)"""
+    return cfg.get("provider", key), api_key, chain_registry.request_templates[key].host
+
+def _penalize(key: str, cfg: dict, api_key: str = None, retry_after: float = 1.0):
+    """업스트림 한도 초과: (공급자, 키, 호스트) 버킷을 비우고 키 풀에서 그 키를 Retry-After 동안 쉬게 함"""
+    rate_limiter.penalize(*rate_limit_bucket(key, cfg, api_key), retry_after=retry_after)
+    key_pool = chain_registry.request_templates[key].key_pool
+    if key_pool and api_key:
+        key_pool.cooldown(api_key, retry_after)
+
+def _mark_invalid_key(key: str, api_key: str = None):
+    key_pool = chain_registry.request_templates[key].key_pool
+    if key_pool and api_key:
+        key_pool.mark_invalid(api_key)
+
+def _retry_after_seconds(response: httpx.Response, default: float = 1.0) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except ValueError:
+        return default
+
+async def _post_rpc_receipt_batch(client: httpx.AsyncClient, api_url: str, txid_for_api: str, key: str, api_key: str = None):
+    """
+    트랜잭션, 영수증, 최신 블록 번호를 JSON-RPC 배치 요청 하나로 조회해 트랜잭션 응답에 합쳐 반환합니다.
+    엔드포인트가 배치를 지원하지 않으면 None을 반환하며, 호출자는 트랜잭션만 조회하는 단일 호출로 대체합니다.
+    """
+    template = chain_registry.request_templates[key]
+    res = await client.post(template.keyed_url(api_url, api_key), json=template.rpc_receipt_payload([txid_for_api]),
+                            headers=template.request_headers(api_key), timeout=30.0)
+    logger.debug(f"[{key}] 응답 상태코드 (receipt batch): {res.status_code}")
+    if res.status_code in RPC_BATCH_UNSUPPORTED_STATUSES:
+        return None
+    res.raise_for_status()
+    try:
+        json_data = res.json()
+    except ValueError:
+        return None
+    if not isinstance(json_data, list):
+        return None
+    responses = {response.get("id"): response for response in json_data if isinstance(response, dict)}
+    return _merge_receipt_responses(responses, 0)
+
+def _merge_receipt_responses(responses: dict, index: int):
+    """배치 응답(id별)에서 index번째 트랜잭션 응답에 영수증("receipt")과 최신 블록 번호("latestBlock")를 붙임"""
+    tx_response = responses.get(f"tx:{index}")
+    if tx_response is None:
+        return None
+    receipt_response = responses.get(f"receipt:{index}") or {}
+    block_number_response = responses.get(RPC_BLOCK_NUMBER_ID) or {}
+    return {**tx_response, "receipt": receipt_response.get("result"), "latestBlock": block_number_response.get("result")}
+
+def _hex_to_int(value):
+    try:
+        return int(value, 16) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+def _apply_receipt(normalized_data: dict, response: dict) -> dict:
+    """영수증의 실행 결과, 가스 사용량, 수수료와 최신 블록 기준 확인 수를 정규화 결과에 추가"""
+    receipt = response.get("receipt")
+    if isinstance(receipt, dict):
+        gas_used = _hex_to_int(receipt.get("gasUsed"))
+        gas_price = _hex_to_int(receipt.get("effectiveGasPrice"))
+        if gas_used is not None:
+            normalized_data["gasUsed"] = gas_used
+            if gas_price is not None:
+                normalized_data["fee"] = gas_used * gas_price / 1e18
+        if receipt.get("status") == "0x0":
+            normalized_data["status"] = "failed"
+        elif receipt.get("status") == "0x1":
+            normalized_data["status"] = "confirmed"
+    latest_block = _hex_to_int(response.get("latestBlock"))
+    block_number = normalized_data.get("blockNumber")
+    if latest_block is not None and isinstance(block_number, int):
+        normalized_data["confirmations"] = max(0, latest_block - block_number + 1)
+    return normalized_data
+
+def _is_invalid_key_body(json_data) -> bool:
+    """HTTP 200으로 잘못된 API 키를 알리는 응답 (예: Etherscan 계열 {"result": "Invalid API Key"})"""
+    if not isinstance(json_data, dict):
+        return False
+    return any(isinstance(json_data.get(field), str) and "invalid api key" in json_data[field].lower() for field in ("result", "message"))
+
+def _is_rate_limit_body(json_data) -> bool:
+    """HTTP 200으로 한도 초과를 알리는 응답 (예: Etherscan 계열 {"result": "Max rate limit reached"})"""
+    bodies = json_data if isinstance(json_data, list) else [json_data]
+    for body in bodies:
+        if isinstance(body, dict):
+            for field in ("result", "message"):
+                value = body.get(field)
+                if isinstance(value, str) and "rate limit" in value.lower():
+                    return True
+    return False
+
+def hedge_delay(key: str) -> float:
+    """예비 엔드포인트 요청을 시작하기 전 기다리는 시간 (체인 p95 지연 시간, 범위 제한)"""
+    p95 = chain_stats.latency_percentile(key)
+    if p95 is None:
+        return HEDGE_DEFAULT_DELAY
+    return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, p95))
+
+async def _request_chain(client: httpx.AsyncClient, txid_for_api: str, key: str, cfg: dict, original_input_txid: str, api_key: str = None):
+    """탐색기 API 호출 및 정규화 (fetch_chain_result 참고). 예비 엔드포인트가 있으면 헤지 요청"""
+    template = chain_registry.request_templates[key]
+    if template.missing_api_key:
+        return LOOKUP_ERROR, None
+    try:
+        primary = template.rpc_url or cfg["api"](txid_for_api)
+        if template.rpc_url:
+            mirrors = list(template.rpc_mirror_urls)
+        else:
+            mirrors = [mirror(txid_for_api) for mirror in cfg.get("api_mirrors", ())]
+    except Exception as e:
+        logger.error(f"[{key}] API URL 생성 실패 → {e}", exc_info=True)
+        return LOOKUP_ERROR, None
+    if not mirrors or not HEDGE_ENABLED:
+        return await _request_endpoint(client, primary, txid_for_api, key, cfg, api_key)
+    return await _request_hedged(client, [primary, *mirrors], txid_for_api, key, cfg, api_key)
+
+async def _request_hedged(client: httpx.AsyncClient, endpoints, txid_for_api: str, key: str, cfg: dict, api_key: str = None):
+    """예비 엔드포인트 헤지 요청 (_first_settled 참고)"""
+    delay = hedge_delay(key)
+    hedge_stats["requests"] += 1
+
+    def on_hedge(index):
+        hedge_stats["hedged"] += 1
+        logger.debug(f"[{key}] 예비 엔드포인트 요청 시작 ({index}/{len(endpoints) - 1}, 대기 {delay:.2f}s)")
+
+    attempts = [functools.partial(_request_endpoint, client, endpoint, txid_for_api, key, cfg, api_key) for endpoint in endpoints]
+    status, normalized_data, winner = await _first_settled(attempts, delay, on_hedge)
+    if winner:
+        hedge_stats["mirror_wins"] += 1
+    return status, normalized_data
+
+async def _first_settled(attempts, delay, on_next=None):
+    """
+    시도(코루틴 함수)를 순서대로 시작하되, 앞선 시도가 delay 안에 끝나지 않거나 실패하면 다음 시도도 시작합니다.
+    처음 도착한 유효한 응답(찾음 또는 없음)의 (상태, 정규화된 데이터, 시도 순번)을 반환하고 나머지는 취소합니다.
+    모두 실패하면 마지막 실패 결과와 순번 None을 반환합니다. delay가 None이면 실패한 경우에만 다음 시도를 시작합니다.
+    """
+    tasks = {}
+    pending = set()
+    last_outcome = (LOOKUP_ERROR, None)
+    try:
+        for index, attempt in enumerate(attempts):
+            task = asyncio.create_task(attempt())
+            tasks[task] = index
+            pending.add(task)
+            if index and on_next:
+                on_next(index)
+            is_last = index == len(attempts) - 1
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=None if is_last else delay, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    status, normalized_data = finished.result()
+                    if status in (LOOKUP_FOUND, LOOKUP_NOT_FOUND):
+                        return status, normalized_data, tasks[finished]
+                    last_outcome = (status, normalized_data)
+                if not is_last:
+                    break  # 시간 초과 또는 실패: 다음 시도 시작
+        return (*last_outcome, None)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+async def _get_all(client: httpx.AsyncClient, urls, headers):
+    """여러 URL을 동시에 요청 (모든 응답이 필요하므로 하나라도 실패하면 나머지를 취소하고 예외 전달)"""
+    tasks = [asyncio.create_task(client.get(url, headers=headers, timeout=30.0)) for url in urls]
+    try:
+        responses = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    for response in responses:
+        response.raise_for_status()
+    return responses
+
+async def _request_endpoint(client: httpx.AsyncClient, api_url_or_list, txid_for_api: str, key: str, cfg: dict, api_key: str = None):
+    """엔드포인트 하나(또는 모든 응답이 필요한 URL 목록)를 요청해 정규화"""
+    template = chain_registry.request_templates[key]
     try:
-        request_headers = {"User-Agent": "Mozilla/5.0"}
-        api_url_or_list = cfg["api"](txid_for_api)
         json_data = None
+        truncated = False
 
         if isinstance(api_url_or_list, list):
             logger.debug(f"[{key}] Multi-API call mode activated for {len(api_url_or_list)} URLs.")
             responses_json = []
-            
-            api_key_value = None
-            if not cfg.get("api_requires_header_auth", False) and cfg.get("api_key_env_var"):
-                api_key_value = os.getenv(cfg.get("api_key_env_var"))
-                if not api_key_value and cfg.get("api_key_is_mandatory", True):
-                    logger.warning(f"[{key}] Mandatory API Key not found in env: {cfg.get('api_key_env_var')}")
-                    return None
-
-            for base_url in api_url_or_list:
-                # 최종 수정: API 키를 URL에 수동으로 추가하여 서버의 파라미터 처리 버그 우회
-                final_url = f"{base_url}&apikey={api_key_value}" if api_key_value else base_url
-                
-                # 최종 수정: 연결 재사용 문제를 해결하기 위해 'Connection: close' 헤더 추가
-                multi_call_headers = request_headers.copy()
-                multi_call_headers['Connection'] = 'close'
-                
-                res_multi = await client.get(final_url, headers=multi_call_headers, timeout=30.0)
+
+            final_urls = [template.keyed_url(base_url, api_key) for base_url in api_url_or_list]
+            # 모든 응답이 있어야 정규화할 수 있으므로 순차 대신 동시에 요청
+            for base_url, res_multi in zip(api_url_or_list, await _get_all(client, final_urls, template.request_headers(api_key))):
                 logger.debug(f"[{key}] 응답 상태코드 (multi-call): {res_multi.status_code}")
-                res_multi.raise_for_status()
                 try:
                     responses_json.append(res_multi.json())
                 except Exception as e:
-                    logger.warning(f"[{key}] JSON 파싱 실패 (URL: {final_url}) → {e}. 응답 본문: {res_multi.text[:200]}")
-                    return None
+                    logger.warning(f"[{key}] JSON 파싱 실패 (URL: {base_url}) → {e}. 응답 본문: {res_multi.text[:200]}")
+                    return LOOKUP_ERROR, None
             json_data = responses_json
-        
-        else: # 단일 URL을 사용하는 경우
-            if cfg.get("api_requires_header_auth"):
-                api_key_env_var = cfg.get("api_key_env_var")
-                auth_header_name = cfg.get("api_auth_header_name")
-                auth_value_prefix = cfg.get("api_auth_value_prefix", "")
-                if api_key_env_var and auth_header_name:
-                    api_key_value = os.getenv(api_key_env_var)
-                    if api_key_value:
-                        request_headers[auth_header_name] = f"{auth_value_prefix}{api_key_value}"
-                    else:
-                        logger.debug(f"[{key}] API Key for header auth not found in env: {api_key_env_var}")
-                        if cfg.get("api_key_is_mandatory", False): return None
-                else:
-                    logger.debug(f"[{key}] Header auth configuration missing (api_key_env_var or api_auth_header_name)")
-
-            res = None
-            api_url = api_url_or_list # 단일 URL이므로 변수에 다시 할당
-            if cfg.get("rpc_mode"):
-                request_headers["Content-Type"] = "application/json"
-                rpc_method = cfg.get("rpc_method", "eth_getTransactionByHash")
-                params_lambda = cfg.get("rpc_params_lambda")
-                params = params_lambda(txid_for_api) if params_lambda else [txid_for_api]
-                payload = {"jsonrpc": "2.0", "method": rpc_method, "params": params, "id": 1}
-                res = await client.post(api_url, json=payload, headers=request_headers, timeout=30.0)
-            else:
-                res = await client.get(api_url, headers=request_headers, timeout=30.0)
 
-            logger.debug(f"[{key}] 응답 상태코드: {res.status_code}")
-            res.raise_for_status()
-            try:
-                json_data = res.json()
-            except Exception as e:
-                logger.warning(f"[{key}] JSON 파싱 실패 (상태코드: {res.status_code}) → {e}. 응답 본문: {res.text[:200]}")
-                return None
+        else: # 단일 URL을 사용하는 경우
+            if template.rpc_receipt:
+                # 배치를 지원하지 않는 엔드포인트면 트랜잭션만 조회
+                json_data = await _post_rpc_receipt_batch(client, api_url_or_list, txid_for_api, key, api_key)
+            if json_data is None:
+                request_url = template.keyed_url(api_url_or_list, api_key)
+                payload = template.rpc_payload(txid_for_api) if template.method == "POST" else None
+                # 본문은 스트리밍으로 최대 크기까지만 읽음 (큰 응답은 필드 선택 파싱, response_reader.py 참고)
+                async with client.stream(template.method, request_url, json=payload,
+                                         headers=template.request_headers(api_key), timeout=30.0) as res:
+                    logger.debug(f"[{key}] 응답 상태코드: {res.status_code}")
+                    if res.is_error:
+                        await res.aread()  # 본문을 다 읽어야 연결이 닫히지 않고 풀로 돌아감 (오류 응답은 작음)
+                    res.raise_for_status()
+                    try:
+                        json_data, truncated = await read_json(res, template.max_response_bytes, template.stream_fields)
+                    except ResponseTooLarge as e:
+                        logger.warning(f"[{key}] {e}: {api_url_or_list}")
+                        return LOOKUP_ERROR, None
+                    except ValueError as e:
+                        logger.warning(f"[{key}] JSON 파싱 실패 (상태코드: {res.status_code}) → {e}")
+                        return LOOKUP_ERROR, None
 
         # 정규화 전, 원본 응답을 로깅하는 통합된 로직
         # RPC 모드인 경우 원본 응답 로깅 (디버깅용)
@@ -154,33 +829,55 @@ async def fetch_and_normalize(client: httpx.AsyncClient, txid_for_api: str, key:
             else:
                 logger.debug(f"[{key}] API 원본 응답 (json_data): {json_data}")
 
+        if json_data and _is_rate_limit_body(json_data):
+            logger.warning(f"[{key}] 공급자 요청 한도 초과 응답")
+            _penalize(key, cfg, api_key)
+            return LOOKUP_RATE_LIMITED, None
+        if json_data and _is_invalid_key_body(json_data):
+            _mark_invalid_key(key, api_key)
+            return LOOKUP_ERROR, None
+
         if json_data:
             normalized_data = cfg["normalize"](json_data)
+            if normalized_data and template.rpc_receipt:
+                _apply_receipt(normalized_data, json_data)
+            if normalized_data and truncated:
+                normalized_data["truncated"] = True  # 최대 크기까지 읽은 필드로만 정규화
             if normalized_data:
                 logger.debug(f"[{key}] 정규화 성공.")
-                return normalized_data
+                return LOOKUP_FOUND, normalized_data
+            elif truncated:
+                # 잘린 본문에 필요한 필드가 없었을 수 있으므로 "없음"으로 부정 캐시하지 않음
+                logger.warning(f"[{key}] 잘린 응답 본문으로 정규화 실패 (최대 {template.max_response_bytes} bytes)")
+                return LOOKUP_ERROR, None
             else:
                 logger.debug(f"[{key}] 정규화 결과 None (유효하지 않거나 조건 불일치, 또는 응답 구조 확인 필요)")
-                return None
+                return LOOKUP_NOT_FOUND, None
         else:
-            return None
+            return LOOKUP_NOT_FOUND, None
 
     except httpx.HTTPStatusError as e:
         # 정상적인 실패(404, 400 등)는 DEBUG 레벨, 실제 오류는 WARNING
         status_code = e.response.status_code
         if status_code in [404, 400]:  # 정상적인 실패
             logger.debug(f"[{key}] HTTP {status_code} (트랜잭션을 찾을 수 없음): {api_url_or_list}")
-        else:  # 실제 오류 (500, 401, 403 등)
-            logger.warning(f"[{key}] HTTP 오류 (상태코드: {status_code}) → {e}. API: {api_url_or_list}")
-            if status_code in [401, 403] and cfg.get("api_requires_header_auth"):
-                logger.warning(f"[{key}] API 키가 유효하지 않거나 권한 문제일 수 있습니다.")
-        return None
+            return LOOKUP_NOT_FOUND, None
+        if status_code == 429:  # 요청 한도 초과는 "찾을 수 없음"과 구분
+            logger.warning(f"[{key}] HTTP 429 (요청 한도 초과): {api_url_or_list}")
+            _penalize(key, cfg, api_key, retry_after=_retry_after_seconds(e.response))
+            return LOOKUP_RATE_LIMITED, None
+        # 실제 오류 (500, 401, 403 등)
+        logger.warning(f"[{key}] HTTP 오류 (상태코드: {status_code}) → {e}. API: {api_url_or_list}")
+        if status_code in [401, 403] and api_key:
+            logger.warning(f"[{key}] API 키가 유효하지 않거나 권한 문제일 수 있습니다.")
+            _mark_invalid_key(key, api_key)
+        return LOOKUP_ERROR, None
     except httpx.RequestError as e:
         # 네트워크 오류는 WARNING 레벨
         logger.warning(f"[{key}] 요청 오류 → {e}. API: {api_url_or_list}")
-        return None
+        return LOOKUP_ERROR, None
     except Exception as e:
         current_key = key if 'key' in locals() else 'UnknownChain'
         current_api_url = api_url_or_list if 'api_url_or_list' in locals() else 'UnknownAPI'
         logger.error(f"[{current_key}] 알 수 없는 오류 발생 → {e}. API: {current_api_url}", exc_info=True)
-        return None
\ No newline at end of file
+        return LOOKUP_ERROR, None
\ No newline at end of file
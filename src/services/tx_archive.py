@@ -0,0 +1,165 @@
+"""
+확정된 트랜잭션 아카이브 (MongoDB)
+
+확정(confirmed) 또는 실패(failed)로 끝난 트랜잭션은 다시 바뀌지 않으므로, 정규화된 결과를 (체인, txid) 기준으로
+MongoDB에 보관합니다. 메모리 캐시는 배포할 때마다 사라지고 워커끼리 공유되지 않지만 아카이브는 모든 워커가 함께 사용하므로,
+거래소 공지나 문의에 반복해서 등장하는 해시를 체인 전체 조회 없이 인덱스 조회 한 번으로 돌려줍니다.
+
+저장은 응답을 기다리게 하지 않도록 백그라운드 작업으로 처리합니다. 마지막 조회 후 보존 기간이 지난 문서는 TTL 인덱스가,
+최대 문서 수를 넘는 문서는 주기적인 정리 작업이 오래 조회되지 않은 순서로 삭제합니다.
+"""
+import asyncio
+import logging
+import os
+import time
+
+from chatbot import mongodb_client
+from .chain_registry import chain_registry
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_ENABLED = os.getenv("TX_ARCHIVE_ENABLED", "true").lower() != "false"
+ARCHIVE_MAX_AGE_DAYS = float(os.getenv("TX_ARCHIVE_MAX_AGE_DAYS", "90"))
+ARCHIVE_MAX_DOCUMENTS = int(os.getenv("TX_ARCHIVE_MAX_DOCUMENTS", "200000"))
+# 확인 수를 알 수 있는 체인은 재구성(reorg) 가능성이 충분히 낮아진 뒤에만 저장
+ARCHIVE_MIN_CONFIRMATIONS = int(os.getenv("TX_ARCHIVE_MIN_CONFIRMATIONS", "12"))
+# 아카이브 조회가 느리면 기다리지 않고 체인 조회로 진행
+ARCHIVE_READ_TIMEOUT = float(os.getenv("TX_ARCHIVE_READ_TIMEOUT", "0.5"))
+RETENTION_INTERVAL_SECONDS = float(os.getenv("TX_ARCHIVE_RETENTION_INTERVAL", "3600"))
+TOUCH_INTERVAL_SECONDS = 86400  # 같은 txid의 마지막 조회 시각은 워커마다 하루에 한 번만 갱신
+MAX_TOUCH_ENTRIES = 10000
+
+FINAL_STATUSES = frozenset({"confirmed", "failed"})
+VOLATILE_FIELDS = ("confirmations",)  # 조회 시점에 따라 바뀌므로 저장하지 않음
+
+
+def is_final(result) -> bool:
+    """더 이상 바뀌지 않는 결과인지 (확정 또는 실패, 확인 수를 알면 ARCHIVE_MIN_CONFIRMATIONS 이상)"""
+    if str(result.get("status") or "").lower() not in FINAL_STATUSES:
+        return False
+    confirmations = result.get("confirmations")
+    return confirmations is None or confirmations >= ARCHIVE_MIN_CONFIRMATIONS
+
+
+class TransactionArchive:
+    """확정된 트랜잭션 결과의 영구 저장소"""
+
+    def __init__(self, enabled: bool = ARCHIVE_ENABLED):
+        self.enabled = enabled
+        self._writes = set()   # 진행 중인 백그라운드 저장 작업
+        self._touched = {}     # txid -> 마지막 조회 시각을 갱신한 시각
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.pruned = 0
+
+    @property
+    def available(self) -> bool:
+        return self.enabled and mongodb_client.tx_archive_collection is not None
+
+    async def get(self, txid: str):
+        """아카이브된 결과 목록 (체인 설정 순서, 없으면 None)"""
+        return (await self.get_many([txid])).get(txid)
+
+    async def get_many(self, txids) -> dict:
+        """여러 txid를 조회 한 번으로 찾아 {txid: [결과, ...]} 반환"""
+        if not self.available or not txids:
+            return {}
+        try:
+            archived = await asyncio.wait_for(mongodb_client.get_archived_transactions(list(txids)), timeout=ARCHIVE_READ_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.errors += 1
+            logger.warning(f"트랜잭션 아카이브 조회 시간 초과 ({ARCHIVE_READ_TIMEOUT}s), 체인 조회로 진행")
+            return {}
+
+        found = {}
+        for txid, docs in archived.items():
+            docs = sorted((doc for doc in docs if doc["chain"] in chain_registry), key=lambda doc: chain_registry.order[doc["chain"]])
+            if docs:
+                found[txid] = [doc["result"] for doc in docs]
+        self.hits += len(found)
+        self.misses += len(set(txids)) - len(found)
+        if found:
+            self._touch(list(found))
+        return found
+
+    def archive(self, txid: str, found_results) -> bool:
+        """조회가 끝난 txid의 [(체인 키, 결과)]가 모두 확정 상태면 백그라운드로 저장"""
+        if not self.available or not found_results:
+            return False
+        if not all(is_final(result) for _, result in found_results):
+            return False
+        documents = [
+            {"chain": key, "txid": txid, "result": {field: value for field, value in result.items() if field not in VOLATILE_FIELDS}}
+            for key, result in found_results
+        ]
+        self._spawn(self._write(documents))
+        return True
+
+    async def _write(self, documents):
+        if await mongodb_client.archive_transactions(documents):
+            self.writes += len(documents)
+            logger.debug(f"트랜잭션 아카이브 저장: {documents[0]['txid']} ({len(documents)}개 체인)")
+        else:
+            self.errors += 1
+
+    def _touch(self, txids):
+        """조회된 txid의 보존 기간 연장 (백그라운드, 워커별로 TOUCH_INTERVAL_SECONDS마다 한 번)"""
+        now = time.monotonic()
+        stale = [txid for txid in txids if now - self._touched.get(txid, -TOUCH_INTERVAL_SECONDS) >= TOUCH_INTERVAL_SECONDS]
+        if not stale:
+            return
+        if len(self._touched) > MAX_TOUCH_ENTRIES:
+            self._touched.clear()
+        for txid in stale:
+            self._touched[txid] = now
+        self._spawn(mongodb_client.touch_archived_transactions(stale))
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def ensure_indexes(self):
+        """보존 기간(TTL 인덱스) 설정 - MongoDB 연결 후 호출"""
+        if self.available:
+            await mongodb_client.ensure_tx_archive_ttl(int(ARCHIVE_MAX_AGE_DAYS * 86400))
+
+    async def prune(self) -> int:
+        """최대 문서 수를 넘는 오래된 문서 삭제"""
+        if not self.available:
+            return 0
+        deleted = await mongodb_client.prune_tx_archive(ARCHIVE_MAX_DOCUMENTS)
+        if deleted:
+            self.pruned += deleted
+            logger.info(f"트랜잭션 아카이브 정리: {deleted}개 삭제 (최대 {ARCHIVE_MAX_DOCUMENTS}개)")
+        return deleted
+
+    async def run_retention_loop(self, interval: float = RETENTION_INTERVAL_SECONDS):
+        """주기적으로 아카이브 크기를 제한하는 백그라운드 작업"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.prune()
+            except Exception as e:
+                logger.warning(f"트랜잭션 아카이브 정리 실패: {e}")
+
+    async def drain(self, timeout: float = 5.0):
+        """종료 시 진행 중인 저장 작업을 기다림"""
+        if self._writes:
+            await asyncio.wait(set(self._writes), timeout=timeout)
+
+    def snapshot(self) -> dict:
+        return {
+            "available": self.available,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "pruned": self.pruned,
+            "pending_writes": len(self._writes),
+        }
+
+
+tx_archive = TransactionArchive()
@@ -0,0 +1,172 @@
+"""
+대기중(pending) 트랜잭션 감시
+
+조회 결과가 대기중이면 사용자가 해시를 반복해서 다시 조회하는 대신, 트랜잭션을 찾은 체인 하나만 백오프 간격으로
+다시 조회합니다. 상태가 바뀌면 캐시 항목을 갱신하고 구독 중인 클라이언트(SSE)에 이벤트를 보내며,
+확정(confirmed) 또는 실패(failed) 상태가 되거나 최대 감시 시간이 지나면 감시를 끝냅니다.
+"""
+import asyncio
+import logging
+import os
+import time
+
+from .cache import cache, transaction_cache_ttl
+from .chain_registry import chain_registry
+from .http_client import explorer_client
+from .tx_archive import tx_archive
+
+logger = logging.getLogger(__name__)
+
+# 재조회 간격 (초). 마지막 간격은 최대 감시 시간까지 반복
+BACKOFF_SCHEDULE = tuple(float(delay) for delay in os.getenv("TX_WATCH_BACKOFF", "5,10,20,30,60").split(","))
+MAX_WATCH_SECONDS = float(os.getenv("TX_WATCH_MAX_SECONDS", "1800"))
+MAX_ACTIVE_WATCHES = int(os.getenv("TX_WATCH_MAX_ACTIVE", "500"))
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def is_pending_status(status) -> bool:
+    return "pending" in str(status or "").lower()
+
+
+class _Watch:
+    """txid 하나의 감시 상태 (대기중인 체인별 최신 결과와 구독자 큐)"""
+
+    def __init__(self, txid: str, results):
+        self.txid = txid
+        self.results = list(results)  # [(체인 키, 정규화된 결과)] - 캐시 항목과 같은 순서
+        self.subscribers = set()
+        self.started_at = time.monotonic()
+        self.polls = 0
+        self.task = None
+
+    def pending_chains(self):
+        return [key for key, result in self.results if is_pending_status(result.get("status"))]
+
+
+class TransactionWatcher:
+    """대기중 트랜잭션을 찾은 체인에서만 다시 조회"""
+
+    def __init__(self, backoff_schedule=BACKOFF_SCHEDULE, max_watch_seconds: float = MAX_WATCH_SECONDS,
+                 max_active: int = MAX_ACTIVE_WATCHES):
+        self.backoff_schedule = backoff_schedule
+        self.max_watch_seconds = max_watch_seconds
+        self.max_active = max_active
+        self._watches = {}
+        self.started = 0
+        self.polls = 0
+
+    def is_watching(self, txid: str) -> bool:
+        return txid in self._watches
+
+    def watch(self, txid: str, found_results) -> bool:
+        """조회가 끝난 txid의 [(체인 키, 결과)] 중 대기중인 결과가 있으면 감시 시작 (이미 감시 중이면 무시)"""
+        if txid in self._watches:
+            return True
+        if not any(is_pending_status(result.get("status")) for _, result in found_results):
+            return False
+        if len(self._watches) >= self.max_active:
+            logger.warning(f"대기중 트랜잭션 감시 한도({self.max_active}) 초과, 감시하지 않음: {txid}")
+            return False
+        watch = self._watches[txid] = _Watch(txid, found_results)
+        watch.task = asyncio.create_task(self._run(watch))
+        self.started += 1
+        logger.info(f"대기중 트랜잭션 감시 시작: {txid} ({watch.pending_chains()})")
+        return True
+
+    def subscribe(self, txid: str):
+        """상태 변경 이벤트를 받을 큐 (감시 중이 아니면 None). 감시가 끝나면 큐에 None이 들어감"""
+        watch = self._watches.get(txid)
+        if watch is None:
+            return None
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        watch.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, txid: str, queue: asyncio.Queue):
+        watch = self._watches.get(txid)
+        if watch is not None:
+            watch.subscribers.discard(queue)
+
+    def _publish(self, watch: _Watch, event):
+        for queue in watch.subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.debug(f"구독자 큐가 가득 차 이벤트를 버림: {watch.txid}")
+
+    def _delays(self):
+        yield from self.backoff_schedule
+        while True:
+            yield self.backoff_schedule[-1]
+
+    async def _run(self, watch: _Watch):
+        # 순환 import 방지 (transaction_service가 이 모듈을 사용)
+        from .transaction_service import fetch_chain_result, LOOKUP_FOUND
+
+        try:
+            async with explorer_client() as client:
+                for delay in self._delays():
+                    if time.monotonic() - watch.started_at + delay > self.max_watch_seconds:
+                        logger.info(f"대기중 트랜잭션 감시 시간 초과: {watch.txid}")
+                        break
+                    self._extend_cache(watch, delay)
+                    await asyncio.sleep(delay)
+
+                    for index, (key, previous) in enumerate(watch.results):
+                        if not is_pending_status(previous.get("status")):
+                            continue
+                        cfg = chain_registry[key]
+                        txid_for_api = cfg["classify_txid"](watch.txid)
+                        status, result = await fetch_chain_result(client, txid_for_api, key, cfg, original_input_txid=watch.txid)
+                        watch.polls += 1
+                        self.polls += 1
+                        if status != LOOKUP_FOUND or result.get("status") == previous.get("status"):
+                            continue
+                        logger.info(f"[{key}] 트랜잭션 상태 변경: {watch.txid} {previous.get('status')} → {result.get('status')}")
+                        watch.results[index] = (key, result)
+                        self._publish(watch, {"type": "status", "txid": watch.txid, "chain": key, "status": result.get("status"), "result": result})
+
+                    if not watch.pending_chains():
+                        break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"대기중 트랜잭션 감시 오류: {watch.txid} → {e}")
+        finally:
+            self._watches.pop(watch.txid, None)
+            self._store(watch)
+            final = not watch.pending_chains()
+            if final:
+                tx_archive.archive(watch.txid, watch.results)
+            self._publish(watch, {
+                "type": "done", "txid": watch.txid, "final": final,
+                "statuses": {key: result.get("status") for key, result in watch.results},
+            })
+            self._publish(watch, None)
+
+    def _store(self, watch: _Watch, ttl_seconds: float = None):
+        results = [result for _, result in watch.results]
+        cache.set(watch.txid, results, ttl_seconds=ttl_seconds or transaction_cache_ttl(results))
+
+    def _extend_cache(self, watch: _Watch, delay: float):
+        """감시 중에는 다음 재조회까지 캐시를 유지해 사용자의 재조회가 전체 체인 조회로 이어지지 않게 함"""
+        results = [result for _, result in watch.results]
+        self._store(watch, max(transaction_cache_ttl(results), delay + 5))
+
+    async def stop(self):
+        """종료 시 진행 중인 감시 작업 취소"""
+        tasks = [watch.task for watch in self._watches.values() if watch.task]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> dict:
+        return {
+            "active": len(self._watches),
+            "started": self.started,
+            "polls": self.polls,
+        }
+
+
+tx_watcher = TransactionWatcher()
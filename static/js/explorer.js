@@ -46,253 +46,64 @@ function appData() {
             resultDiv.innerHTML = '<div class="loading">트랜잭션을 조회하는 중입니다...</div>';
             resultDiv.scrollIntoView({ behavior: 'smooth', block: 'start' });
 
+            const adsenseBelow = document.getElementById('adsense-below-results');
+            let foundCount = 0;
+
             try {
-                const res = await fetch(`/api/tx/${txid}`);
-                
-                if (!res.ok) {
-                    throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+                // 체인별 결과를 도착하는 즉시 렌더링 (가장 느린 탐색기를 기다리지 않음)
+                const summary = await streamTransactionLookup(txid, (tx) => {
+                    const cardHTML = renderTransactionCard(tx);
+                    if (!cardHTML) {
+                        return;
+                    }
+                    if (foundCount === 0) {
+                        resultDiv.innerHTML = '';
+                        // 결과가 있을 때 광고 표시
+                        if (adsenseBelow) {
+                            adsenseBelow.style.display = 'flex';
+                            setTimeout(() => {
+                                adsenseBelow.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+                            }, 300);
+                        }
+                    }
+                    foundCount += 1;
+                    resultDiv.insertAdjacentHTML('beforeend', cardHTML);
+                    // fade-in 애니메이션 활성화 (DOM 업데이트 후 클래스 추가)
+                    const card = resultDiv.lastElementChild;
+                    requestAnimationFrame(() => card && card.classList.add('fade-in-visible'));
+                });
+
+                if (foundCount > 0 && summary.watch) {
+                    watchTransactionStatus(summary.watch, resultDiv);
                 }
-                
-                const data = await res.json();
-                
-                // 디버깅: API 응답 확인
-                console.log('API 응답:', data);
 
-                if (!data.found || !data.results || data.results.length === 0) {
+                if (foundCount === 0) {
                     resultDiv.innerHTML = `
                         <div class="error-message">
                             체인에서 해당 트랜잭션을 찾을 수 없습니다. 트랜잭션 해시를 확인해주세요.
-                            ${data.message ? `<br><small>${data.message}</small>` : ''}
+                            ${summary.message ? `<br><small>${escapeHtml(summary.message)}</small>` : ''}
+                            ${summary.unavailableChains.length ? `<br><small>일시적으로 조회할 수 없는 체인: ${escapeHtml(summary.unavailableChains.map(c => c.name).join(', '))}</small>` : ''}
                         </div>
                     `;
                     // 결과가 없을 때는 광고 숨김
-                    const adsenseBelow = document.getElementById('adsense-below-results');
                     if (adsenseBelow) {
                         adsenseBelow.style.display = 'none';
                     }
-                    return;
                 }
-
-                // 결과가 있을 때 광고 표시
-                const adsenseBelow = document.getElementById('adsense-below-results');
-                if (adsenseBelow) {
-                    adsenseBelow.style.display = 'flex';
-                    // 스크롤하여 광고가 보이도록
-                    setTimeout(() => {
-                        adsenseBelow.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
-                    }, 300);
-                }
-
-                // 결과 렌더링
-                const resultsHTML = data.results.map(tx => {
-                    // 디버깅: 각 트랜잭션 데이터 확인
-                    console.log('트랜잭션 데이터:', tx);
-                    
-                    // 데이터 검증
-                    if (!tx || !tx.txid) {
-                        console.error('유효하지 않은 트랜잭션 데이터:', tx);
-                        return '';
-                    }
-                    
-                    // 안전한 문자열 이스케이프 (XSS 방지)
-                    const escapeHtml = (str) => {
-                        if (str == null) return '';
-                        return String(str)
-                            .replace(/&/g, '&amp;')
-                            .replace(/</g, '&lt;')
-                            .replace(/>/g, '&gt;')
-                            .replace(/"/g, '&quot;')
-                            .replace(/'/g, '&#039;');
-                    };
-                    
-                    const safeTxid = escapeHtml(tx.txid);
-                    const safeFrom = tx.from ? escapeHtml(tx.from) : '';
-                    const safeTo = tx.to ? escapeHtml(tx.to) : '';
-                    const safeValue = tx.value != null ? escapeHtml(String(tx.value)) : '';
-                    const safeBlockNumber = tx.blockNumber != null ? escapeHtml(String(tx.blockNumber)) : '';
-                    const safeSymbol = escapeHtml(tx.symbol || tx.chain || 'Unknown');
-                    const safeExplorer = escapeHtml(tx.explorer || '');
-                    const safeStatus = tx.status ? escapeHtml(tx.status.toLowerCase()) : '';
-                    const statusText = tx.status === 'confirmed' ? '✓ 확인됨' : 
-                                     tx.status === 'failed' ? '✕ 실패' : 
-                                     tx.status === 'pending' ? '⏳ 대기중' : escapeHtml(tx.status || '');
-                    
-                    return `
-                    <div class="transaction-card fade-in">
-                        <div class="transaction-header">
-                            <div class="transaction-chain">
-                                <span class="chain-badge">${safeSymbol}</span>
-                                ${tx.status ? `
-                                    <span class="transaction-status status-${safeStatus}">
-                                        ${statusText}
-                                    </span>
-                                ` : ''}
-                            </div>
-                            <a href="${safeExplorer}${safeTxid}" target="_blank" rel="noopener noreferrer" class="transaction-link">
-                                <span>탐색기에서 보기</span>
-                                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                    <path d="M18 13v6a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V8a2 2 0 0 1 2-2h6"></path>
-                                    <polyline points="15 3 21 3 21 9"></polyline>
-                                    <line x1="10" y1="14" x2="21" y2="3"></line>
-                                </svg>
-                            </a>
-                        </div>
-
-                        <div class="info-grid">
-                            <div class="info-item">
-                                <span class="info-label">트랜잭션 ID</span>
-                                <div class="info-value">
-                                    ${safeTxid}
-                                    <button class="copy-button btn btn-sm" onclick="copyToClipboard('${safeTxid.replace(/'/g, "\\'")}', event)">복사</button>
-                                </div>
-                            </div>
-
-                            ${tx.from ? `
-                                <div class="info-item">
-                                    <span class="info-label">보낸 주소</span>
-                                    <div class="info-value">
-                                        ${safeFrom}
-                                        <button class="copy-button btn btn-sm" onclick="copyToClipboard('${safeFrom.replace(/'/g, "\\'")}', event)">복사</button>
-                                    </div>
-                                </div>
-                            ` : ''}
-
-                            ${tx.to ? `
-                                <div class="info-item">
-                                    <span class="info-label">받는 주소</span>
-                                    <div class="info-value">
-                                        ${safeTo}
-                                        <button class="copy-button btn btn-sm" onclick="copyToClipboard('${safeTo.replace(/'/g, "\\'")}', event)">복사</button>
-                                    </div>
-                                </div>
-                            ` : ''}
-
-                            ${tx.value != null ? `
-                                <div class="info-item">
-                                    <span class="info-label">금액</span>
-                                    <div class="info-value">${safeValue}</div>
-                                </div>
-                            ` : ''}
-
-                            ${tx.blockNumber != null ? `
-                                <div class="info-item">
-                                    <span class="info-label">블록 번호</span>
-                                    <div class="info-value">${safeBlockNumber}</div>
-                                </div>
-                            ` : ''}
-
-                            ${tx.destination_tag != null ? `
-                                <div class="info-item">
-                                    <span class="info-label">Destination Tag</span>
-                                    <div class="info-value">
-                                        ${escapeHtml(String(tx.destination_tag))}
-                                        <button class="copy-button btn btn-sm" onclick="copyToClipboard('${escapeHtml(String(tx.destination_tag)).replace(/'/g, "\\'")}', event)">복사</button>
-                                    </div>
-                                </div>
-                            ` : ''}
-                        </div>
-
-                        ${tx.note ? `
-                            <div class="transaction-note">
-                                ${escapeHtml(tx.note)}
-                            </div>
-                        ` : ''}
-                    </div>
-                `;
-                }).filter(html => html !== '').join(''); // 빈 문자열 제거
-                
-                if (!resultsHTML || resultsHTML.trim() === '') {
-                    console.error('결과 HTML이 비어있습니다.');
+            } catch (error) {
+                console.error("조회 중 오류 발생:", error);
+                // 이미 표시된 결과가 있으면 유지
+                if (foundCount === 0) {
                     resultDiv.innerHTML = `
                         <div class="error-message">
-                            결과를 렌더링할 수 없습니다. 콘솔을 확인해주세요.
+                            오류가 발생했습니다. 다시 시도해주세요.
+                            <br><small>${escapeHtml(error.message || '알 수 없는 오류')}</small>
                         </div>
                     `;
-                    return;
-                }
-                
-                console.log('렌더링할 HTML 길이:', resultsHTML.length);
-                console.log('resultDiv 요소:', resultDiv);
-                console.log('resultDiv 현재 내용 길이:', resultDiv.innerHTML.length);
-                
-                // 기존 내용 클리어
-                resultDiv.innerHTML = '';
-                
-                // HTML 삽입 (템플릿을 사용하여 안전하게)
-                try {
-                    resultDiv.innerHTML = resultsHTML;
-                    
-                    // fade-in 애니메이션 활성화 (fade-in-visible 클래스 추가)
-                    // requestAnimationFrame을 사용하여 DOM 업데이트 후 클래스 추가
-                    requestAnimationFrame(() => {
-                        const transactionCards = resultDiv.querySelectorAll('.transaction-card.fade-in');
-                        transactionCards.forEach((card, index) => {
-                            // 각 카드를 순차적으로 표시
-                            setTimeout(() => {
-                                card.classList.add('fade-in-visible');
-                            }, index * 50); // 50ms 간격으로 순차 표시
-                        });
-                    });
-                    
-                    // 삽입 후 확인
-                    console.log('삽입 후 resultDiv 내용 길이:', resultDiv.innerHTML.length);
-                    console.log('삽입 후 resultDiv 자식 요소 개수:', resultDiv.children.length);
-                    
-                    if (resultDiv.children.length === 0) {
-                        console.error('경고: HTML이 삽입되었지만 자식 요소가 없습니다.');
-                        console.error('삽입된 HTML (처음 500자):', resultsHTML.substring(0, 500));
-                    }
-                    
-                    const computedStyle = window.getComputedStyle(resultDiv);
-                    console.log('삽입 후 resultDiv 표시 상태:', {
-                        display: computedStyle.display,
-                        visibility: computedStyle.visibility,
-                        opacity: computedStyle.opacity,
-                        height: computedStyle.height,
-                        offsetHeight: resultDiv.offsetHeight,
-                        scrollHeight: resultDiv.scrollHeight
-                    });
-                    
-                    // 첫 번째 자식 요소 확인
-                    if (resultDiv.firstElementChild) {
-                        const firstChild = resultDiv.firstElementChild;
-                        const firstChildStyle = window.getComputedStyle(firstChild);
-                        console.log('첫 번째 자식 요소:', {
-                            tagName: firstChild.tagName,
-                            className: firstChild.className,
-                            display: firstChildStyle.display,
-                            opacity: firstChildStyle.opacity,
-                            visibility: firstChildStyle.visibility,
-                            height: firstChild.offsetHeight
-                        });
+                    // 결과가 없을 때는 광고 숨김
+                    if (adsenseBelow) {
+                        adsenseBelow.style.display = 'none';
                     }
-                    
-                } catch (e) {
-                    console.error('HTML 삽입 중 오류:', e);
-                    resultDiv.innerHTML = `
-                        <div class="error-message">
-                            결과를 표시하는 중 오류가 발생했습니다: ${e.message}
-                        </div>
-                    `;
-                    return;
-                }
-                
-                // 결과 영역으로 스크롤
-                setTimeout(() => {
-                    resultDiv.scrollIntoView({ behavior: 'smooth', block: 'start' });
-                }, 100);
-            } catch (error) {
-                console.error("조회 중 오류 발생:", error);
-                resultDiv.innerHTML = `
-                    <div class="error-message">
-                        오류가 발생했습니다. 다시 시도해주세요.
-                        <br><small>${error.message || '알 수 없는 오류'}</small>
-                    </div>
-                `;
-                // 결과가 없을 때는 광고 숨김
-                const adsenseBelow = document.getElementById('adsense-below-results');
-                if (adsenseBelow) {
-                    adsenseBelow.style.display = 'none';
                 }
             } finally {
                 this.isLoading = false;
@@ -352,6 +163,215 @@ function appData() {
     };
 }
 
+// 안전한 문자열 이스케이프 (XSS 방지)
+function escapeHtml(str) {
+    if (str == null) return '';
+    return String(str)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#039;');
+}
+
+// 트랜잭션 조회 스트림(/api/tx/{txid}/stream)을 읽으며 결과가 도착할 때마다 onResult 호출
+// 스트리밍 응답을 읽을 수 없는 브라우저에서는 /api/tx/{txid} 일괄 응답으로 대체
+async function streamTransactionLookup(txid, onResult) {
+    const encodedTxid = encodeURIComponent(txid);
+    if (!window.ReadableStream || !window.TextDecoder) {
+        const res = await fetch(`/api/tx/${encodedTxid}`);
+        if (!res.ok) {
+            throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+        }
+        const data = await res.json();
+        (data.results || []).forEach(onResult);
+        return { found: !!data.found, message: data.message || null, unavailableChains: (data.unavailableChains || []).concat(data.rateLimitedChains || []), watch: data.watch || null };
+    }
+
+    const res = await fetch(`/api/tx/${encodedTxid}/stream`);
+    if (!res.ok) {
+        throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+    }
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';  // SSE 이벤트 버퍼 (불완전한 이벤트 보관)
+    let summary = { found: false, message: null, unavailableChains: [], watch: null };
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (value) {
+            buffer += decoder.decode(value, { stream: !done });
+        }
+
+        // SSE 이벤트는 \n\n로 구분됨
+        let eventEnd = buffer.indexOf('\n\n');
+        while (eventEnd !== -1) {
+            const eventText = buffer.slice(0, eventEnd).trim();
+            buffer = buffer.slice(eventEnd + 2);
+            for (const line of eventText.split('\n')) {
+                if (!line.startsWith('data: ')) {
+                    continue;
+                }
+                const data = JSON.parse(line.slice(6));  // 'data: ' 제거
+                if (data.type === 'result') {
+                    onResult(data.result);
+                } else if (data.type === 'done') {
+                    summary = { found: data.found, message: data.message || null, unavailableChains: (data.unavailableChains || []).concat(data.rateLimitedChains || []), watch: data.watch || null };
+                } else if (data.type === 'error') {
+                    throw new Error(data.message || '트랜잭션 조회에 실패했습니다.');
+                }
+            }
+            eventEnd = buffer.indexOf('\n\n');
+        }
+
+        if (done) {
+            break;
+        }
+    }
+    return summary;
+}
+
+// 정규화된 트랜잭션 결과 하나를 카드 HTML로 렌더링
+// 대기중 트랜잭션 상태 변경 구독 (/api/tx/{txid}/watch). 상태가 바뀌면 해당 체인의 카드를 다시 그림
+function watchTransactionStatus(watchUrl, resultDiv) {
+    if (!window.EventSource) {
+        return;
+    }
+    const source = new EventSource(watchUrl);
+    source.onmessage = (message) => {
+        const data = JSON.parse(message.data);
+        if (data.type === 'status' && data.result) {
+            const card = Array.from(resultDiv.querySelectorAll('.transaction-card'))
+                .find(el => el.dataset.chain === data.chain);
+            if (card) {
+                card.outerHTML = renderTransactionCard(data.result).replace('fade-in', 'fade-in fade-in-visible');
+            }
+        } else if (data.type === 'done') {
+            source.close();
+        }
+    };
+    // 연결이 끊기면 자동 재연결하지 않음 (다시 조회하면 새로 구독)
+    source.onerror = () => source.close();
+}
+
+function renderTransactionCard(tx) {
+    // 데이터 검증
+    if (!tx || !tx.txid) {
+        console.error('유효하지 않은 트랜잭션 데이터:', tx);
+        return '';
+    }
+
+    const safeTxid = escapeHtml(tx.txid);
+    const safeFrom = tx.from ? escapeHtml(tx.from) : '';
+    const safeTo = tx.to ? escapeHtml(tx.to) : '';
+    const safeValue = tx.value != null ? escapeHtml(String(tx.value)) : '';
+    const safeBlockNumber = tx.blockNumber != null ? escapeHtml(String(tx.blockNumber)) : '';
+    const safeSymbol = escapeHtml(tx.symbol || tx.chain || 'Unknown');
+    const safeExplorer = escapeHtml(tx.explorer || '');
+    const safeStatus = tx.status ? escapeHtml(tx.status.toLowerCase()) : '';
+    const statusText = tx.status === 'confirmed' ? '✓ 확인됨' : 
+                     tx.status === 'failed' ? '✕ 실패' : 
+                     tx.status === 'pending' ? '⏳ 대기중' : escapeHtml(tx.status || '');
+
+    return `
+    <div class="transaction-card fade-in" data-chain="${escapeHtml(tx.chain || '')}">
+        <div class="transaction-header">
+            <div class="transaction-chain">
+                <span class="chain-badge">${safeSymbol}</span>
+                ${tx.status ? `
+                    <span class="transaction-status status-${safeStatus}">
+                        ${statusText}
+                    </span>
+                ` : ''}
+            </div>
+            <a href="${safeExplorer}${safeTxid}" target="_blank" rel="noopener noreferrer" class="transaction-link">
+                <span>탐색기에서 보기</span>
+                <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                    <path d="M18 13v6a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V8a2 2 0 0 1 2-2h6"></path>
+                    <polyline points="15 3 21 3 21 9"></polyline>
+                    <line x1="10" y1="14" x2="21" y2="3"></line>
+                </svg>
+            </a>
+        </div>
+
+        <div class="info-grid">
+            <div class="info-item">
+                <span class="info-label">트랜잭션 ID</span>
+                <div class="info-value">
+                    ${safeTxid}
+                    <button class="copy-button btn btn-sm" onclick="copyToClipboard('${safeTxid.replace(/'/g, "\\'")}', event)">복사</button>
+                </div>
+            </div>
+
+            ${tx.from ? `
+                <div class="info-item">
+                    <span class="info-label">보낸 주소</span>
+                    <div class="info-value">
+                        ${safeFrom}
+                        <button class="copy-button btn btn-sm" onclick="copyToClipboard('${safeFrom.replace(/'/g, "\\'")}', event)">복사</button>
+                    </div>
+                </div>
+            ` : ''}
+
+            ${tx.to ? `
+                <div class="info-item">
+                    <span class="info-label">받는 주소</span>
+                    <div class="info-value">
+                        ${safeTo}
+                        <button class="copy-button btn btn-sm" onclick="copyToClipboard('${safeTo.replace(/'/g, "\\'")}', event)">복사</button>
+                    </div>
+                </div>
+            ` : ''}
+
+            ${tx.value != null ? `
+                <div class="info-item">
+                    <span class="info-label">금액</span>
+                    <div class="info-value">${safeValue}</div>
+                </div>
+            ` : ''}
+
+            ${tx.blockNumber != null ? `
+                <div class="info-item">
+                    <span class="info-label">블록 번호</span>
+                    <div class="info-value">${safeBlockNumber}</div>
+                </div>
+            ` : ''}
+
+            ${tx.confirmations != null ? `
+                <div class="info-item">
+                    <span class="info-label">확인 수</span>
+                    <div class="info-value">${escapeHtml(String(tx.confirmations))}</div>
+                </div>
+            ` : ''}
+
+            ${tx.fee != null ? `
+                <div class="info-item">
+                    <span class="info-label">수수료</span>
+                    <div class="info-value">${escapeHtml(String(tx.fee))} ${safeSymbol}${tx.gasUsed != null ? ` (가스 ${escapeHtml(String(tx.gasUsed))})` : ''}</div>
+                </div>
+            ` : ''}
+
+            ${tx.destination_tag != null ? `
+                <div class="info-item">
+                    <span class="info-label">Destination Tag</span>
+                    <div class="info-value">
+                        ${escapeHtml(String(tx.destination_tag))}
+                        <button class="copy-button btn btn-sm" onclick="copyToClipboard('${escapeHtml(String(tx.destination_tag)).replace(/'/g, "\\'")}', event)">복사</button>
+                    </div>
+                </div>
+            ` : ''}
+        </div>
+
+        ${tx.note ? `
+            <div class="transaction-note">
+                ${escapeHtml(tx.note)}
+            </div>
+        ` : ''}
+    </div>
+    `;
+}
+
 async function copyToClipboard(text, event) {
     let success = false;
     try {
@@ -0,0 +1,70 @@
+"""
+테스트 공통 설정
+"""
+import dataclasses
+import inspect
+import os
+from types import MappingProxyType
+
+import httpx
+import pytest
+
+# chatbot 패키지는 import 시점에 OpenAI 클라이언트를 생성하므로 키가 없으면 수집 단계에서 실패함
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+
+class StubExplorer:
+    """모든 탐색기 요청을 handler로 보내는 가짜 탐색기 (handler가 없으면 404, 받은 요청은 requests에 기록)"""
+
+    def __init__(self):
+        self.handler = None
+        self.requests = []
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.handler is None:
+            return httpx.Response(404, json={"error": "not found"})
+        response = self.handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    def hosts(self) -> list:
+        return [request.url.host for request in self.requests]
+
+
+@pytest.fixture
+def explorer(monkeypatch):
+    """
+    탐색기 요청을 StubExplorer로 보내고, 트랜잭션 조회 상태(캐시, 서킷, 요청 한도, 통계, 감시, 아카이브)를
+    테스트마다 새로 만듦
+    """
+    from src.services import http_client, transaction_service
+    from src.services.cache import cache, chain_miss_cache, negative_cache
+    from src.services.chain_registry import chain_registry
+    from src.services.chain_stats import ChainStats
+    from src.services.circuit_breaker import CircuitBreakerRegistry
+    from src.services.provider_router import ProviderRouter
+    from src.services.rate_limiter import RateLimiter
+    from src.services.tx_archive import TransactionArchive
+    from src.services.tx_watcher import TransactionWatcher
+
+    stub = StubExplorer()
+    for shared_cache in (cache, negative_cache, chain_miss_cache):
+        shared_cache.clear()
+    monkeypatch.setattr(transaction_service, "circuit_breakers", CircuitBreakerRegistry())
+    monkeypatch.setattr(transaction_service, "rate_limiter", RateLimiter(enabled=False))
+    monkeypatch.setattr(transaction_service, "chain_stats", ChainStats())
+    monkeypatch.setattr(transaction_service, "provider_router", ProviderRouter())
+    monkeypatch.setattr(transaction_service, "tx_watcher", TransactionWatcher())
+    monkeypatch.setattr(transaction_service, "tx_archive", TransactionArchive(enabled=False))
+    # 필수 API 키가 없는 체인도 스텁 탐색기로 요청 (테스트 결과가 환경 변수에 따라 달라지지 않도록)
+    monkeypatch.setattr(chain_registry, "request_templates", MappingProxyType({
+        key: dataclasses.replace(template, missing_api_key=False)
+        for key, template in chain_registry.request_templates.items()
+    }))
+    http_client.set_transport_factory(lambda: httpx.MockTransport(stub.handle))
+    yield stub
+    http_client.set_transport_factory(None)
+    for shared_cache in (cache, negative_cache, chain_miss_cache):
+        shared_cache.clear()
@@ -0,0 +1,31 @@
+"""
+트랜잭션 캐시 테스트
+"""
+import time
+
+from src.services.cache import LRUCache, transaction_cache_ttl, TX_FINAL_TTL, TX_PENDING_TTL, TX_DEFAULT_TTL
+
+def test_lru_eviction_and_counters():
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a가 최근 사용됨
+    cache.set("c", 3)           # b가 제거됨
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.hits == 2 and cache.misses == 1
+
+def test_per_entry_ttl_expires():
+    cache = LRUCache(max_size=10, ttl_seconds=60)
+    cache.set("short", "x", ttl_seconds=0.01)
+    cache.set("long", "y")
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.get("long") == "y"
+    assert cache.expirations == 1
+
+def test_transaction_ttl_follows_status():
+    assert transaction_cache_ttl([{"status": "confirmed"}]) == TX_FINAL_TTL
+    assert transaction_cache_ttl([{"status": "confirmed"}, {"status": "pending"}]) == TX_PENDING_TTL
+    assert transaction_cache_ttl([{"status": "unknown"}]) == TX_DEFAULT_TTL
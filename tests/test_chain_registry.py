@@ -0,0 +1,42 @@
+"""
+체인 레지스트리 테스트
+"""
+import json
+
+import pytest
+
+from src.services.chain_configs import get_chain_configs
+from src.services.chain_registry import ChainConfigError, ChainRegistry, chain_registry
+
+
+def test_registry_is_read_only_and_precomputes_chain_list():
+    with pytest.raises(TypeError):
+        chain_registry.configs["ethereum"]["name"] = "changed"
+    body = json.loads(chain_registry.chains_body)
+    assert len(body["supportedChains"]) == len(chain_registry.public_chains)
+    assert chain_registry.request_templates["ethereum"].method == "POST"
+    assert chain_registry.request_templates["bitcoin"].method == "GET"
+    assert chain_registry.request_templates["ethereum"].rpc_mirror_urls
+
+
+def test_receipt_payload_batches_transaction_receipt_and_block_number():
+    template = chain_registry.request_templates["ethereum"]
+    assert template.rpc_receipt
+    payload = template.rpc_receipt_payload(["0x01", "0x02"])
+    assert [call["id"] for call in payload] == ["tx:0", "receipt:0", "tx:1", "receipt:1", "blockNumber"]
+    assert [call["method"] for call in payload][-2:] == ["eth_getTransactionReceipt", "eth_blockNumber"]
+
+
+def test_invalid_configs_fail_at_startup():
+    configs = get_chain_configs()
+    configs["ethereum"]["rpc_methd"] = "eth_getTransactionByHash"
+    del configs["bitcoin"]["normalize"]
+    configs["polygon"]["api_mirrors"] = "https://polygon-bor-rpc.publicnode.com"
+    configs["bitcoin"]["fallbacks"].append({"provider": "mempool_space", "api": lambda txid: txid, "rpc_methd": "x"})
+    with pytest.raises(ChainConfigError) as excinfo:
+        ChainRegistry(configs)
+    message = str(excinfo.value)
+    assert "rpc_methd" in message
+    assert "normalize" in message
+    assert "polygon: api_mirrors" in message
+    assert "bitcoin: fallbacks[1] 공급자 이름 중복" in message
@@ -0,0 +1,42 @@
+"""
+API 응답 HTTP 캐시 헤더와 조건부 요청(304) 테스트
+"""
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.services.http_caching import conditional_response, etag_matches, tx_cache_control
+
+
+def test_tx_cache_control_follows_status():
+    confirmed = {"status": "confirmed", "confirmations": 100}
+    assert "immutable" in tx_cache_control({"found": True, "results": [confirmed]})
+    assert tx_cache_control({"found": True, "results": [confirmed, {"status": "pending"}]}).endswith("max-age=5")
+    assert "immutable" not in tx_cache_control({"found": True, "results": [{"status": "confirmed", "confirmations": 1}]})
+    assert tx_cache_control({"found": False, "unavailableChains": ["tron"]}) == "no-cache"
+
+
+def test_etag_matches_lists_and_weak_tags():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+
+
+def test_conditional_response_returns_304_for_matching_etag():
+    app = FastAPI()
+
+    @app.get("/tx")
+    async def tx(request: Request):
+        response = JSONResponse(content={"found": True}, headers={"Cache-Control": "public, max-age=5"})
+        return conditional_response(request, response, last_modified="Sat, 17 Oct 2026 00:00:00 GMT")
+
+    client = TestClient(app)
+    first = client.get("/tx")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    again = client.get("/tx", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["etag"] == etag and again.headers["cache-control"] == "public, max-age=5"
+    assert client.get("/tx", headers={"If-Modified-Since": "Sun, 18 Oct 2026 00:00:00 GMT"}).status_code == 304
+    assert client.get("/tx", headers={"If-None-Match": '"other"',
+                                      "If-Modified-Since": "Sun, 18 Oct 2026 00:00:00 GMT"}).status_code == 200
@@ -0,0 +1,85 @@
+"""
+탐색기 HTTP 클라이언트(이벤트 루프별 공유, 호스트별 연결 풀, DNS 캐시) 테스트
+"""
+import asyncio
+import ssl
+
+import httpx
+
+from chatbot.shared_http_client import SharedClient
+from src.services.dns_cache import DNSCache
+from src.services.http_client import DNSCachingTransport, PerHostTransport, explorer_limits, explorer_ssl_context
+
+
+def test_per_host_transport_keeps_one_pool_per_origin():
+    created = []
+
+    def factory():
+        created.append(1)
+        return httpx.MockTransport(lambda request: httpx.Response(200, json={"host": request.url.host}))
+
+    async def run():
+        async with httpx.AsyncClient(transport=PerHostTransport(factory)) as client:
+            for url in ("https://a.example/x", "https://a.example/y", "https://b.example/x", "http://a.example/x"):
+                assert (await client.get(url)).json()["host"] == httpx.URL(url).host
+
+    asyncio.run(run())
+    assert len(created) == 3
+
+
+def test_dns_cache_reuses_addresses_within_ttl():
+    lookups = []
+
+    class FakeCache(DNSCache):
+        async def _lookup(self, host):
+            lookups.append(host)
+            return ["10.0.0.1"], 1.0  # 최소 TTL로 올려 잡힘
+
+    async def run():
+        cache = FakeCache()
+        assert await cache.resolve("127.0.0.1") == ["127.0.0.1"]
+        results = await asyncio.gather(*(cache.resolve("api.example") for _ in range(5)))
+        assert await cache.resolve("api.example") == ["10.0.0.1"]
+        return cache, results
+
+    cache, results = asyncio.run(run())
+    assert results == [["10.0.0.1"]] * 5
+    assert lookups == ["api.example"]
+    assert cache.snapshot()["fresh"] == 1
+
+
+def test_dns_caching_transport_reuses_shared_tls_settings(monkeypatch):
+    explorer_ssl_context()
+    loaded = []
+    load_verify_locations = ssl.SSLContext.load_verify_locations
+
+    def recording(context, *args, **kwargs):
+        loaded.append(args)
+        return load_verify_locations(context, *args, **kwargs)
+
+    monkeypatch.setattr(ssl.SSLContext, "load_verify_locations", recording)
+    for _ in range(3):
+        DNSCachingTransport(explorer_limits())
+    # 호스트마다 인증서 묶음을 다시 읽지 않음
+    assert loaded == []
+
+
+def test_shared_client_is_reused_within_a_loop_and_recreated_per_loop():
+    created = []
+
+    def client_factory(transport_factory):
+        created.append(transport_factory)
+        return httpx.AsyncClient(transport=transport_factory())
+
+    clients = SharedClient(client_factory)
+    clients.set_transport_factory(lambda: httpx.MockTransport(lambda request: httpx.Response(204)))
+
+    async def run():
+        client = clients.get()
+        assert clients.get() is client and (await client.get("https://a.example/")).status_code == 204
+        await clients.aclose()
+        return client
+
+    first, second = asyncio.run(run()), asyncio.run(run())
+    assert first is not second and first.is_closed and second.is_closed
+    assert len(created) == 2 and clients.current is None
@@ -0,0 +1,39 @@
+"""
+시세 질문 빠른 경로(Router 분류, Price Specialist 답변) 테스트
+"""
+import asyncio
+
+from langchain_core.messages import HumanMessage
+
+from chatbot.nodes.router import RuleBasedClassifier
+from chatbot.nodes.specialists import price
+
+
+def _classify(message: str):
+    result, _ = RuleBasedClassifier.classify({"messages": [HumanMessage(content=message)], "session_id": "t"}, message)
+    return result
+
+
+def test_price_question_with_coins_routes_to_price_specialist():
+    result = _classify("BTC ETH 시세 비교")
+    assert result["specialist_used"] == "price"
+    assert result["price_coins"] == ["비트코인", "이더리움"]
+    assert _classify("시세가 뭐야")["specialist_used"] == "web_search"
+
+
+def test_price_specialist_answers_without_llm_and_falls_back_on_failure(monkeypatch):
+    async def fake_prices(coin_names, is_past_date, requested_date):
+        quote = {"name": "Bitcoin", "symbol": "BTC", "price_krw": 140000000.0, "price_usd": 100000.0,
+                 "last_updated": "2026-10-17T00:00:00Z"}
+        return [(quote, "coinmarketcap_api", "비트코인")] if "비트코인" in coin_names else []
+
+    monkeypatch.setattr(price, "get_prices", fake_prices)
+    state = {"messages": [HumanMessage(content="비트코인 리플 시세")], "session_id": "t",
+             "price_coins": ["비트코인", "리플"]}
+    result = asyncio.run(price.price_specialist(state))
+    answer = result["messages"][0].content
+    assert "140,000,000원" in answer and "리플 시세는 가져오지 못했습니다" in answer
+    assert result["needs_web_search"] is False
+
+    state["price_coins"] = ["리플"]
+    assert asyncio.run(price.price_specialist(state))["needs_web_search"] is True
@@ -0,0 +1,185 @@
+"""
+CoinMarketCap/CoinGecko 여러 코인 일괄 시세 조회, 시세 캐시(stale-while-revalidate, 미리 받기), CMC ID 맵 테스트
+"""
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from chatbot import coinmarketcap, price_http, price_lookup
+from chatbot.cmc_id_map import CoinMarketCapIdMap
+from chatbot.coingecko import CoinGeckoService
+from chatbot.coinmarketcap import CoinMarketCapService
+from chatbot.price_cache import PriceCache
+from chatbot.price_prefetch import PricePrefetcher
+
+
+@pytest.fixture(autouse=True)
+def _reset_price_client():
+    yield
+    price_http.set_transport_factory(None)
+
+
+def _mock_client(handler):
+    requests = []
+
+    def recording(request):
+        requests.append(request)
+        return handler(request)
+
+    price_http.set_transport_factory(lambda: httpx.MockTransport(recording))
+    return requests
+
+
+def test_coinmarketcap_batch_fetches_symbols_in_one_request(monkeypatch):
+    def handler(request):
+        symbols = request.url.params["symbol"].split(",")
+        data = {symbol: {"symbol": symbol, "name": symbol.title(), "last_updated": "now",
+                         "quote": {"KRW": {"price": 1000.0, "percent_change_24h": 1.0}}}
+                for symbol in symbols if symbol != "XRP"}
+        return httpx.Response(200, json={"status": {"error_code": 0}, "data": data})
+
+    monkeypatch.setattr(CoinMarketCapService, "API_KEY", "test")
+    monkeypatch.setattr(CoinMarketCapService, "_cache", PriceCache())
+    requests = _mock_client(handler)
+
+    results = asyncio.run(CoinMarketCapService.get_prices(["비트코인", "BTC", "이더리움", "리플"]))
+    assert len(requests) == 1
+    assert sorted(requests[0].url.params["symbol"].split(",")) == ["BTC", "ETH", "XRP"]
+    assert results["비트코인"]["price_krw"] == 1000.0 and results["BTC"] is results["비트코인"]
+    assert results["리플"] is None
+    # 일괄 조회 결과가 코인별 캐시에 저장되어 단일 조회는 요청하지 않음
+    assert asyncio.run(CoinMarketCapService.get_price("이더리움"))["symbol"] == "ETH"
+    assert len(requests) == 1
+
+
+def test_coingecko_batch_fetches_ids_in_one_request(monkeypatch):
+    def handler(request):
+        ids = request.url.params["ids"].split(",")
+        return httpx.Response(200, json={coin_id: {"krw": 2000.0, "usd": 1.5} for coin_id in ids})
+
+    monkeypatch.setattr(CoinGeckoService, "_cache", PriceCache())
+    requests = _mock_client(handler)
+
+    results = asyncio.run(CoinGeckoService.get_prices(["솔라나", "ETH"]))
+    assert len(requests) == 1 and requests[0].url.params["ids"] == "ethereum,solana"
+    assert results["솔라나"]["price_krw"] == 2000.0 and results["ETH"]["price_usd"] == 1.5
+    assert asyncio.run(CoinGeckoService.get_prices(["솔라나"]))["솔라나"]["price_krw"] == 2000.0
+    assert len(requests) == 1
+
+
+def test_price_requests_share_one_keepalive_client(monkeypatch):
+    clients = []
+
+    def handler(request):
+        if "coingecko" in request.url.host:
+            return httpx.Response(200, json={"solana": {"krw": 2000.0, "usd": 1.5}})
+        quote = {"symbol": "BTC", "name": "Bitcoin", "last_updated": "now",
+                 "quote": {"KRW": {"price": 1000.0, "percent_change_24h": 1.0}}}
+        return httpx.Response(200, json={"status": {"error_code": 0}, "data": {"BTC": quote}})
+
+    def factory():
+        clients.append(1)
+        return httpx.MockTransport(handler)
+
+    monkeypatch.setattr(CoinMarketCapService, "API_KEY", "test")
+    monkeypatch.setattr(CoinMarketCapService, "_cache", PriceCache())
+    monkeypatch.setattr(CoinGeckoService, "_cache", PriceCache())
+    price_http.set_transport_factory(factory)
+
+    async def scenario():
+        btc = await CoinMarketCapService.get_prices(["BTC"])
+        sol = await CoinGeckoService.get_prices(["솔라나"])
+        return btc["BTC"]["price_krw"], sol["솔라나"]["price_krw"], price_http.shared_client()
+
+    btc_price, sol_price, client = asyncio.run(scenario())
+    assert (btc_price, sol_price) == (1000.0, 2000.0)
+    # 코인마켓캡과 코인게코 일괄 조회가 클라이언트(연결 풀) 하나를 함께 사용하고 요청 후 닫지 않음
+    assert len(clients) == 1 and not client.is_closed
+
+
+def test_stale_price_is_returned_immediately_and_refreshed_in_background(monkeypatch):
+    prices = iter([1000.0, 2000.0])
+
+    def handler(request):
+        quote = {"symbol": "BTC", "name": "Bitcoin", "last_updated": "now",
+                 "quote": {"KRW": {"price": next(prices), "percent_change_24h": 1.0}}}
+        return httpx.Response(200, json={"status": {"error_code": 0}, "data": {"BTC": quote}})
+
+    monkeypatch.setattr(CoinMarketCapService, "API_KEY", "test")
+    monkeypatch.setattr(CoinMarketCapService, "_cache", PriceCache(fresh_seconds=0, max_age_seconds=60))
+    requests = _mock_client(handler)
+
+    async def scenario():
+        assert (await CoinMarketCapService.get_price("비트코인"))["price_krw"] == 1000.0
+        # 오래된 값을 바로 반환하고 재조회는 백그라운드에서 한 번만
+        stale = await asyncio.gather(*(CoinMarketCapService.get_price("BTC") for _ in range(3)))
+        assert [quote["price_krw"] for quote in stale] == [1000.0] * 3
+        await asyncio.sleep(0.05)
+        return await CoinMarketCapService.get_price("BTC")
+
+    assert asyncio.run(scenario())["price_krw"] == 2000.0
+    assert len(requests) == 2
+
+
+def test_price_cache_is_bounded_and_keeps_historical_entries():
+    cache = PriceCache(max_size=2, fresh_seconds=0, max_age_seconds=0)
+    cache.set("BTC_KRW_20260101", {"price_krw": 1.0}, permanent=True)
+    cache.set("ETH_KRW_current", {"price_krw": 2.0})
+    assert cache.lookup("BTC_KRW_20260101") == ({"price_krw": 1.0}, False)
+    assert cache.lookup("ETH_KRW_current") == (None, False)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert len(cache) == 2 and cache.stats()["evictions"] == 1
+
+
+def test_prefetcher_ranks_most_asked_coins_and_fills_with_defaults():
+    prefetcher = PricePrefetcher()
+    prefetcher.record(["솔라나"])
+    prefetcher.record(["솔라나", "리플"])
+    assert prefetcher.top(3) == ["솔라나", "리플", "비트코인"]
+
+
+def test_prefetcher_skips_idle_runs_and_fetches_only_expiring_coins(monkeypatch):
+    prefetched = []
+
+    async def get_current_prices(coin_names):
+        prefetched.append(coin_names)
+        return {}
+
+    monkeypatch.setattr(price_lookup, "get_current_prices", get_current_prices)
+    monkeypatch.setattr(CoinMarketCapService, "_cache", PriceCache(fresh_seconds=120, max_age_seconds=300))
+    monkeypatch.setattr(CoinGeckoService, "_cache", PriceCache(fresh_seconds=120, max_age_seconds=300))
+    prefetcher = PricePrefetcher()
+
+    # 지난 실행 뒤 시세 질문이 없으면 요청하지 않음
+    assert asyncio.run(prefetcher.prefetch_once(within=180)) == 0
+    assert prefetched == [] and prefetcher.idle_skips == 1
+
+    CoinMarketCapService._cache.set("BTC_KRW_current", {"price_krw": 1.0})
+    prefetcher.record(["비트코인", "이더리움"])
+    asyncio.run(prefetcher.prefetch_once(within=180))
+    assert "비트코인" not in prefetched[0] and prefetched[0][0] == "이더리움"
+    assert asyncio.run(prefetcher.prefetch_once(within=180)) == 0
+    assert len(prefetched) == 1
+
+
+def test_historical_price_resolves_cmc_id_from_map_without_latest_call(monkeypatch):
+    def handler(request):
+        assert request.url.path.endswith("/quotes/historical") and request.url.params["id"] == "1027"
+        quote = {"quote": {"KRW": {"price": 3000000.0, "percent_change_24h": 0.5}}, "timestamp": "2026-01-01"}
+        return httpx.Response(200, json={"status": {"error_code": 0},
+                                         "data": {"1027": {"name": "Ethereum", "quotes": [quote]}}})
+
+    id_map = CoinMarketCapIdMap()
+    id_map.load([{"id": 1027, "symbol": "ETH", "name": "Ethereum", "slug": "ethereum", "rank": 2},
+                 {"id": 99999, "symbol": "ETH", "name": "Ethereum Fake", "slug": "ethereum-fake", "rank": 3000}])
+    monkeypatch.setattr(coinmarketcap, "cmc_id_map", id_map)
+    monkeypatch.setattr(CoinMarketCapService, "API_KEY", "test")
+    monkeypatch.setattr(CoinMarketCapService, "_cache", PriceCache())
+    requests = _mock_client(handler)
+
+    result = asyncio.run(CoinMarketCapService.get_price("ethereum", target_date=datetime(2026, 1, 1)))
+    assert result["price_krw"] == 3000000.0 and len(requests) == 1
+    assert id_map.snapshot()["hits"] == 1
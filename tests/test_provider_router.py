@@ -0,0 +1,22 @@
+"""
+공급자 선택(대체 공급자 순서) 테스트
+"""
+from src.services.chain_registry import chain_registry
+from src.services.provider_router import ProviderRouter
+
+
+def test_slow_or_failing_primary_falls_behind_fallback():
+    routes = chain_registry.routes["bnb_smart_chain"]
+    assert [route.key for route in routes] == ["bnb_smart_chain", "bnb_smart_chain@publicnode"]
+
+    router = ProviderRouter()
+    assert router.rank(routes)[0].key == "bnb_smart_chain"  # 통계가 없으면 설정 순서
+
+    router.record("bnb_smart_chain@publicnode", ok=True, latency=0.1)
+    router.record_abandoned("bnb_smart_chain", elapsed=2.0)
+    assert router.rank(routes)[0].key == "bnb_smart_chain@publicnode"
+
+    router = ProviderRouter()
+    router.record("bnb_smart_chain", ok=False, latency=0.05)
+    router.record("bnb_smart_chain@publicnode", ok=True, latency=0.3)
+    assert router.rank(routes)[0].key == "bnb_smart_chain@publicnode"
@@ -0,0 +1,50 @@
+"""
+요청 한도(토큰 버킷) 테스트
+"""
+import asyncio
+
+from src.services.api_key_pool import ApiKeyPool, parse_api_keys
+from src.services.chain_registry import chain_registry
+from src.services.rate_limiter import RateLimiter, TokenBucket
+from src.services.transaction_service import rate_limit_bucket
+
+
+def test_token_bucket_waits_then_sheds():
+    bucket = TokenBucket(rate=2.0, burst=1)
+    assert bucket.reserve(max_wait=1.0) == 0.0
+    assert 0 < bucket.reserve(max_wait=1.0) <= 0.5
+    assert bucket.reserve(max_wait=0.1) is None
+    assert bucket.shed == 1
+
+
+def test_token_bucket_backoff_blocks_for_retry_after():
+    bucket = TokenBucket(rate=5.0, burst=5)
+    bucket.backoff(3.0)
+    assert bucket.reserve(max_wait=1.0) is None
+    assert bucket.reserve(max_wait=5.0) >= 3.0
+
+
+def test_etherscan_family_hosts_do_not_share_a_bucket():
+    limiter = RateLimiter(max_wait=0.0)
+    bsc, arbitrum = (rate_limit_bucket(key, chain_registry[key]) for key in ("bnb_smart_chain", "arbitrum_one"))
+    assert bsc[0] == arbitrum[0] == "etherscan" and bsc[2] != arbitrum[2]
+
+    async def drain(bucket, count):
+        return [await limiter.acquire(*bucket) for _ in range(count)]
+
+    # 한 탐색기의 한도(버스트 5)를 다 써도 다른 탐색기 요청은 버려지지 않음
+    assert asyncio.run(drain(bsc, 6)) == [True] * 5 + [False]
+    assert asyncio.run(drain(arbitrum, 5)) == [True] * 5
+    # 같은 호스트를 쓰는 체인(blockcypher의 BTC/LTC)은 한도를 공유
+    assert rate_limit_bucket("bitcoin", chain_registry["bitcoin"]) == rate_limit_bucket("litecoin", chain_registry["litecoin"])
+
+
+def test_api_key_pool_rotates_and_skips_cooling_keys():
+    pool = ApiKeyPool("TEST_API_KEY", parse_api_keys(" key-a, key-b,key-a ,"))
+    assert len(pool) == 2
+    assert [pool.choose() for _ in range(3)] == ["key-a", "key-b", "key-a"]
+    pool.cooldown("key-b", 30.0)
+    assert [pool.choose() for _ in range(2)] == ["key-a", "key-a"]
+    pool.mark_invalid("key-a")
+    assert pool.choose() is None
+    assert pool.snapshot()["available"] == 0
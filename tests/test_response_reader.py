@@ -0,0 +1,50 @@
+"""
+탐색기 응답 본문 제한 읽기 테스트
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.services.response_reader import ResponseTooLarge, read_json
+
+
+def streamed_response(body: bytes, chunk_size: int = 64) -> httpx.Response:
+    chunks = [body[index:index + chunk_size] for index in range(0, len(body), chunk_size)]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return httpx.Response(200, content=stream())
+
+
+def large_blockcypher_body() -> bytes:
+    inputs = [{"addresses": [f"addr-{index}"], "output_value": index} for index in range(2000)]
+    return json.dumps({"hash": "ab" * 32, "total": 150000000, "block_height": 800000, "addresses": ["x"] * 2000,
+                       "inputs": inputs, "outputs": [{"addresses": ["to-0"]}]}).encode()
+
+
+def test_plain_read_stops_at_max_bytes():
+    body = large_blockcypher_body()
+    assert asyncio.run(read_json(streamed_response(body), max_bytes=len(body)))[0]["total"] == 150000000
+    with pytest.raises(ResponseTooLarge):
+        asyncio.run(read_json(streamed_response(body), max_bytes=1024))
+
+
+def test_selected_fields_keep_first_array_items_and_flag_truncation():
+    pytest.importorskip("ijson")
+    fields = ["hash", "total", "block_height", "inputs", "outputs"]
+    body = large_blockcypher_body()
+
+    document, truncated = asyncio.run(read_json(streamed_response(body), max_bytes=len(body), fields=fields))
+    assert not truncated
+    assert "addresses" not in document
+    assert len(document["inputs"]) == 5 and document["inputs"][0]["addresses"] == ["addr-0"]
+    assert document["outputs"] == [{"addresses": ["to-0"]}]
+
+    document, truncated = asyncio.run(read_json(streamed_response(body), max_bytes=30000, fields=fields))
+    assert truncated
+    assert document["hash"] == "ab" * 32 and document["inputs"][0]["addresses"] == ["addr-0"]
+    assert "outputs" not in document
@@ -0,0 +1,47 @@
+"""
+동시 요청 병합(single-flight) 테스트
+"""
+import asyncio
+
+from chatbot.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_task():
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f"value-{key}"
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("a", fetch, "a") for _ in range(5)))
+        assert results == ["value-a"] * 5
+        assert flight.stats() == {"in_flight": 0, "calls": 5, "coalesced": 4}
+
+    asyncio.run(main())
+    assert calls == ["a"]
+
+
+def test_task_is_cancelled_only_when_every_caller_cancels():
+    started = []
+
+    async def slow():
+        started.append(1)
+        await asyncio.sleep(10)
+
+    async def main():
+        flight = SingleFlight()
+        first = asyncio.create_task(flight.do("k", slow))
+        second = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        assert len(flight) == 1
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+        assert len(flight) == 0
+
+    asyncio.run(main())
+    assert started == [1]
@@ -0,0 +1,372 @@
+"""
+트랜잭션 조회 흐름 테스트 (탐색기 요청은 conftest.py의 StubExplorer로 보냄)
+"""
+import asyncio
+import dataclasses
+import functools
+import json
+import time
+from types import MappingProxyType
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.routers.api import register_api_routes
+from src.services import circuit_breaker, transaction_service
+from src.services import tx_watcher as watcher_module
+from src.services.cache import cache, chain_miss_key
+from src.services.chain_registry import chain_registry
+from src.services.chain_stats import ChainStats
+from src.services.http_client import explorer_client
+from src.services.tx_watcher import TransactionWatcher
+
+TXID = "ab" * 32
+OTHER_TXID = "cd" * 32
+EVM_TXID = "0x" + "ab" * 32
+BITCOIN = "/v1/btc/main/txs/"
+TRON = "apilist.tronscan.org"
+
+
+def bitcoin_tx(txid: str, confirmations: int = 6) -> dict:
+    """blockcypher 트랜잭션 응답 본문"""
+    return {"hash": txid, "block_height": 871234, "total": 125000000, "confirmations": confirmations,
+            "inputs": [{"addresses": ["bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh"]}],
+            "outputs": [{"addresses": ["bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq"], "value": 125000000}]}
+
+
+def tron_tx(txid: str, confirmed: bool = True) -> dict:
+    """tronscan 트랜잭션 응답 본문"""
+    return {"hash": txid, "block": 65432101, "confirmed": confirmed, "contractRet": "SUCCESS",
+            "contractData": {"owner_address": "TNPeeaaFB7K9cmo4uQpcU32zGK8G1NYqeL",
+                             "to_address": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", "amount": 2500000}}
+
+
+def ethereum_rpc_results(txid: str) -> dict:
+    """이더리움 JSON-RPC 메서드별 result"""
+    return {
+        "eth_getTransactionByHash": {"hash": txid, "from": "0x4838b106fce9647bdf1e7877bf73ce8b0bad5f97",
+                                     "to": "0x388c818ca8b9251b393131c08a736a67ccb19297", "value": "0x1bc16d674ec80000",
+                                     "blockNumber": "0x13a7f1c", "gas": "0x5208", "nonce": "0x1f"},
+        "eth_getTransactionReceipt": {"transactionHash": txid, "blockNumber": "0x13a7f1c", "status": "0x1",
+                                      "gasUsed": "0x5208", "effectiveGasPrice": "0x2540be400"},
+        "eth_blockNumber": "0x13a7f3a",
+    }
+
+
+def route(responses: dict):
+    """
+    URL에 처음 포함된 문자열의 응답을 돌려주는 handler (맞는 문자열이 없으면 404).
+    응답은 본문(dict), httpx.Response 또는 request를 받아 둘 중 하나를 반환하는 코루틴 함수
+    """
+    async def handler(request):
+        url = str(request.url)
+        for fragment, response in responses.items():
+            if fragment in url:
+                if callable(response):
+                    response = await response(request)
+                return response if isinstance(response, httpx.Response) else httpx.Response(200, json=response)
+        return httpx.Response(404, json={"error": "not found"})
+    return handler
+
+
+def stage_hosts(txid: str):
+    """새 통계 기준 (1단계 체인만 쓰는 요청 호스트, 나머지 체인만 쓰는 요청 호스트). 같은 공급자를 쓰는 체인은 단계가 다를 수 있음"""
+    candidates = {key: (cfg, txid_for_api) for key, cfg, txid_for_api in transaction_service.select_candidate_chains(txid)}
+
+    def hosts(keys):
+        found = set()
+        for key in keys:
+            cfg, txid_for_api = candidates[key]
+            urls = cfg["api"](txid_for_api)
+            found.update(httpx.URL(url).host for url in (urls if isinstance(urls, list) else [urls]))
+        return found
+
+    stage1, stage2 = (hosts(stage_keys) for stage_keys in ChainStats().split_stages(list(candidates)))
+    return stage1 - stage2, stage2 - stage1
+
+
+def collect(txid: str, outcomes: dict = None) -> list:
+    async def run():
+        return [result async for result in transaction_service.iter_transaction_results(txid, outcomes=outcomes)]
+    return asyncio.run(run())
+
+
+def fetch(key: str, txid: str):
+    """체인 하나를 조회한 (조회 결과 상태, 정규화된 데이터)"""
+    async def run():
+        cfg = transaction_service.CHAIN_CONFIGS[key]
+        async with explorer_client() as client:
+            return await transaction_service.fetch_chain_result(client, cfg["classify_txid"](txid), key, cfg, txid)
+    return asyncio.run(run())
+
+
+def sse_events(response) -> list:
+    return [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line.startswith("data: ")]
+
+
+@pytest.fixture
+def api_client():
+    app = FastAPI()
+    register_api_routes(app, None)
+    return TestClient(app)
+
+
+def test_stream_sends_results_then_done_and_closes(explorer, api_client):
+    explorer.handler = route({BITCOIN: bitcoin_tx(TXID), TRON: tron_tx(TXID)})
+
+    events = sse_events(api_client.get(f"/api/tx/{TXID}/stream"))
+    assert [event["type"] for event in events] == ["start", "result", "result", "done"]
+    assert events[0]["txid"] == TXID
+    assert {event["result"]["chain"] for event in events[1:3]} == {"bitcoin", "tron"}
+    assert events[-1] == {"type": "done", "found": True, "count": 2}
+
+
+def test_stream_first_match_cancels_slower_chains(explorer, api_client):
+    cancelled = []
+
+    async def slow_tron(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.host)
+            raise
+        return tron_tx(TXID)
+
+    explorer.handler = route({BITCOIN: bitcoin_tx(TXID), TRON: slow_tron})
+
+    events = sse_events(api_client.get(f"/api/tx/{TXID}/stream", params={"first_match": "true"}))
+    assert [event["type"] for event in events] == ["start", "result", "done"]
+    assert events[1]["result"]["chain"] == "bitcoin" and events[-1]["count"] == 1
+    assert cancelled == [TRON]
+
+
+def test_stage2_chains_are_probed_only_after_stage1_misses(explorer):
+    stage1, stage2 = stage_hosts(TXID)
+    assert collect(TXID) == []
+
+    hosts = explorer.hosts()
+    assert set(hosts) >= stage1 | stage2
+    assert max(index for index, host in enumerate(hosts) if host in stage1) < \
+        min(index for index, host in enumerate(hosts) if host in stage2)
+
+
+def test_stage1_hit_does_not_widen_to_stage2(explorer):
+    _, stage2 = stage_hosts(TXID)
+    explorer.handler = route({BITCOIN: bitcoin_tx(TXID)})
+
+    results = collect(TXID)
+    assert [result["chain"] for result in results] == ["bitcoin"]
+    assert not set(explorer.hosts()) & stage2
+
+
+def test_stage1_deadline_widens_while_stage1_is_still_pending(explorer, monkeypatch):
+    monkeypatch.setattr(transaction_service, "STAGE1_DEADLINE_SECONDS", 0.05)
+    _, stage2 = stage_hosts(TXID)
+    widened = None
+    tron_answered = []
+
+    async def slow_tron(request):
+        # 나머지 체인 요청이 시작되면 바로 응답 (마감 시간에 확장하지 않으면 2초 뒤 응답)
+        await asyncio.wait_for(widened.wait(), timeout=2)
+        tron_answered.append(True)
+        return httpx.Response(404)
+
+    async def stage2_request(request):
+        widened.set()
+        return httpx.Response(404)
+
+    async def run():
+        nonlocal widened
+        widened = asyncio.Event()
+        explorer.handler = route({TRON: slow_tron, **{host: stage2_request for host in stage2}})
+        return [result async for result in transaction_service.iter_transaction_results(TXID)]
+
+    assert asyncio.run(run()) == []
+    assert tron_answered == [True]
+
+
+def test_not_found_everywhere_is_negative_cached_until_ttl_expires(explorer, monkeypatch):
+    monkeypatch.setattr(transaction_service.negative_cache, "ttl_seconds", 0.2)
+    monkeypatch.setattr(transaction_service.chain_miss_cache, "ttl_seconds", 0.2)
+
+    assert collect(TXID) == []
+    assert transaction_service.negative_cache.get(TXID) is True
+    first_requests = len(explorer.requests)
+    assert first_requests > 0
+
+    # 부정 캐시 적중: 탐색기 요청 없음
+    assert collect(TXID) == []
+    assert len(explorer.requests) == first_requests
+
+    time.sleep(0.25)
+    assert collect(TXID) == []
+    assert len(explorer.requests) == 2 * first_requests
+
+
+def test_errors_keep_txid_out_of_negative_cache_and_retry_only_failed_chains(explorer):
+    explorer.handler = route({TRON: httpx.Response(500, json={"error": "internal"})})
+
+    outcomes = {}
+    assert collect(TXID, outcomes) == []
+    assert outcomes["tron"] == transaction_service.LOOKUP_ERROR
+    assert transaction_service.negative_cache.get(TXID) is None
+    assert transaction_service.chain_miss_cache.get(chain_miss_key("bitcoin", TXID)) is True
+    assert transaction_service.chain_miss_cache.get(chain_miss_key("tron", TXID)) is None
+
+    # 재조회는 "없음"으로 응답하지 않은 체인만
+    explorer.requests.clear()
+    explorer.handler = route({TRON: tron_tx(TXID)})
+    assert [result["chain"] for result in collect(TXID)] == ["tron"]
+    assert set(explorer.hosts()) == {TRON}
+
+
+def test_circuit_opens_on_errors_then_half_open_probe_closes_it(explorer, monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "CircuitBreaker",
+                        functools.partial(circuit_breaker.CircuitBreaker, failure_threshold=2, recovery_timeout=0.1))
+    breaker = transaction_service.circuit_breakers.get("tron")
+    explorer.handler = route({TRON: httpx.Response(500, json={"error": "internal"})})
+
+    assert [fetch("tron", TXID)[0] for _ in range(2)] == [transaction_service.LOOKUP_ERROR] * 2
+    assert breaker.state == circuit_breaker.STATE_OPEN
+    # 열린 서킷은 요청하지 않음
+    assert fetch("tron", TXID) == (transaction_service.LOOKUP_UNAVAILABLE, None)
+    assert len(explorer.requests) == 2
+
+    async def slow_tron(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=tron_tx(TXID))
+
+    async def probe():
+        await asyncio.sleep(0.1)
+        cfg = transaction_service.CHAIN_CONFIGS["tron"]
+        async with explorer_client() as client:
+            lookups = [transaction_service.fetch_chain_result(client, TXID, "tron", cfg, TXID) for _ in range(2)]
+            return [status for status, _ in await asyncio.gather(*lookups)]
+
+    explorer.handler = route({TRON: slow_tron})
+    # 반열림 상태에서는 시험 요청 한 건만 보내고, 성공하면 닫힘
+    assert sorted(asyncio.run(probe())) == [transaction_service.LOOKUP_FOUND, transaction_service.LOOKUP_UNAVAILABLE]
+    assert len(explorer.requests) == 3
+    assert breaker.state == circuit_breaker.STATE_CLOSED
+
+
+def test_batch_dedups_txids_and_streams_events_in_completion_order(explorer, api_client):
+    async def slow_tron(request):
+        if OTHER_TXID not in str(request.url):
+            return httpx.Response(404)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=tron_tx(OTHER_TXID))
+
+    explorer.handler = route({f"{BITCOIN}{TXID}": bitcoin_tx(TXID), TRON: slow_tron})
+
+    response = api_client.post("/api/tx/batch", json={"txids": [TXID, TXID, f" {OTHER_TXID} ", OTHER_TXID]})
+    events = sse_events(response)
+    assert [(event["type"], event.get("txid")) for event in events] == [
+        ("start", None),
+        ("result", TXID), ("tx_done", TXID),
+        ("result", OTHER_TXID), ("tx_done", OTHER_TXID),
+        ("done", None),
+    ]
+    assert events[0]["txids"] == [TXID, OTHER_TXID]
+    assert events[1]["result"]["chain"] == "bitcoin" and events[3]["result"]["chain"] == "tron"
+    assert events[-1] == {"type": "done", "total": 2, "found": 2}
+    # 중복 txid는 체인마다 한 번만 요청
+    requested = [str(request.url) for request in explorer.requests]
+    assert sum(BITCOIN + TXID in url for url in requested) == 1
+    assert sum(TRON in url and OTHER_TXID in url for url in requested) == 1
+
+
+def test_watcher_repolls_pending_transaction_and_archives_when_confirmed(explorer, monkeypatch):
+    archived = []
+
+    class RecordingArchive:
+        def archive(self, txid, results):
+            archived.append((txid, results))
+            return True
+
+    watcher = TransactionWatcher(backoff_schedule=(0.05,), max_watch_seconds=5)
+    monkeypatch.setattr(transaction_service, "tx_watcher", watcher)
+    monkeypatch.setattr(watcher_module, "tx_archive", RecordingArchive())
+    pending = tron_tx(TXID, confirmed=False)
+    tron_bodies = iter([pending, pending, tron_tx(TXID)])
+
+    async def tron(request):
+        return next(tron_bodies)
+
+    explorer.handler = route({TRON: tron})
+
+    async def run():
+        results = [result async for result in transaction_service.iter_transaction_results(TXID)]
+        queue = watcher.subscribe(TXID)
+        events = []
+        while True:
+            event = await asyncio.wait_for(queue.get(), timeout=2)
+            if event is None:
+                return results, events
+            events.append(event)
+
+    results, events = asyncio.run(run())
+    assert [result["status"] for result in results] == ["pending"]
+    assert [(event["type"], event.get("status")) for event in events] == [("status", "confirmed"), ("done", None)]
+    assert events[-1]["final"] and events[-1]["statuses"] == {"tron": "confirmed"}
+    # 최초 조회 + 재조회 두 번 (두 번째 재조회에서 확정)
+    assert sum(TRON in host for host in explorer.hosts()) == 3
+    assert [(txid, [key for key, _ in found]) for txid, found in archived] == [(TXID, ["tron"])]
+    assert cache.get(TXID)[0]["status"] == "confirmed"
+    assert not watcher.is_watching(TXID)
+
+
+def rpc_reply(results: dict):
+    """JSON-RPC 요청(단일 또는 배치)에 메서드별 result로 답하는 응답 함수"""
+    async def reply(request):
+        payload = json.loads(request.content)
+        calls = payload if isinstance(payload, list) else [payload]
+        replies = [{"jsonrpc": "2.0", "id": call["id"], "result": results[call["method"]]} for call in calls]
+        return httpx.Response(200, json=replies if isinstance(payload, list) else replies[0])
+    return reply
+
+
+def test_hedged_mirror_wins_and_cancels_slow_primary(explorer, monkeypatch):
+    monkeypatch.setattr(transaction_service, "HEDGE_DEFAULT_DELAY", 0.05)
+    monkeypatch.setattr(transaction_service, "hedge_stats", {"requests": 0, "hedged": 0, "mirror_wins": 0})
+    template = chain_registry.request_templates["ethereum"]
+    primary = httpx.URL(template.rpc_url).host
+    mirror = httpx.URL(template.rpc_mirror_urls[0]).host
+    reply = rpc_reply(ethereum_rpc_results(EVM_TXID))
+    cancelled = []
+
+    async def slow_primary(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.host)
+            raise
+        return await reply(request)
+
+    explorer.handler = route({primary: slow_primary, mirror: reply})
+
+    status, result = fetch("ethereum", EVM_TXID)
+    assert status == transaction_service.LOOKUP_FOUND and result["txid"] == EVM_TXID
+    assert explorer.hosts() == [primary, mirror]
+    assert cancelled == [primary]
+    assert transaction_service.hedge_stats == {"requests": 1, "hedged": 1, "mirror_wins": 1}
+    assert transaction_service.circuit_breakers.get("ethereum").state == circuit_breaker.STATE_CLOSED
+
+
+def test_truncated_body_missing_required_fields_is_not_negative_cached(explorer, monkeypatch):
+    pytest.importorskip("ijson")
+    # outputs가 큰 inputs 뒤에 있어 최대 크기까지 읽은 필드로는 정규화할 수 없음
+    inputs = [{"addresses": [f"addr-{index}"], "output_value": index} for index in range(2000)]
+    body = json.dumps({"hash": TXID, "total": 1, "block_height": 1, "inputs": inputs, "outputs": [{"addresses": ["to"]}]})
+    templates = dict(chain_registry.request_templates)
+    templates["dogecoin"] = dataclasses.replace(templates["dogecoin"], max_response_bytes=30000)
+    monkeypatch.setattr(chain_registry, "request_templates", MappingProxyType(templates))
+    explorer.handler = route({"/v1/doge/": httpx.Response(200, content=body.encode())})
+
+    outcomes = {}
+    assert collect(TXID, outcomes) == []
+    assert outcomes["dogecoin"] == transaction_service.LOOKUP_ERROR
+    assert transaction_service.chain_miss_cache.get(chain_miss_key("dogecoin", TXID)) is None
+    assert transaction_service.negative_cache.get(TXID) is None
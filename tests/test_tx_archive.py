@@ -0,0 +1,59 @@
+"""
+확정된 트랜잭션 아카이브 테스트
+"""
+import asyncio
+
+from src.services import tx_archive as archive_module
+from src.services.tx_archive import TransactionArchive, is_final
+
+
+class FakeArchiveStore:
+    """mongodb_client의 아카이브 메서드만 흉내 내는 메모리 저장소"""
+
+    tx_archive_collection = object()
+
+    def __init__(self):
+        self.docs = {}
+
+    async def get_archived_transactions(self, txids):
+        archived = {}
+        for (chain, txid), doc in self.docs.items():
+            if txid in txids:
+                archived.setdefault(txid, []).append(doc)
+        return archived
+
+    async def archive_transactions(self, documents):
+        for doc in documents:
+            self.docs[(doc["chain"], doc["txid"])] = doc
+        return True
+
+    async def touch_archived_transactions(self, txids):
+        return True
+
+
+def test_only_final_results_are_archived(monkeypatch):
+    store = FakeArchiveStore()
+    monkeypatch.setattr(archive_module, "mongodb_client", store)
+
+    async def main():
+        archive = TransactionArchive(enabled=True)
+        confirmed = {"chain": "ethereum", "status": "confirmed", "confirmations": 40}
+        assert not archive.archive("0xpending", [("ethereum", {"status": "pending"}), ("polygon", confirmed)])
+        assert not archive.archive("0xshallow", [("ethereum", {**confirmed, "confirmations": 1})])
+        assert archive.archive("0xfinal", [("polygon", {**confirmed, "chain": "polygon"}), ("ethereum", confirmed)])
+        await archive.drain()
+
+        results = await archive.get_many(["0xfinal", "0xpending"])
+        assert list(results) == ["0xfinal"]
+        # 체인 설정 순서로 정렬되고, 조회 시점에 따라 바뀌는 확인 수는 저장하지 않음
+        assert results["0xfinal"] == [{"chain": "ethereum", "status": "confirmed"}, {"chain": "polygon", "status": "confirmed"}]
+        assert archive.snapshot()["hits"] == 1
+
+    asyncio.run(main())
+
+
+def test_is_final():
+    assert is_final({"status": "failed"})
+    assert is_final({"status": "confirmed", "confirmations": 12})
+    assert not is_final({"status": "confirmed", "confirmations": 3})
+    assert not is_final({"status": "failed_or_pending"})
@@ -0,0 +1,37 @@
+"""
+트랜잭션 해시 형식 분류기 테스트
+"""
+import base64
+
+from src.services.transaction_service import select_candidate_chains
+
+EVM_TXID = "0x" + "ab" * 32
+HEX_TXID = "cd" * 32
+SOLANA_TXID = "5" + "3" * 86
+TON_BYTES = bytes(range(32))
+
+def candidate_keys(txid):
+    return {key for key, _, _ in select_candidate_chains(txid)}
+
+def test_evm_hash_only_targets_evm_chains():
+    keys = candidate_keys(EVM_TXID)
+    assert "ethereum" in keys and "bnb_smart_chain" in keys and "stacks" in keys
+    assert not keys & {"bitcoin", "tron", "solana", "ton", "xrp"}
+
+def test_bare_hex_hash_targets_hex_chains_and_evm_chains_with_prefix():
+    candidates = {key: txid for key, _, txid in select_candidate_chains(HEX_TXID)}
+    assert {"bitcoin", "tron", "xrp", "stellar", "atom", "ton", "stacks", "ethereum", "polygon"} <= set(candidates)
+    assert "solana" not in candidates
+    assert candidates["bitcoin"] == HEX_TXID
+    assert candidates["ethereum"] == candidates["stacks"] == "0x" + HEX_TXID
+
+def test_solana_signature_targets_solana_only():
+    assert candidate_keys(SOLANA_TXID) == {"solana"}
+
+def test_ton_base64_is_converted_to_hex():
+    for encoded in (base64.b64encode(TON_BYTES).decode(), base64.urlsafe_b64encode(TON_BYTES).decode().rstrip("=")):
+        candidates = select_candidate_chains(encoded)
+        assert [(key, txid) for key, _, txid in candidates] == [("ton", TON_BYTES.hex())]
+
+def test_unknown_format_has_no_candidates():
+    assert select_candidate_chains("not-a-transaction-hash") == []